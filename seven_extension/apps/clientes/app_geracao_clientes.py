@@ -1,6 +1,7 @@
 import calendar
 import datetime
 import locale
+from collections import defaultdict
 from datetime import timedelta
 from time import sleep
 from urllib.parse import urljoin  # Importe a função urljoin
@@ -11,13 +12,16 @@ import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objs as go
-import pytz
 import requests
+from apps.clientes.jobs.cache_grafico import chave_grafico, dados_grafico
+from apps.clientes.jobs.retencao import usa_geracao_horaria
 from apps.clientes.methods import printl
 from apps.clientes.models import (
     Cliente,
     Geracao,
     GeracaoDiaria,
+    GeracaoHoraria,
+    GeracaoMensal,
     UsuarioCustomizado,
 )
 from dash import dcc, html
@@ -26,9 +30,12 @@ from dash.exceptions import PreventUpdate
 from dash_bootstrap_templates import load_figure_template
 from dash_dangerously_set_inner_html import DangerouslySetInnerHTML
 from django.contrib.sessions.models import Session
+from django.db.models import Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncYear
 from django.urls import reverse  # Importe a função reverse
 from django.utils.timezone import get_current_timezone, make_aware
 from django_plotly_dash import DjangoDash
+from scipy.interpolate import PchipInterpolator
 
 # Defina a configuração regional para 'pt_BR.UTF-8'
 locale.setlocale(locale.LC_ALL, 'pt_BR.UTF-8')
@@ -2140,6 +2147,380 @@ def update_day_selector(selected_month, selected_year):
         return []  # Retorna uma lista vazia se o mês ou ano não estiverem selecionados
 
 
+def monta_serie_dia(registros: list, grade: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Distribui as leituras de geração diária de um cliente na grade de horários do gráfico.
+
+    Parameters:
+        registros (list): Tuplas (timestamp, energystamp) obtidas com `values_list`.
+        grade (DatetimeIndex): Horários do gráfico, já no fuso de exibição.
+
+    Returns:
+        ndarray: A energia de cada horário da grade, com 0 onde não há leitura.
+    """
+    if not registros:
+        return np.zeros(len(grade))
+
+    valores = np.array(registros, dtype=object)
+    horarios = (
+        pd.to_datetime(valores[:, 0], utc=True)
+        .tz_convert(grade.tz)
+        .floor('s')
+    )
+    serie = pd.Series(valores[:, 1].astype(float), index=horarios)
+    # Em leituras repetidas no mesmo horário, prevalece a última
+    serie = serie[~serie.index.duplicated(keep='last')]
+
+    return serie.reindex(grade, fill_value=0).to_numpy()
+
+
+def prepara_geracao_dia(all_data: pd.DataFrame, intervalo: bool) -> pd.DataFrame:
+    """
+    Prepara as séries do gráfico diário para exibição usando operações vetorizadas.
+
+    Preenche com 0 as pontas sem geração de cada dia, trata como falha de leitura os
+    zeros isolados entre duas leituras, alinha todos os clientes na mesma grade de
+    horários e interpola os buracos internos com PCHIP.
+
+    Parameters:
+        all_data (DataFrame): Colunas 'Timestamp' (datetime), 'Energystamp' e 'Cliente', ordenadas por cliente e horário.
+        intervalo (bool): Indica se o gráfico cobre um intervalo do DatePickerRange.
+
+    Returns:
+        DataFrame: Colunas 'Timestamp' (texto), 'Energystamp', 'Cliente', 'Dia' e 'Hora'.
+    """
+    energia = all_data['Energystamp'].to_numpy(dtype=float, copy=True)
+
+    if intervalo:
+        # Substituir valores zero por NaN e voltar a 0 apenas antes da primeira
+        # e depois da última leitura de cada cliente e dia
+        energia[energia == 0] = np.nan
+        valido = pd.Series(~np.isnan(energia), index=all_data.index).astype(
+            np.int8
+        )
+        grupos = [all_data['Cliente'], all_data['Timestamp'].dt.date]
+        depois_primeiro = valido.groupby(grupos).cummax()
+        antes_ultimo = (
+            valido[::-1].groupby([g[::-1] for g in grupos]).cummax()[::-1]
+        )
+        dentro = (depois_primeiro.to_numpy() & antes_ultimo.to_numpy()).astype(
+            bool
+        )
+        energia[~dentro] = 0
+
+    # Zeros entre dois valores diferentes de 0 são tratados como falha de leitura
+    if len(energia) > 2:
+        zero_isolado = np.zeros(len(energia), dtype=bool)
+        zero_isolado[1:-1] = (
+            (energia[1:-1] == 0) & (energia[:-2] != 0) & (energia[2:] != 0)
+        )
+        energia[zero_isolado] = np.nan
+
+    # Alinha todos os clientes na mesma grade de horários (NaN onde não há leitura)
+    serie = (
+        all_data.assign(Energystamp=energia)
+        .groupby(['Cliente', 'Timestamp'])['Energystamp']
+        .sum(min_count=1)
+    )
+    clientes = serie.index.unique(level='Cliente')
+    horarios = serie.index.unique(level='Timestamp').sort_values()
+    grade = pd.MultiIndex.from_product(
+        [clientes, horarios], names=['Cliente', 'Timestamp']
+    )
+    matriz = (
+        serie.reindex(grade)
+        .to_numpy(dtype=float)
+        .reshape(len(clientes), len(horarios))
+    )
+
+    # Aplicar a interpolação PCHIP apenas aos buracos entre valores não nulos
+    for linha in matriz:
+        pontos = np.flatnonzero(~np.isnan(linha))
+        if len(pontos) < 2:
+            continue
+        buracos = np.flatnonzero(np.isnan(linha))
+        buracos = buracos[(buracos > pontos[0]) & (buracos < pontos[-1])]
+        if len(buracos):
+            linha[buracos] = PchipInterpolator(pontos, linha[pontos])(buracos)
+
+    horario = grade.get_level_values('Timestamp')
+    return pd.DataFrame(
+        {
+            'Timestamp': horario.strftime(
+                '%d/%m/%y %H:%M' if intervalo else '%H:%M'
+            ),
+            'Energystamp': matriz.ravel(),
+            'Cliente': grade.get_level_values('Cliente'),
+            'Dia': horario.date,
+            'Hora': horario.strftime('%H:%M'),
+        }
+    )
+
+
+def monta_dados_grafico(
+    selected_clients,
+    selected_time_range,
+    selected_day,
+    selected_month,
+    selected_year,
+    date_picker_start_date,
+    date_picker_end_date,
+):
+    """
+    Consulta e prepara os dados do gráfico de geração de energia.
+
+    Parameters:
+        selected_clients (list): Lista de IDs de clientes selecionados.
+        selected_time_range (str): O modo do gráfico ('day', 'month', 'year' ou 'total').
+        selected_day (int): Dia selecionado no seletor de dia.
+        selected_month (int): Mês selecionado no seletor de mês.
+        selected_year (int): Ano selecionado no seletor de ano.
+        date_picker_start_date (datetime): Data de início selecionada no DatePickerRange.
+        date_picker_end_date (datetime): Data de término selecionada no DatePickerRange.
+
+    Returns:
+        tuple: O DataFrame do gráfico, o título do eixo x e o início e fim do período diário.
+    """
+    # Recupere os dados de geração de energia dos clientes selecionados
+    data = []
+
+    # Crie uma lista vazia para armazenar os DataFrames
+    data_frames = []
+
+    # Crie um DataFrame vazio para armazenar todos os dados
+    all_data = pd.DataFrame(columns=['Timestamp', 'Energystamp', 'Cliente'])
+
+    st_date = ''
+    ed_date = ''
+
+    # Uma única consulta para os clientes e outra para a geração de todo o período
+    clientes_selecionados = list(
+        Cliente.objects.filter(id__in=selected_clients).select_related(
+            'inverter'
+        )
+    )
+    nomes_clientes = {
+        cliente.id: cliente.plant_name for cliente in clientes_selecionados
+    }
+
+    if selected_time_range in ['total', 'year'] and not (
+        date_picker_start_date and date_picker_end_date
+    ):
+        # Sem intervalo personalizado, os totais vêm do consolidado mensal
+        geracao = GeracaoMensal.objects.filter(
+            cliente_id__in=selected_clients
+        )
+
+        if selected_time_range == 'total':
+            geracao = (
+                geracao.values('cliente_id', 'ano')
+                .annotate(energia=Sum('energia'))
+                .order_by()
+            )
+            xaxis_title = 'Year'
+        else:
+            geracao = geracao.filter(ano=selected_year).values(
+                'cliente_id', 'ano', 'mes', 'energia'
+            )
+            xaxis_title = str(selected_year)
+
+        all_data = pd.DataFrame.from_records(
+            geracao, columns=['cliente_id', 'ano', 'mes', 'energia']
+        )
+        all_data = pd.DataFrame(
+            {
+                'Timestamp': pd.to_datetime(
+                    pd.DataFrame(
+                        {
+                            'year': all_data['ano'],
+                            'month': all_data['mes'].fillna(1).astype(int),
+                            'day': 1,
+                        }
+                    )
+                ),
+                'Energystamp': all_data['energia'] / 1000,
+                'Cliente': all_data['cliente_id'].map(nomes_clientes),
+            }
+        )
+
+    elif selected_time_range in ['total', 'year', 'month']:
+        geracao = Geracao.objects.filter(cliente_id__in=selected_clients)
+
+        if selected_time_range == 'total':
+            # Filtre os dados com base nas datas de início e fim selecionadas pelo DatePickerRange
+            geracao = geracao.filter(
+                timestamp__gte=date_picker_start_date,
+                timestamp__lte=date_picker_end_date,
+            )
+            xaxis_title = 'Year'
+            periodo = TruncYear('timestamp')
+        elif selected_time_range == 'year':
+            # Filtre os dados com base nas datas de início e fim selecionadas pelo DatePickerRange
+            geracao = geracao.filter(
+                timestamp__gte=date_picker_start_date,
+                timestamp__lte=date_picker_end_date,
+            )
+            xaxis_title = str(date_picker_start_date.year)
+            periodo = TruncMonth('timestamp')
+        else:
+            if date_picker_start_date and date_picker_end_date:
+                # Filtre os dados com base nas datas de início e fim selecionadas pelo DatePickerRange
+                geracao = geracao.filter(
+                    timestamp__date__gte=date_picker_start_date.date(),
+                    timestamp__date__lte=date_picker_end_date.date(),
+                )
+                xaxis_title = f'{calendar.month_name[date_picker_start_date.month]} {date_picker_start_date.day}, {date_picker_start_date.year} - {calendar.month_name[date_picker_end_date.month]} {date_picker_end_date.day}, {date_picker_end_date.year}'
+            else:
+                geracao = geracao.filter(
+                    timestamp__year=selected_year,
+                    timestamp__month=selected_month,
+                )
+                xaxis_title = (
+                    f'{calendar.month_name[selected_month]} {selected_year}'
+                )
+            periodo = TruncDay('timestamp')
+
+        # Agregue a geração por cliente e período no próprio banco
+        geracao = (
+            geracao.annotate(periodo=periodo)
+            .values('cliente_id', 'periodo')
+            .annotate(energia=Sum('energystamp'))
+            .order_by()
+        )
+
+        all_data = pd.DataFrame.from_records(
+            geracao, columns=['cliente_id', 'periodo', 'energia']
+        )
+        all_data = pd.DataFrame(
+            {
+                'Timestamp': pd.to_datetime(
+                    all_data['periodo'], utc=True
+                ).dt.tz_convert(get_current_timezone()),
+                'Energystamp': all_data['energia'] / 1000,
+                'Cliente': all_data['cliente_id'].map(nomes_clientes),
+            }
+        )
+
+    else:
+
+        # Obtenha o fuso horário atualmente configurado no Django
+        current_timezone = get_current_timezone()
+
+        if date_picker_start_date and date_picker_end_date:
+
+            st_date = make_aware(
+                date_picker_start_date, timezone=current_timezone
+            )
+            ed_date = make_aware(
+                date_picker_end_date, timezone=current_timezone
+            )
+            xaxis_title = f'{date_picker_start_date.day} de {calendar.month_name[date_picker_start_date.month]}, {date_picker_start_date.year} - {date_picker_end_date.day} de {calendar.month_name[date_picker_end_date.month]}, {date_picker_end_date.year}'
+
+        else:
+            start_date = datetime.datetime(
+                selected_year, selected_month, selected_day, 0, 0, 0
+            )
+            # Converta o objeto selected_day em um objeto com informações de fuso horário
+            start_date = make_aware(start_date, timezone=current_timezone)
+            end_date = start_date + timedelta(days=1)
+            st_date = start_date
+            ed_date = end_date
+            xaxis_title = f'{start_date.day} de {calendar.month_name[start_date.month]}, {start_date.year}'
+
+        # Períodos antigos são lidos da geração agregada por hora
+        horaria = usa_geracao_horaria(st_date)
+        if horaria:
+            leituras = GeracaoHoraria.objects.filter(
+                cliente_id__in=selected_clients,
+                timestamp__gte=st_date,
+                timestamp__lt=ed_date,
+            ).values_list('cliente_id', 'timestamp', 'energia')
+        else:
+            leituras = GeracaoDiaria.objects.filter(
+                cliente_id__in=selected_clients,
+                timestamp__gte=st_date,
+                timestamp__lt=ed_date,
+            ).values_list('cliente_id', 'timestamp', 'energystamp')
+
+        # Separe as leituras de todo o período por cliente
+        registros_por_cliente = defaultdict(list)
+        for cliente_id, timestamp, energystamp in leituras:
+            registros_por_cliente[cliente_id].append((timestamp, energystamp))
+
+        for cliente in clientes_selecionados:
+            if horaria:
+                intervalo = pd.Timedelta(hours=1)
+            elif cliente.inverter.name not in [
+                'abb_fimer',
+                'sungrow',
+                'ecosolys',
+            ]:
+                intervalo = pd.Timedelta(minutes=5)
+            else:
+                intervalo = pd.Timedelta(minutes=15)
+
+            # Gere os timestamps até o último horário do dia desejado
+            timestamps = pd.date_range(
+                start=st_date,
+                end=pd.to_datetime(ed_date) - intervalo,
+                freq=intervalo,
+            )
+
+            # Converta os timestamps para o fuso horário desejado
+            timestamps = timestamps.tz_convert('America/Sao_Paulo')
+
+            data_frames.append(
+                pd.DataFrame(
+                    {
+                        'Timestamp': timestamps,
+                        'Energystamp': monta_serie_dia(
+                            registros_por_cliente[cliente.id], timestamps
+                        ),
+                        'Cliente': cliente.plant_name,
+                    }
+                )
+            )
+
+        # Concatene todos os DataFrames na lista data_frames
+        all_data = pd.concat(data_frames)
+
+    # Ordene os pontos de cada cliente pela coluna 'Timestamp'
+    all_data = all_data.sort_values(['Cliente', 'Timestamp']).reset_index(
+        drop=True
+    )
+
+    # # Defina display.max_rows como None para mostrar todas as linhas
+    # pd.set_option('display.max_rows', None)
+
+    # # Imprima o DataFrame completo
+    # print(all_data)
+
+    # # Restaure o valor padrão de display.max_rows
+    # pd.reset_option('display.max_rows')
+
+    if selected_time_range == 'total':
+        # Obtenha os anos com base nos valores da coluna 'Timestamp'
+        all_data['Timestamp'] = all_data['Timestamp'].dt.year
+    elif selected_time_range == 'year':
+        # Obtenha os nomes abreviados dos meses com base nos valores da coluna 'Timestamp'
+        all_data['Timestamp'] = all_data['Timestamp'].dt.strftime('%b %y')
+    elif selected_time_range == 'month':
+        if date_picker_start_date and date_picker_end_date:
+            # Obtenha os dias com base nos valores da coluna 'Timestamp'
+            all_data['Timestamp'] = all_data['Timestamp'].dt.strftime(
+                '%d/%m/%y'
+            )
+        else:
+            all_data['Timestamp'] = all_data['Timestamp'].dt.strftime('%d')
+
+    if selected_time_range == 'day' and (ed_date - st_date).days <= 4:
+        all_data = prepara_geracao_dia(
+            all_data, bool(date_picker_start_date and date_picker_end_date)
+        )
+
+    return all_data, xaxis_title, st_date, ed_date
+
+
 @app.callback(
     Output('energy-generation-graph', 'figure'),
     [
@@ -2235,18 +2616,6 @@ def update_graph(
     ):
         selected_time_range = 'day'
 
-    # Recupere os dados de geração de energia dos clientes selecionados
-    data = []
-
-    # Crie uma lista vazia para armazenar os DataFrames
-    data_frames = []
-
-    # Crie um DataFrame vazio para armazenar todos os dados
-    all_data = pd.DataFrame(columns=['Timestamp', 'Energystamp', 'Cliente'])
-
-    st_date = ''
-    ed_date = ''
-
     user_type = user_type_store_data['user_type']
     client_id = user_type_store_data['client_id']
     if client_id:
@@ -2287,254 +2656,29 @@ def update_graph(
     # headers = {'X-CSRFToken': csrftoken}
     # response = client.post(url_django, headers=headers, data={'cliente': selected_clients})
 
-    for client_id in selected_clients:
-        cliente = Cliente.objects.get(id=client_id)
-        plant_name = cliente.plant_name
-        # print('client id', client_id)
-        if selected_time_range == 'total':
-            if date_picker_start_date and date_picker_end_date:
-                # Filtre os dados com base nas datas de início e fim selecionadas pelo DatePickerRange
-                geracao = Geracao.objects.filter(
-                    cliente__id=client_id,
-                    timestamp__gte=date_picker_start_date,
-                    timestamp__lte=date_picker_end_date,
-                )
-                xaxis_title = 'Year'
-            else:
-                geracao = Geracao.objects.filter(
-                    cliente__id=client_id,
-                )
-                xaxis_title = 'Year'
-            timestamps = [entry.timestamp.year for entry in geracao]
-        elif selected_time_range == 'year':
-            if date_picker_start_date and date_picker_end_date:
-                # Filtre os dados com base nas datas de início e fim selecionadas pelo DatePickerRange
-                geracao = Geracao.objects.filter(
-                    cliente__id=client_id,
-                    timestamp__gte=date_picker_start_date,
-                    timestamp__lte=date_picker_end_date,
-                ).order_by('timestamp__month')
-                xaxis_title = str(date_picker_start_date.year)
-            else:
-                geracao = Geracao.objects.filter(
-                    cliente__id=client_id,
-                    timestamp__year=selected_year,
-                ).order_by('timestamp__month')
-                xaxis_title = str(selected_year)
-            timestamps = [
-                entry.timestamp.strftime('%b %y') for entry in geracao
-            ]
-        elif selected_time_range == 'month':
-            if date_picker_start_date and date_picker_end_date:
-                # Filtre os dados com base nas datas de início e fim selecionadas pelo DatePickerRange
-                current_date = date_picker_start_date
-                all_geracao = []
-                while current_date <= date_picker_end_date:
-                    geracao = Geracao.objects.filter(
-                        cliente__id=client_id,
-                        timestamp__date=current_date.date(),  # Filtra apenas por data, ignorando a hora
-                    )
-                    all_geracao.extend(list(geracao))
-                    current_date += timedelta(days=1)
-
-                # Concatene os resultados em um único DataFrame
-                geracao = all_geracao
-
-                xaxis_title = f'{calendar.month_name[date_picker_start_date.month]} {date_picker_start_date.day}, {date_picker_start_date.year} - {calendar.month_name[date_picker_end_date.month]} {date_picker_end_date.day}, {date_picker_end_date.year}'
-            else:
-                geracao = Geracao.objects.filter(
-                    cliente__id=client_id,
-                    timestamp__year=selected_year,
-                    timestamp__month=selected_month,
-                )
-
-                xaxis_title = (
-                    f'{calendar.month_name[selected_month]} {selected_year}'
-                )
-
-            timestamps = [
-                entry.timestamp.strftime('%d/%m/%y') for entry in geracao
-            ]
-
-        else:
-
-            # Obtenha o fuso horário atualmente configurado no Django
-            current_timezone = get_current_timezone()
-
-            if date_picker_start_date and date_picker_end_date:
-
-                st_date = make_aware(
-                    date_picker_start_date, timezone=current_timezone
-                )
-                ed_date = make_aware(
-                    date_picker_end_date, timezone=current_timezone
-                )
-
-                # Filtre os dados com base nas datas de início e fim selecionadas pelo DatePickerRange
-                current_date = date_picker_start_date
-                all_geracao = []
-                while current_date <= date_picker_end_date:
-                    current_end_date = current_date + timedelta(days=1)
-                    geracao_dia = GeracaoDiaria.objects.filter(
-                        cliente__id=client_id,
-                        timestamp__gte=current_date,
-                        timestamp__lt=current_end_date,
-                    )
-                    all_geracao.extend(list(geracao_dia))
-                    current_date += timedelta(days=1)
-
-                # Concatene os resultados em um único DataFrame
-                geracao_dia = all_geracao
-                xaxis_title = f'{date_picker_start_date.day} de {calendar.month_name[date_picker_start_date.month]}, {date_picker_start_date.year} - {date_picker_end_date.day} de {calendar.month_name[date_picker_end_date.month]}, {date_picker_end_date.year}'
-
-            else:
-                start_date = datetime.datetime(
-                    selected_year, selected_month, selected_day, 0, 0, 0
-                )
-                # Converta o objeto selected_day em um objeto com informações de fuso horário
-                start_date = make_aware(start_date, timezone=current_timezone)
-                end_date = start_date + timedelta(days=1)
-                st_date = start_date
-                ed_date = end_date
-                geracao_dia = GeracaoDiaria.objects.filter(
-                    cliente__id=client_id,
-                    timestamp__gte=start_date,
-                    timestamp__lt=end_date,
-                )
-                xaxis_title = f'{start_date.day} de {calendar.month_name[start_date.month]}, {start_date.year}'
-
-            if cliente.inverter.name not in [
-                'abb_fimer',
-                'sungrow',
-                'ecosolys',
-            ]:
-                # Ajuste a data de fim para ser o último horário do dia desejado
-                ed_date = pd.to_datetime(ed_date) - pd.Timedelta(minutes=5)
-                # Gere os timestamps
-                timestamps = pd.date_range(
-                    start=st_date, end=ed_date, freq='5min'
-                )
-            else:
-                # Ajuste a data de fim para ser o último horário do dia desejado
-                ed_date = pd.to_datetime(ed_date) - pd.Timedelta(minutes=15)
-                # Gere os timestamps
-                timestamps = pd.date_range(
-                    start=st_date, end=ed_date, freq='15min'
-                )
-
-            # Converta os timestamps para o fuso horário desejado
-            timestamps = timestamps.tz_convert('America/Sao_Paulo')
-            # Converta os timestamps em strings
-            timestamps = timestamps.strftime('%d/%m/%y %H:%M:%S').tolist()
-
-            data = {}
-            for entry in geracao_dia:
-                # Converta o objeto de data e hora com informações de fuso horário para o fuso horário desejado
-                timestamp = entry.timestamp.astimezone(
-                    pytz.timezone('America/Sao_Paulo')
-                )
-                # Converta o objeto de data e hora com informações de fuso horário em uma string
-                timestamp = timestamp.strftime('%d/%m/%y %H:%M:%S')
-                data[timestamp] = entry.energystamp
-
-            geracao = []
-            for ts in timestamps:
-                energia = data.get(ts, 0)
-                geracao.append(
-                    {
-                        'Timestamp': ts,
-                        'Energystamp': energia,
-                        'Cliente': plant_name,
-                    }
-                )
-
-        if selected_time_range == 'day':
-            energystamps = [entry['Energystamp'] for entry in geracao]
-        else:
-            energystamps = [entry.energystamp / 1000 for entry in geracao]
-
-        df = pd.DataFrame(
-            {'Timestamp': timestamps, 'Energystamp': energystamps}
-        )
-
-        df = df.groupby('Timestamp', as_index=False).agg(
-            {'Energystamp': 'sum'}
-        )
-
-        # Adicione uma coluna 'Cliente' ao DataFrame
-        df['Cliente'] = plant_name
-
-        # # Transformar valores zerados em NaN
-        # df['Energystamp'] = df['Energystamp'].replace(0, np.nan)
-
-        # Adicione o DataFrame à lista data_frames
-        data_frames.append(df)
-
-    # Concatene todos os DataFrames na lista data_frames
-    all_data = pd.concat(data_frames)
-
-    if selected_time_range == 'total':
-        # Converta a coluna 'Timestamp' para o tipo de dados datetime
-        all_data['Timestamp'] = pd.to_datetime(
-            all_data['Timestamp'], format='%Y'
-        )
-    elif selected_time_range == 'year':
-        # Converta a coluna 'Timestamp' para o tipo de dados datetime
-        all_data['Timestamp'] = pd.to_datetime(
-            all_data['Timestamp'], format='%b %y'
-        )
-    elif selected_time_range == 'month':
-        # Converta a coluna 'Timestamp' para o tipo de dados datetime
-        all_data['Timestamp'] = pd.to_datetime(
-            all_data['Timestamp'], format='%d/%m/%y'
-        )
-    else:
-        # Converta a coluna 'Timestamp' para o tipo de dados datetime
-        all_data['Timestamp'] = pd.to_datetime(
-            all_data['Timestamp'], format='%d/%m/%y %H:%M:%S'
-        )
-
-    # Ordene o DataFrame pela coluna 'Timestamp'
-    all_data = all_data.sort_values(['Cliente', 'Timestamp'])
-
-    # Ordenar os pontos dentro de cada cliente
-    all_data = (
-        all_data.groupby('Cliente')
-        .apply(lambda x: x.sort_values('Timestamp'))
-        .reset_index(drop=True)
+    # Os dados só dependem dos clientes, do período e das leituras gravadas; tema e
+    # tamanho da tela apenas reestilizam os dados em cache
+    chave = chave_grafico(
+        selected_clients,
+        selected_time_range,
+        selected_day,
+        selected_month,
+        selected_year,
+        date_picker_start_date,
+        date_picker_end_date,
+    )
+    all_data, xaxis_title, st_date, ed_date = dados_grafico(
+        chave,
+        lambda: monta_dados_grafico(
+            selected_clients,
+            selected_time_range,
+            selected_day,
+            selected_month,
+            selected_year,
+            date_picker_start_date,
+            date_picker_end_date,
+        ),
     )
-
-    # # Defina display.max_rows como None para mostrar todas as linhas
-    # pd.set_option('display.max_rows', None)
-
-    # # Imprima o DataFrame completo
-    # print(all_data)
-
-    # # Restaure o valor padrão de display.max_rows
-    # pd.reset_option('display.max_rows')
-
-    if selected_time_range == 'total':
-        # Obtenha os anos com base nos valores da coluna 'Timestamp'
-        all_data['Timestamp'] = all_data['Timestamp'].dt.year
-    elif selected_time_range == 'year':
-        # Obtenha os nomes abreviados dos meses com base nos valores da coluna 'Timestamp'
-        all_data['Timestamp'] = all_data['Timestamp'].dt.strftime('%b %y')
-    elif selected_time_range == 'month':
-        if date_picker_start_date and date_picker_end_date:
-            # Obtenha os dias com base nos valores da coluna 'Timestamp'
-            all_data['Timestamp'] = all_data['Timestamp'].dt.strftime(
-                '%d/%m/%y'
-            )
-        else:
-            all_data['Timestamp'] = all_data['Timestamp'].dt.strftime('%d')
-    else:
-        if date_picker_start_date and date_picker_end_date:
-            # Obtenha os horários com base nos valores da coluna 'Timestamp'
-            all_data['Timestamp'] = all_data['Timestamp'].dt.strftime(
-                '%d/%m/%y %H:%M'
-            )
-        else:
-            all_data['Timestamp'] = all_data['Timestamp'].dt.strftime('%H:%M')
 
     # Carregue os templates
     template = ['bootstrap', 'superhero']
@@ -2556,47 +2700,7 @@ def update_graph(
 
     if selected_time_range == 'day':
 
-        dias_diferenca = (ed_date + pd.DateOffset(minutes=5) - st_date).days
-        if (
-            date_picker_start_date
-            and date_picker_end_date
-            and (dias_diferenca < 5)
-        ):
-
-            all_data = all_data.reset_index(drop=True)
-            # Substituir valores zero por NaN apenas nos pontos em que não há energia
-            all_data.loc[all_data['Energystamp'] == 0, 'Energystamp'] = np.nan
-
-            # Adicione uma coluna com o dia para cada linha
-            all_data['Dia'] = pd.to_datetime(
-                all_data['Timestamp'], format='%d/%m/%y %H:%M'
-            ).dt.date
-
-            all_data['Hora'] = all_data['Timestamp'].str.slice(start=-5)
-
-            # Encontre o primeiro e o último índice não nulo para cada cliente e dia
-            first_valid = all_data.groupby(['Cliente', 'Dia'])[
-                'Energystamp'
-            ].transform(lambda x: x.notnull().idxmax())
-            last_valid = all_data.groupby(['Cliente', 'Dia'])[
-                'Energystamp'
-            ].transform(
-                lambda x: x.size - x.iloc[::-1].notnull().values.argmax() - 1
-            )
-
-            # Preencha os valores NaN antes do primeiro índice não nulo e depois do último índice não nulo com 0
-            all_data['Energystamp'] = all_data.apply(
-                lambda x: 0
-                if (
-                    np.isnan(x['Energystamp'])
-                    and (
-                        x.name < first_valid.loc[x.name]
-                        or x.name > last_valid.loc[x.name]
-                    )
-                )
-                else x['Energystamp'],
-                axis=1,
-            )
+        dias_diferenca = (ed_date - st_date).days
 
         if dias_diferenca > 4:
             if width < 886:
@@ -2631,83 +2735,6 @@ def update_graph(
             # TODO: Os dticks precisam de mais ajuste fino
         else:
 
-            def remove_zero_between_values(df):
-                # Percorre o DataFrame
-                for i in range(1, len(df) - 1):
-                    # Verifica se o valor atual é 0.0 e se os valores anterior e próximo são diferentes de 0.0
-                    if (
-                        df['Energystamp'].iloc[i] == 0.0
-                        and df['Energystamp'].iloc[i - 1] != 0.0
-                        and df['Energystamp'].iloc[i + 1] != 0.0
-                    ):
-                        # Se sim, substitui o valor por NaN
-                        df.loc[i, 'Energystamp'] = np.nan
-
-                return df
-
-            all_data = remove_zero_between_values(all_data)
-
-            # Encontra todos os timestamps únicos em todo o conjunto de dados
-            timestamps_unicos = pd.DataFrame(
-                all_data['Timestamp'].unique(), columns=['Timestamp']
-            )
-
-            # Inicializa um novo DataFrame vazio para armazenar os dados reindexados
-            all_data_reindexado = pd.DataFrame()
-
-            # Para cada cliente, cria um novo DataFrame que contém todos os timestamps únicos
-            for cliente in all_data['Cliente'].unique():
-                # Filtra os dados para o cliente atual
-                dados_cliente = all_data[all_data['Cliente'] == cliente]
-
-                # Cria um novo DataFrame que contém todos os timestamps únicos
-                dados_cliente_reindexado = timestamps_unicos.copy()
-
-                # Adiciona uma coluna para 'Cliente'
-                dados_cliente_reindexado['Cliente'] = cliente
-
-                # Combina o novo DataFrame com os dados originais do cliente
-                dados_cliente_reindexado = pd.merge(
-                    dados_cliente_reindexado,
-                    dados_cliente,
-                    on=['Timestamp', 'Cliente'],
-                    how='outer',
-                )
-
-                # Adiciona os dados reindexados do cliente ao DataFrame reindexado
-                all_data_reindexado = pd.concat(
-                    [all_data_reindexado, dados_cliente_reindexado]
-                )
-
-            # Agora, 'all_data_reindexado' é um DataFrame que contém todos os timestamps únicos para cada cliente,
-            # e os valores de 'Energystamp' para os timestamps que não existiam originalmente para um cliente são preenchidos com NaN.
-
-            all_data = all_data_reindexado
-
-            # Ordena o DataFrame por 'Cliente' e 'Timestamp'
-            all_data.sort_values(by=['Cliente', 'Timestamp'], inplace=True)
-
-            # Redefine o índice do DataFrame
-            all_data.reset_index(drop=True, inplace=True)
-
-            # # Defina display.max_rows como None para mostrar todas as linhas
-            # pd.set_option('display.max_rows', None)
-
-            # # Imprima o DataFrame completo
-            # printl(all_data)
-
-            # # Restaure o valor padrão de display.max_rows
-            # pd.reset_option('display.max_rows')
-            # printl('>>>>>>>>>>> DATAFRAME', all_data)
-            # Aplicar a interpolação cúbica apenas aos valores não nulos
-            all_data['Energystamp'] = all_data.groupby('Cliente')[
-                'Energystamp'
-            ].transform(
-                lambda x: x.interpolate(
-                    method='pchip', limit_direction='both', limit_area='inside'
-                )
-            )
-
             fig = px.line(
                 all_data,
                 x='Timestamp',
@@ -2747,35 +2774,31 @@ def update_graph(
                     color = 'rgba(0, 0, 0, 0.8)'
                     font = dict(color='rgba(0,0,0,0.8)', size=12)
 
+                energia_min = all_data['Energystamp'].min()
+                energia_max = all_data['Energystamp'].max()
+                dias = all_data['Dia'].to_numpy()
+
                 # Adiciona as linhas em forma de tracejado e os textos dos dias
-                for i in range(len(all_data) - 1):
-                    current_date = all_data.loc[i, 'Dia']
-                    next_date = all_data.loc[i + 1, 'Dia']
-                    if current_date != next_date:
-                        fig.add_shape(
-                            type='line',
-                            x0=all_data.loc[i, 'Timestamp'],
-                            y0=min(all_data['Energystamp']),
-                            x1=all_data.loc[i, 'Timestamp'],
-                            y1=max(all_data['Energystamp']),
-                            line=dict(
-                                color=color,  # Definindo a cor com opacidade
-                                width=1,
-                                dash='dot',  # Definindo o estilo tracejado da linha
-                            ),
-                        )
-                        fig.add_annotation(
-                            x=all_data.loc[i, 'Timestamp'],
-                            y=min(all_data['Energystamp'])
-                            - 0.03
-                            * (
-                                max(all_data['Energystamp'])
-                                - min(all_data['Energystamp'])
-                            ),
-                            text=next_date.strftime('%d/%m/%y'),
-                            showarrow=False,
-                            font=font,
-                        )
+                for i in np.flatnonzero(dias[:-1] != dias[1:]):
+                    fig.add_shape(
+                        type='line',
+                        x0=all_data.loc[i, 'Timestamp'],
+                        y0=energia_min,
+                        x1=all_data.loc[i, 'Timestamp'],
+                        y1=energia_max,
+                        line=dict(
+                            color=color,  # Definindo a cor com opacidade
+                            width=1,
+                            dash='dot',  # Definindo o estilo tracejado da linha
+                        ),
+                    )
+                    fig.add_annotation(
+                        x=all_data.loc[i, 'Timestamp'],
+                        y=energia_min - 0.03 * (energia_max - energia_min),
+                        text=dias[i + 1].strftime('%d/%m/%y'),
+                        showarrow=False,
+                        font=font,
+                    )
 
                 fig.update_xaxes(
                     tickmode='array',
@@ -0,0 +1,231 @@
+import json
+import threading
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from apps.clientes.jobs import http_session
+from apps.clientes.jobs.get_inversor_energy import SungrowScraper
+from requests.adapters import HTTPAdapter
+
+# Respostas gravadas dos portais, uma por inversor
+RESPOSTAS_DIR = Path(__file__).resolve().parent / 'respostas'
+
+
+def carrega_resposta(inversor: str) -> dict:
+    """
+    Carrega a resposta gravada de um inversor.
+
+    Args:
+        inversor (str): O nome do inversor (nome do arquivo em `respostas/`).
+
+    Returns:
+        dict: A data em que a resposta foi gravada ('data_gravada') e o corpo da resposta ('resposta').
+    """
+    with open(RESPOSTAS_DIR / f'{inversor}.json', encoding='utf-8') as arquivo:
+        return json.load(arquivo)
+
+
+def _dia_growatt(query: dict, corpo: bytes) -> date:
+    return datetime.strptime(
+        parse_qs(corpo.decode())['date'][0], '%Y-%m-%d'
+    ).date()
+
+
+def _dia_sungrow(query: dict, corpo: bytes) -> date:
+    return datetime.strptime(json.loads(corpo)['date_id'], '%Y%m%d').date()
+
+
+def _dia_abb_fimer(query: dict, corpo: bytes) -> date:
+    return datetime.strptime(query['sdt'][0][:10], '%Y-%m-%d').date()
+
+
+def _dia_refusol(query: dict, corpo: bytes) -> date:
+    corpo = json.loads(corpo)
+    return date(corpo['year'], corpo['month'], corpo['day'])
+
+
+def _ajusta_texto(resposta, gravada: date, dia: date):
+    """
+    Troca a data gravada pela data pedida nos formatos usados pelos portais.
+
+    Args:
+        resposta: O corpo da resposta gravada.
+        gravada (date): A data em que a resposta foi gravada.
+        dia (date): A data pedida na requisição.
+
+    Returns:
+        O corpo da resposta com as datas ajustadas.
+    """
+    texto = json.dumps(resposta)
+    for formato in ('%Y-%m-%d', '%Y%m%d'):
+        texto = texto.replace(gravada.strftime(formato), dia.strftime(formato))
+    return json.loads(texto)
+
+
+def _ajusta_refusol(resposta: dict, gravada: date, dia: date) -> dict:
+    for canal in resposta['d']:
+        for item in canal['ChartData']:
+            item['DateTime'].update(
+                {'Year': dia.year, 'Month': dia.month, 'Day': dia.day}
+            )
+    return resposta
+
+
+# Rotas atendidas pelo servidor: final do caminho -> (inversor, leitura do dia pedido, ajuste da resposta)
+ROTAS = {
+    '/indexbC/inv/getInvEnergyDayChart': (
+        'growatt',
+        _dia_growatt,
+        _ajusta_texto,
+    ),
+    '/v1/powerStationService/getHouseholdStoragePsReport': (
+        'sungrow',
+        _dia_sungrow,
+        _ajusta_texto,
+    ),
+    '/power/GenerationPower': ('abb_fimer', _dia_abb_fimer, _ajusta_texto),
+    '/Ajax/StatisticsWebService.aspx/GetDataForChannels': (
+        'refusol',
+        _dia_refusol,
+        _ajusta_refusol,
+    ),
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Responde às requisições redirecionadas com as respostas gravadas.
+
+    O caminho recebido é `/<host original><caminho original>`, montado por `AdaptadorStub`.
+    """
+
+    def _responde(self):
+        partes = urlsplit(self.path)
+        tamanho = int(self.headers.get('Content-Length') or 0)
+        corpo = self.rfile.read(tamanho) if tamanho else b''
+
+        for rota, (inversor, le_dia, ajusta) in ROTAS.items():
+            if partes.path.endswith(rota):
+                break
+        else:
+            self.send_error(404, f'Rota sem resposta gravada: {partes.path}')
+            return
+
+        gravada = self.server.respostas[inversor]
+        dia = le_dia(parse_qs(partes.query), corpo)
+        resposta = ajusta(
+            json.loads(json.dumps(gravada['resposta'])),
+            date.fromisoformat(gravada['data_gravada']),
+            dia,
+        )
+
+        conteudo = json.dumps(resposta).encode()
+        with self.server.trava:
+            self.server.requisicoes += 1
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(conteudo)))
+        self.end_headers()
+        self.wfile.write(conteudo)
+
+    do_GET = _responde
+    do_POST = _responde
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AdaptadorStub(HTTPAdapter):
+    """
+    Adaptador HTTP que envia para o servidor local as requisições feitas aos portais.
+
+    Attributes:
+        url (str): A URL base do servidor local.
+    """
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+
+    def send(self, request, **kwargs):
+        """
+        Reescreve a URL da requisição para o servidor local e a envia.
+
+        Args:
+            request (requests.PreparedRequest): A requisição preparada pela sessão.
+            **kwargs: Argumentos repassados para `HTTPAdapter.send`.
+
+        Returns:
+            requests.Response: A resposta do servidor local.
+        """
+        partes = urlsplit(request.url)
+        request.url = f'{self.url}/{partes.netloc}{partes.path}'
+        if partes.query:
+            request.url += f'?{partes.query}'
+        return super().send(request, **kwargs)
+
+
+class SungrowScraperStub(SungrowScraper):
+    """
+    Scraper da Sungrow que envia o JSON sem criptografia para o servidor local.
+
+    As respostas do portal são cifradas com uma chave aleatória que só o portal
+    consegue ler, então não podem ser gravadas e reproduzidas como estão.
+    """
+
+    def post(
+        self, relativeUrl: str, jsn: 'dict|None' = None, isFormData=False
+    ):
+        resp = self.session.post(
+            f'{self.gatewayUrl}{relativeUrl}', json=jsn or {}
+        )
+        return resp.text
+
+
+class ServidorStub:
+    """
+    Servidor HTTP local que reproduz as respostas gravadas dos portais.
+
+    Enquanto o contexto estiver aberto, toda sessão criada por `nova_sessao` é
+    redirecionada para este servidor.
+
+    Attributes:
+        url (str): A URL base do servidor local.
+        requisicoes (int): A quantidade de requisições atendidas.
+
+    Exemplo:
+        >>> with ServidorStub(['growatt']) as stub:
+        ...     atualiza_geracao_diaria_growatt(data)
+        >>> stub.requisicoes
+    """
+
+    def __init__(self, inversores: list):
+        self._servidor = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._servidor.daemon_threads = True
+        self._servidor.respostas = {
+            inversor: carrega_resposta(inversor) for inversor in inversores
+        }
+        self._servidor.requisicoes = 0
+        self._servidor.trava = threading.Lock()
+        self.url = f'http://127.0.0.1:{self._servidor.server_port}'
+        self._adaptador_original = None
+
+    @property
+    def requisicoes(self) -> int:
+        return self._servidor.requisicoes
+
+    def __enter__(self):
+        threading.Thread(
+            target=self._servidor.serve_forever, daemon=True
+        ).start()
+        self._adaptador_original = http_session._adaptador
+        http_session._adaptador = AdaptadorStub(self.url)
+        return self
+
+    def __exit__(self, *exc):
+        http_session._adaptador = self._adaptador_original
+        self._servidor.shutdown()
+        self._servidor.server_close()
@@ -0,0 +1,280 @@
+import os
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from apps.clientes.models import Geracao, GeracaoDiaria, Inversor
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
+from django.db.models import Min
+from django.utils import timezone
+
+# Tabelas arquivadas: nome do diretório -> modelo
+TABELAS = {
+    'geracao': Geracao,
+    'geracao_diaria': GeracaoDiaria,
+}
+
+ESQUEMA = pa.schema(
+    [
+        ('cliente_id', pa.int64()),
+        ('timestamp', pa.timestamp('us', tz='UTC')),
+        ('energia', pa.float64()),
+    ]
+)
+
+# Linhas lidas do banco por lote ao gerar um arquivo
+TAMANHO_LOTE = 50_000
+
+# Meses fechados que ainda são regravados a cada execução, por poderem receber leituras atrasadas
+MESES_REABERTOS = 1
+
+
+def caminho_arquivo(tabela: str, inversor: str, mes: date) -> str:
+    """
+    Retorna o caminho do arquivo Parquet de um mês de um inversor.
+
+    Os diretórios seguem o particionamento do Hive (`inversor=`, `ano=`, `mes=`), para
+    que a leitura com `pyarrow.dataset` ignore os meses e inversores fora do filtro.
+
+    Args:
+        tabela (str): O nome da tabela em `TABELAS`.
+        inversor (str): O nome do inversor.
+        mes (date): Qualquer dia do mês.
+
+    Returns:
+        str: O caminho do arquivo.
+    """
+    return os.path.join(
+        settings.ARQUIVO_PARQUET_DIR,
+        tabela,
+        f'inversor={inversor}',
+        f'ano={mes.year}',
+        f'mes={mes.month:02d}',
+        'dados.parquet',
+    )
+
+
+def _limites(mes: date) -> tuple:
+    inicio = timezone.make_aware(datetime(mes.year, mes.month, 1))
+    return inicio, timezone.make_aware(
+        datetime(mes.year, mes.month, 1) + relativedelta(months=1)
+    )
+
+
+def arquiva_mes(tabela: str, inversor: str, mes: date) -> int:
+    """
+    Grava em Parquet a geração de um mês dos clientes de um inversor.
+
+    As linhas são lidas do banco em lotes de `TAMANHO_LOTE` e escritas como row groups
+    de um arquivo temporário, que substitui o arquivo final apenas ao término, para que
+    leitores nunca vejam um arquivo incompleto.
+
+    Args:
+        tabela (str): O nome da tabela em `TABELAS`.
+        inversor (str): O nome do inversor.
+        mes (date): Qualquer dia do mês.
+
+    Returns:
+        int: A quantidade de linhas gravadas.
+    """
+    inicio, fim = _limites(mes)
+    linhas = (
+        TABELAS[tabela]
+        .objects.filter(
+            cliente__inverter__name=inversor,
+            timestamp__gte=inicio,
+            timestamp__lt=fim,
+        )
+        .order_by('cliente_id', 'timestamp')
+        .values_list('cliente_id', 'timestamp', 'energystamp')
+        .iterator(chunk_size=TAMANHO_LOTE)
+    )
+
+    caminho = caminho_arquivo(tabela, inversor, mes)
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    # Arquivos iniciados por ponto são ignorados pela leitura com pyarrow.dataset
+    temporario = os.path.join(os.path.dirname(caminho), '.dados.parquet.tmp')
+
+    total = 0
+    lote = []
+    with pq.ParquetWriter(temporario, ESQUEMA, compression='zstd') as escritor:
+        for linha in linhas:
+            lote.append(linha)
+            if len(lote) >= TAMANHO_LOTE:
+                escritor.write_table(_tabela_arrow(lote))
+                total += len(lote)
+                lote = []
+        if lote or not total:
+            escritor.write_table(_tabela_arrow(lote))
+            total += len(lote)
+
+    os.replace(temporario, caminho)
+    return total
+
+
+def _tabela_arrow(lote: list) -> pa.Table:
+    cliente_id, timestamp, energia = zip(*lote) if lote else ((), (), ())
+    return pa.table(
+        [
+            pa.array(cliente_id, pa.int64()),
+            pa.array(timestamp, pa.timestamp('us', tz='UTC')),
+            pa.array(energia, pa.float64()),
+        ],
+        schema=ESQUEMA,
+    )
+
+
+def meses_pendentes(tabela: str, inversor: str, refaz: bool = False) -> list:
+    """
+    Lista os meses fechados de um inversor que ainda precisam ser arquivados.
+
+    Um mês está pendente se o seu arquivo não existe ou se está entre os
+    `MESES_REABERTOS` meses fechados mais recentes. O mês atual nunca é arquivado.
+
+    Args:
+        tabela (str): O nome da tabela em `TABELAS`.
+        inversor (str): O nome do inversor.
+        refaz (bool): Se True, todos os meses fechados são considerados pendentes.
+
+    Returns:
+        list: Os meses pendentes (primeiro dia de cada mês), em ordem cronológica.
+    """
+    primeiro = (
+        TABELAS[tabela]
+        .objects.filter(cliente__inverter__name=inversor)
+        .aggregate(primeiro=Min('timestamp'))['primeiro']
+    )
+    if primeiro is None:
+        return []
+
+    mes_atual = timezone.localdate().replace(day=1)
+    reabertos = mes_atual - relativedelta(months=MESES_REABERTOS)
+
+    pendentes = []
+    mes = timezone.localtime(primeiro).date().replace(day=1)
+    while mes < mes_atual:
+        if (
+            refaz
+            or mes >= reabertos
+            or not os.path.exists(caminho_arquivo(tabela, inversor, mes))
+        ):
+            pendentes.append(mes)
+        mes += relativedelta(months=1)
+
+    return pendentes
+
+
+def arquiva_pendentes(
+    tabelas: list = None, inversores: list = None, refaz: bool = False
+) -> int:
+    """
+    Arquiva em Parquet os meses pendentes de cada tabela e inversor.
+
+    Args:
+        tabelas (list): Os nomes das tabelas a arquivar. Por padrão, todas de `TABELAS`.
+        inversores (list): Os nomes dos inversores. Por padrão, todos os cadastrados.
+        refaz (bool): Se True, todos os meses fechados são gravados de novo.
+
+    Returns:
+        int: A quantidade de arquivos gravados.
+    """
+    inversores = inversores or list(
+        Inversor.objects.values_list('name', flat=True)
+    )
+
+    gravados = 0
+    for tabela in tabelas or TABELAS:
+        for inversor in inversores:
+            for mes in meses_pendentes(tabela, inversor, refaz):
+                arquiva_mes(tabela, inversor, mes)
+                gravados += 1
+
+    return gravados
+
+
+def meses_periodo(inicio: datetime, fim: datetime) -> list:
+    """
+    Lista os meses (no fuso horário local) que contêm alguma parte de um período.
+
+    Args:
+        inicio (datetime): O início do período (inclusivo, com fuso horário).
+        fim (datetime): O fim do período (exclusivo, com fuso horário).
+
+    Returns:
+        list: O primeiro dia de cada mês, em ordem cronológica. Vazia se o período for vazio.
+    """
+    if fim <= inicio:
+        return []
+
+    mes = timezone.localtime(inicio).date().replace(day=1)
+    # O fim é exclusivo: o último instante do período define o último mês
+    ultimo = (
+        timezone.localtime(fim - timedelta(microseconds=1))
+        .date()
+        .replace(day=1)
+    )
+    meses = []
+    while mes <= ultimo:
+        meses.append(mes)
+        mes += relativedelta(months=1)
+    return meses
+
+
+def le_geracao(
+    tabela: str,
+    inicio: datetime,
+    fim: datetime,
+    clientes: list = None,
+    inversores: list = None,
+) -> pd.DataFrame:
+    """
+    Lê do arquivo Parquet a geração de um período, sem consultar o banco.
+
+    Apenas os arquivos dos meses e inversores do filtro são abertos, e apenas os row
+    groups que podem conter os clientes e horários pedidos são lidos. A conversão para
+    pandas libera os buffers do Arrow à medida que monta as colunas, evitando manter
+    duas cópias dos dados em memória.
+
+    Args:
+        tabela (str): O nome da tabela em `TABELAS`.
+        inicio (datetime): O início do período (inclusivo, com fuso horário).
+        fim (datetime): O fim do período (exclusivo, com fuso horário).
+        clientes (list): Os ids dos clientes. Por padrão, todos.
+        inversores (list): Os nomes dos inversores. Por padrão, todos.
+
+    Returns:
+        DataFrame: Colunas 'cliente_id', 'timestamp' (UTC) e 'energia'. Vazio se não houver arquivo.
+    """
+    raiz = os.path.join(settings.ARQUIVO_PARQUET_DIR, tabela)
+    if not os.path.isdir(raiz):
+        return ESQUEMA.empty_table().to_pandas()
+
+    dataset = ds.dataset(raiz, format='parquet', partitioning='hive')
+
+    tipo_timestamp = ESQUEMA.field('timestamp').type
+    filtro = (ds.field('timestamp') >= pa.scalar(inicio, tipo_timestamp)) & (
+        ds.field('timestamp') < pa.scalar(fim, tipo_timestamp)
+    )
+
+    # Filtro nas partições, para que só os diretórios dos meses do período sejam lidos
+    meses = None
+    for mes in meses_periodo(inicio, fim):
+        particao = (ds.field('ano') == mes.year) & (
+            ds.field('mes') == mes.month
+        )
+        meses = particao if meses is None else meses | particao
+    if meses is None:
+        return ESQUEMA.empty_table().to_pandas()
+    filtro &= meses
+
+    if clientes is not None:
+        filtro &= ds.field('cliente_id').isin(list(clientes))
+    if inversores is not None:
+        filtro &= ds.field('inversor').isin(list(inversores))
+
+    return dataset.to_table(
+        columns=ESQUEMA.names, filter=filtro
+    ).to_pandas(self_destruct=True, split_blocks=True)
@@ -0,0 +1,83 @@
+import hashlib
+
+from apps.clientes.models import ClienteInfo
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F
+
+
+def versoes_geracao(cliente_ids) -> dict:
+    """
+    Retorna a versão da geração de cada cliente.
+
+    Args:
+        cliente_ids (iterable): Os ids dos clientes.
+
+    Returns:
+        dict: A versão de cada cliente, por id. Clientes sem ClienteInfo ficam de fora.
+    """
+    return dict(
+        ClienteInfo.objects.filter(cliente_id__in=cliente_ids).values_list(
+            'cliente_id', 'versao_geracao'
+        )
+    )
+
+
+def invalida_graficos(cliente_ids) -> None:
+    """
+    Invalida os gráficos em cache que incluem os clientes informados.
+
+    A versão da geração de cada cliente é incrementada no banco, o que muda a chave
+    de todos os gráficos que o incluem. Como a versão fica no banco, a invalidação
+    vale também para os processos do servidor web, mesmo quando a gravação é feita
+    pelo runscheduler.
+
+    Args:
+        cliente_ids (iterable): Os ids dos clientes com geração nova.
+
+    Returns:
+        None
+    """
+    ClienteInfo.objects.filter(cliente_id__in=cliente_ids).update(
+        versao_geracao=F('versao_geracao') + 1
+    )
+
+
+def chave_grafico(cliente_ids, *parametros) -> str:
+    """
+    Monta a chave de cache dos dados de um gráfico.
+
+    Args:
+        cliente_ids (iterable): Os ids dos clientes do gráfico.
+        *parametros: O modo (dia, mês, ano, total) e as datas selecionadas.
+
+    Returns:
+        str: A chave, que inclui a versão da geração de cada cliente.
+    """
+    versoes = versoes_geracao(cliente_ids)
+    partes = [
+        f'{cliente_id}:{versoes.get(cliente_id, 0)}'
+        for cliente_id in sorted(set(cliente_ids))
+    ]
+    partes.extend(str(parametro) for parametro in parametros)
+    resumo = hashlib.sha1('|'.join(partes).encode()).hexdigest()
+    return f'grafico_geracao:{resumo}'
+
+
+def dados_grafico(chave: str, monta):
+    """
+    Retorna os dados de um gráfico do cache, montando-os se necessário.
+
+    Args:
+        chave (str): A chave gerada por `chave_grafico`.
+        monta (callable): Função sem argumentos que monta os dados.
+
+    Returns:
+        Os dados do gráfico.
+    """
+    cache = caches[settings.CACHE_GRAFICOS]
+    dados = cache.get(chave)
+    if dados is None:
+        dados = monta()
+        cache.set(chave, dados)
+    return dados
@@ -0,0 +1,103 @@
+import io
+
+from django.db import connection
+
+# A partir desta quantidade de linhas, a carga via COPY compensa o custo de
+# criar a tabela temporária
+LIMITE_COPY = 200
+
+
+def usa_copy(quantidade: int) -> bool:
+    """
+    Indica se uma carga deve usar COPY em vez de `bulk_create`.
+
+    Args:
+        quantidade (int): A quantidade de linhas a gravar.
+
+    Returns:
+        bool: True se o banco é PostgreSQL e a carga é grande o bastante.
+    """
+    return connection.vendor == 'postgresql' and quantidade >= LIMITE_COPY
+
+
+def _valor_copy(valor) -> str:
+    """
+    Formata um valor para o formato texto do COPY.
+
+    Args:
+        valor: O valor da coluna.
+
+    Returns:
+        str: O valor formatado, com `\\N` para nulos.
+    """
+    if valor is None:
+        return r'\N'
+    if hasattr(valor, 'isoformat'):
+        return valor.isoformat()
+    return str(valor)
+
+
+def copia_com_upsert(
+    modelo, objetos: list, campos_unicos: tuple, campos_atualizados: tuple
+) -> None:
+    """
+    Grava objetos no PostgreSQL com COPY e um único upsert.
+
+    As linhas são copiadas para uma tabela temporária com as mesmas colunas da
+    tabela do modelo, descartada ao final da transação. Em seguida, um único
+    `INSERT ... SELECT ... ON CONFLICT DO UPDATE` leva as linhas para a tabela
+    definitiva. Deve ser chamado dentro de `transaction.atomic()`, e os objetos
+    não podem repetir a chave única.
+
+    Args:
+        modelo (Model): O modelo de destino, como GeracaoDiaria.
+        objetos (list): As instâncias a gravar (sem chave primária).
+        campos_unicos (tuple): Os campos da restrição de unicidade.
+        campos_atualizados (tuple): Os campos atualizados em caso de conflito.
+
+    Returns:
+        None
+    """
+    qn = connection.ops.quote_name
+    campos = [
+        campo
+        for campo in modelo._meta.concrete_fields
+        if not campo.primary_key
+    ]
+    colunas = ', '.join(qn(campo.column) for campo in campos)
+    tabela = qn(modelo._meta.db_table)
+    temporaria = qn(f'tmp_{modelo._meta.db_table}')
+
+    unicos = ', '.join(
+        qn(modelo._meta.get_field(nome).column) for nome in campos_unicos
+    )
+    atualizacoes = ', '.join(
+        f'{qn(coluna)} = EXCLUDED.{qn(coluna)}'
+        for coluna in (
+            modelo._meta.get_field(nome).column for nome in campos_atualizados
+        )
+    )
+
+    buffer = io.StringIO()
+    for objeto in objetos:
+        valores = (
+            campo.get_db_prep_save(getattr(objeto, campo.attname), connection)
+            for campo in campos
+        )
+        buffer.write('\t'.join(_valor_copy(valor) for valor in valores))
+        buffer.write('\n')
+    buffer.seek(0)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TEMP TABLE {temporaria} ON COMMIT DROP AS '
+            f'SELECT {colunas} FROM {tabela} WITH NO DATA'
+        )
+        cursor.copy_expert(
+            f'COPY {temporaria} ({colunas}) FROM STDIN', buffer
+        )
+        cursor.execute(
+            f'INSERT INTO {tabela} ({colunas}) '
+            f'SELECT {colunas} FROM {temporaria} '
+            f'ON CONFLICT ({unicos}) DO UPDATE SET {atualizacoes}'
+        )
@@ -0,0 +1,307 @@
+import queue
+import threading
+import time as t
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+
+# Número máximo de plantas buscadas simultaneamente por inversor.
+# Os portais mais sensíveis a carga (Fronius e Ecosolys) ficam com limites menores.
+CONCORRENCIA_INVERSOR = {
+    'growatt': 8,
+    'sungrow': 4,
+    'abb_fimer': 4,
+    'fronius': 2,
+    'refusol': 4,
+    'deye': 4,
+    'canadian': 4,
+    'ecosolys': 2,
+    'solis': 4,
+}
+CONCORRENCIA_PADRAO = 4
+
+# Limite de threads de um inversor somando todas as credenciais
+CONCORRENCIA_MAXIMA = 32
+
+# Registros acumulados antes de cada gravação, e tempo máximo (em segundos) que um
+# registro espera até ser gravado quando o lote ainda não está cheio
+TAMANHO_LOTE = 1000
+INTERVALO_GRAVACAO = 30
+
+# Lotes aguardando gravação por thread de busca. Limita a memória quando a busca
+# é mais rápida que a gravação.
+LOTES_EM_ESPERA = 4
+
+# Tempo máximo (em segundos) que uma thread de busca espera por espaço na fila antes
+# de verificar se a execução foi cancelada
+ESPERA_FILA = 1
+
+
+def compacta_registro(registro) -> tuple:
+    """
+    Converte um registro de geração para a tupla `(cliente_id, timestamp, energia)`.
+
+    As buscas que ainda retornam dicionários ('cliente', 'date', 'generation') são
+    convertidas aqui; tuplas são mantidas como estão.
+
+    Args:
+        registro (tuple or dict): O registro retornado pela busca de uma planta.
+
+    Returns:
+        tuple: O id do cliente, o timestamp e a energia (no formato do portal).
+    """
+    if isinstance(registro, tuple):
+        return registro
+    return (registro['cliente'].pk, registro['date'], registro['generation'])
+
+
+def _envia(fila: queue.Queue, mensagem, cancelado: threading.Event) -> bool:
+    """
+    Envia uma mensagem para a fila de gravação, desistindo se a execução for cancelada.
+
+    Args:
+        fila (queue.Queue): Fila lida pela etapa de gravação.
+        mensagem (tuple): A mensagem enviada.
+        cancelado (threading.Event): Sinalizado quando a gravação falha.
+
+    Returns:
+        bool: True se a mensagem foi enviada, False se a execução foi cancelada.
+    """
+    while not cancelado.is_set():
+        try:
+            fila.put(mensagem, timeout=ESPERA_FILA)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _produz_registros(
+    busca_cliente,
+    data: dict,
+    cliente,
+    fila: queue.Queue,
+    tamanho_lote: int,
+    cancelado: threading.Event,
+) -> None:
+    """
+    Executa a busca de uma planta enviando os registros para a fila de gravação.
+
+    Os registros são enviados em lotes assim que produzidos, então uma busca que
+    gera registros sob demanda (generator) não acumula o histórico em memória.
+    Ao final, a thread envia um aviso de término (com o erro, se houver) e
+    libera a sua conexão com o banco, aberta ao consultar o ORM do Django.
+    Se a gravação falhar (`cancelado`), a busca é interrompida.
+
+    Args:
+        busca_cliente (callable): Função que busca os registros de uma planta.
+        data (dict): Dicionário com sessão e informações do inversor.
+        cliente (Cliente): A planta a ser buscada.
+        fila (queue.Queue): Fila lida pela etapa de gravação.
+        tamanho_lote (int): Quantidade de registros por lote enviado.
+        cancelado (threading.Event): Sinalizado quando a gravação falha.
+
+    Returns:
+        None
+    """
+    if cancelado.is_set():
+        return
+
+    erro = None
+    lote = []
+    try:
+        for registro in busca_cliente(data, cliente):
+            lote.append(compacta_registro(registro))
+            if len(lote) >= tamanho_lote:
+                if not _envia(fila, ('lote', lote), cancelado):
+                    return
+                lote = []
+        if lote:
+            _envia(fila, ('lote', lote), cancelado)
+    except Exception as e:
+        erro = e
+    finally:
+        connection.close()
+        _envia(fila, ('fim', cliente, erro), cancelado)
+
+
+def executa_clientes_concorrente(
+    data: dict,
+    inversor: str,
+    busca_cliente,
+    persiste,
+    tamanho_lote: int = TAMANHO_LOTE,
+    intervalo: float = INTERVALO_GRAVACAO,
+) -> None:
+    """
+    Busca os registros de todas as plantas de um inversor de forma concorrente.
+
+    Atalho de `executa_contextos_concorrente` para uma única credencial.
+
+    Args:
+        data (dict): Dicionário com sessão e informações do inversor.
+
+            - clientes (list): Lista de objetos cliente do inversor.
+
+        inversor (str): Nome do inversor, usado para definir a concorrência.
+        busca_cliente (callable): Função `(data, cliente)` que retorna ou gera os registros de uma planta.
+        persiste (callable): Função que recebe uma lista de tuplas e as grava na base de dados.
+        tamanho_lote (int): Quantidade de registros acumulados antes de cada gravação.
+        intervalo (float): Tempo máximo, em segundos, entre gravações de registros pendentes.
+
+    Returns:
+        None
+    """
+    executa_contextos_concorrente(
+        [data], inversor, busca_cliente, persiste, tamanho_lote, intervalo
+    )
+
+
+def _intercala_tarefas(contextos: list) -> list:
+    """
+    Monta a lista de buscas `(data, cliente)` alternando entre as credenciais.
+
+    Assim as plantas de uma credencial com muitas plantas não atrasam as das demais.
+
+    Args:
+        contextos (list): Os dicionários `data` de cada credencial, com 'clientes'.
+
+    Returns:
+        list: As tuplas `(data, cliente)` na ordem de execução.
+    """
+    filas = [
+        [(data, cliente) for cliente in data['clientes']] for data in contextos
+    ]
+    tarefas = []
+    for indice in range(max((len(fila) for fila in filas), default=0)):
+        tarefas.extend(fila[indice] for fila in filas if indice < len(fila))
+    return tarefas
+
+
+def executa_contextos_concorrente(
+    contextos: list,
+    inversor: str,
+    busca_cliente,
+    persiste,
+    tamanho_lote: int = TAMANHO_LOTE,
+    intervalo: float = INTERVALO_GRAVACAO,
+) -> None:
+    """
+    Busca os registros das plantas de todas as credenciais de um inversor de forma concorrente.
+
+    Cada credencial tem o seu dicionário `data` (sessão e plantas em 'clientes'). As
+    buscas de todas as credenciais são intercaladas em um único pool de threads, com
+    `CONCORRENCIA_INVERSOR` threads por credencial até `CONCORRENCIA_MAXIMA`. As threads
+    enviam os registros, já compactados em tuplas `(cliente_id, timestamp, energia)`,
+    para uma fila lida por uma única etapa de gravação nesta thread. A gravação
+    (`persiste`, por exemplo `append_daily_generation`) acontece quando o lote atinge
+    `tamanho_lote` registros ou quando `intervalo` segundos se passam desde a
+    última gravação, então as transações continuam serializadas e a memória
+    usada não depende do tamanho do histórico buscado.
+
+    Uma falha em uma planta é registrada e não interrompe as demais. Uma falha na
+    gravação cancela as buscas em andamento e é propagada depois que o pool termina.
+
+    Args:
+        contextos (list): Os dicionários `data` de cada credencial.
+
+            - clientes (list): Lista de objetos cliente da credencial.
+
+        inversor (str): Nome do inversor, usado para definir a concorrência.
+        busca_cliente (callable): Função `(data, cliente)` que retorna ou gera os registros de uma planta.
+        persiste (callable): Função que recebe uma lista de tuplas e as grava na base de dados.
+        tamanho_lote (int): Quantidade de registros acumulados antes de cada gravação.
+        intervalo (float): Tempo máximo, em segundos, entre gravações de registros pendentes.
+
+    Returns:
+        None
+    """
+    max_workers = min(
+        CONCORRENCIA_INVERSOR.get(inversor, CONCORRENCIA_PADRAO)
+        * max(len(contextos), 1),
+        CONCORRENCIA_MAXIMA,
+    )
+    tarefas = _intercala_tarefas(contextos)
+    fila = queue.Queue(maxsize=max_workers * LOTES_EM_ESPERA)
+    pendentes = []
+    ultima_gravacao = t.monotonic()
+    em_andamento = len(tarefas)
+    cancelado = threading.Event()
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix=inversor
+    )
+    try:
+        for data, cliente in tarefas:
+            executor.submit(
+                _produz_registros,
+                busca_cliente,
+                data,
+                cliente,
+                fila,
+                tamanho_lote,
+                cancelado,
+            )
+
+        while em_andamento:
+            try:
+                mensagem = fila.get(timeout=intervalo)
+            except queue.Empty:
+                mensagem = None
+
+            if mensagem is None:
+                pass
+            elif mensagem[0] == 'lote':
+                pendentes.extend(mensagem[1])
+            else:
+                _, cliente, erro = mensagem
+                em_andamento -= 1
+                if erro is not None:
+                    print(
+                        f'{inversor} - Erro ao buscar a planta {cliente.plant_name}: {erro}'
+                    )
+
+            if pendentes and (
+                len(pendentes) >= tamanho_lote
+                or t.monotonic() - ultima_gravacao >= intervalo
+            ):
+                persiste(pendentes)
+                pendentes = []
+                ultima_gravacao = t.monotonic()
+    except BaseException:
+        # Sem a etapa de gravação ninguém lê a fila: as threads de busca são
+        # canceladas e o erro é propagado depois que o pool termina
+        cancelado.set()
+        raise
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    persiste(pendentes)
+
+
+def mapeia_concorrente(funcao, itens, inversor: str) -> list:
+    """
+    Aplica uma função a cada item de forma concorrente, com a concorrência do inversor.
+
+    Usado nas requisições independentes de um portal (páginas de uma listagem,
+    detalhes de cada planta), limitadas por `CONCORRENCIA_INVERSOR`.
+
+    Args:
+        funcao (callable): Função que recebe um item.
+        itens (iterable): Os itens.
+        inversor (str): Nome do inversor, usado para definir a concorrência.
+
+    Returns:
+        list: Os resultados, na ordem dos itens. A primeira exceção é propagada.
+    """
+    itens = list(itens)
+    if len(itens) <= 1:
+        return [funcao(item) for item in itens]
+
+    max_workers = min(
+        CONCORRENCIA_INVERSOR.get(inversor, CONCORRENCIA_PADRAO), len(itens)
+    )
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix=inversor
+    ) as executor:
+        return list(executor.map(funcao, itens))
@@ -0,0 +1,150 @@
+import datetime
+
+from apps.clientes.models import Geracao, GeracaoMensal
+from dateutil.relativedelta import relativedelta
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+from django.utils.timezone import localtime
+
+BATCH_SIZE = 50
+
+
+def recalcula_geracao_mensal(geracao) -> int:
+    """
+    Recalcula o consolidado mensal a partir de um queryset de Geracao.
+
+    Os totais são agregados no banco por cliente, ano e mês, e gravados em GeracaoMensal
+    com `bulk_create(update_conflicts=True)`. Como cada mês é somado novamente por
+    completo, a operação pode ser repetida sem duplicar valores.
+
+    Args:
+        geracao (QuerySet): Os registros de Geracao cujos meses devem ser recalculados.
+            Os meses precisam estar completos no queryset.
+
+    Returns:
+        int: A quantidade de meses gravados.
+    """
+    meses = (
+        geracao.annotate(
+            ano=ExtractYear('timestamp'), mes=ExtractMonth('timestamp')
+        )
+        .values('cliente_id', 'ano', 'mes')
+        .annotate(
+            energia=Sum('energystamp'),
+            dias_com_dado=Count('id', filter=Q(energystamp__gt=0)),
+        )
+        .order_by()
+    )
+
+    consolidados = [
+        GeracaoMensal(
+            cliente_id=mes['cliente_id'],
+            ano=mes['ano'],
+            mes=mes['mes'],
+            energia=mes['energia'] or 0,
+            dias_com_dado=mes['dias_com_dado'],
+        )
+        for mes in meses
+    ]
+
+    GeracaoMensal.objects.bulk_create(
+        consolidados,
+        update_conflicts=True,
+        update_fields=['energia', 'dias_com_dado'],
+        unique_fields=('cliente', 'ano', 'mes'),
+        batch_size=BATCH_SIZE,
+    )
+
+    return len(consolidados)
+
+
+def atualiza_geracao_mensal(complete_generation: list) -> None:
+    """
+    Atualiza o consolidado mensal dos meses tocados por um lote de geração completa.
+
+    Para cada cliente do lote, apenas os meses entre o primeiro e o último timestamp
+    gravados são recalculados, em uma única consulta agregada.
+
+    Args:
+        complete_generation (list): Os objetos Geracao recém gravados.
+
+    Returns:
+        None
+    """
+    periodos = {}
+    for geracao in complete_generation:
+        dia = localtime(geracao.timestamp).date()
+        inicio, fim = periodos.get(geracao.cliente_id, (dia, dia))
+        periodos[geracao.cliente_id] = (min(inicio, dia), max(fim, dia))
+
+    if not periodos:
+        return
+
+    filtro = Q()
+    for cliente_id, (inicio, fim) in periodos.items():
+        filtro |= Q(
+            cliente_id=cliente_id,
+            timestamp__date__gte=inicio.replace(day=1),
+            timestamp__date__lt=fim.replace(day=1) + relativedelta(months=1),
+        )
+
+    recalcula_geracao_mensal(Geracao.objects.filter(filtro))
+
+
+def soma_geracao_periodo(
+    cliente_id: int, inicio: datetime.datetime, fim: datetime.datetime
+) -> tuple:
+    """
+    Soma a geração de um cliente no intervalo [inicio, fim), desconsiderando dias zerados.
+
+    Os meses completamente contidos no intervalo são lidos de GeracaoMensal e apenas os
+    dias dos meses das pontas são somados a partir de Geracao.
+
+    Args:
+        cliente_id (int): O id do cliente.
+        inicio (datetime): O início do intervalo (inclusivo).
+        fim (datetime): O fim do intervalo (exclusivo).
+
+    Returns:
+        tuple: A soma da geração em kWh (None se não houver dias com geração) e a quantidade de dias com geração.
+    """
+    inicio_local = localtime(inicio)
+    fim_local = localtime(fim)
+
+    # Primeiro mês completo: o próprio mês, se o intervalo começa na virada dele
+    primeiro_mes = inicio_local.date().replace(day=1)
+    if inicio_local != inicio_local.replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    ):
+        primeiro_mes += relativedelta(months=1)
+    ultimo_mes = fim_local.date().replace(day=1)
+
+    geracao = Geracao.objects.filter(cliente_id=cliente_id).exclude(
+        Q(energystamp=None) | Q(energystamp=0)
+    )
+
+    if primeiro_mes >= ultimo_mes:
+        totais = geracao.filter(
+            timestamp__gte=inicio, timestamp__lt=fim
+        ).aggregate(energia=Sum('energystamp'), dias=Count('id'))
+        energia, dias = totais['energia'] or 0, totais['dias']
+    else:
+        pontas = geracao.filter(
+            Q(timestamp__gte=inicio, timestamp__date__lt=primeiro_mes)
+            | Q(timestamp__date__gte=ultimo_mes, timestamp__lt=fim)
+        ).aggregate(energia=Sum('energystamp'), dias=Count('id'))
+
+        meses = (
+            GeracaoMensal.objects.filter(cliente_id=cliente_id)
+            .annotate(indice=F('ano') * 12 + F('mes'))
+            .filter(
+                indice__gte=primeiro_mes.year * 12 + primeiro_mes.month,
+                indice__lt=ultimo_mes.year * 12 + ultimo_mes.month,
+            )
+            .aggregate(energia=Sum('energia'), dias=Sum('dias_com_dado'))
+        )
+
+        energia = (pontas['energia'] or 0) + (meses['energia'] or 0)
+        dias = pontas['dias'] + (meses['dias'] or 0)
+
+    return (energia / 1000 if dias else None), dias
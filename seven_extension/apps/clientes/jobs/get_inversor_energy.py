@@ -7,6 +7,7 @@ import json
 import locale
 import os
 import re
+import threading
 import time as t
 from datetime import date, datetime, time, timedelta
 from urllib.parse import parse_qs, quote, urlparse
@@ -15,6 +16,24 @@ import growattServer
 import pytz
 import requests
 import urllib3
+from apps.clientes.jobs.carga_copy import copia_com_upsert, usa_copy
+from apps.clientes.jobs.fetch_engine import (
+    executa_contextos_concorrente,
+    mapeia_concorrente,
+)
+from apps.clientes.jobs.geracao_mensal import atualiza_geracao_mensal
+from apps.clientes.jobs.http_session import TIMEOUT_PADRAO, nova_sessao
+from apps.clientes.jobs.limite_taxa import espera_nova_tentativa
+from apps.clientes.jobs.mapa_plantas import invalida_mapa
+from apps.clientes.jobs.planejador import (
+    MARCA_INICIAL,
+    dias_do_plano,
+    meses_do_plano,
+    planeja_geracao_completa,
+    planeja_geracao_diaria,
+    registra_buscas_diarias,
+)
+from apps.clientes.jobs.referencias import CACHE_INVERSORES
 from apps.clientes.methods import printl, print_debug
 from apps.clientes.models import (
     Cliente,
@@ -22,12 +41,11 @@ from apps.clientes.models import (
     Empresa,
     Geracao,
     GeracaoDiaria,
-    Inversor,
     RelacaoClienteEmpresa,
 )
-from dateutil.relativedelta import relativedelta
 from django.db import connection, transaction
-from django.db.models import Q
+from django.db.models import Case, DateTimeField, F, Max, Value, When
+from django.db.models.functions import Coalesce, Greatest
 from requests import Session
 from dotenv import load_dotenv
 import string
@@ -44,10 +62,61 @@ GEOCODE_API = os.getenv('GEOCODE_API')
 # import para testar os métodos rodando no shell do django
 # from apps.clientes.models import Cliente, Geracao, GeracaoDiaria, Inversor, Credencial
 
-LIMITE = 100
 BATCH_SIZE = 50
 
 
+def atualiza_marcas_cliente_info(
+    cliente_latest_timestamp: dict, campo: str, cliente_ids=()
+) -> None:
+    """
+    Atualiza em lote a marca de última geração dos clientes em ClienteInfo.
+
+    As linhas inexistentes são criadas em um único `bulk_create` e a marca é
+    atualizada em um único `UPDATE`, mantendo sempre o maior valor entre o
+    timestamp já gravado e o recebido. O custo não cresce com a quantidade de
+    clientes do lote.
+
+    O mesmo `UPDATE` incrementa a versão da geração de todos os clientes gravados,
+    mesmo os que só receberam leituras zeradas ou correções de valores antigos,
+    invalidando os gráficos em cache que os incluem (ver `apps.clientes.jobs.cache_grafico`).
+
+    Args:
+        cliente_latest_timestamp (dict): Um dicionário contendo ids de clientes como chaves e seus respectivos timestamps mais recentes.
+        campo (str): O campo de ClienteInfo a ser atualizado ('ultima_geracao' ou 'ultima_geracao_diaria').
+        cliente_ids (iterable): Os ids de todos os clientes com registros gravados no lote.
+
+    Returns:
+        None
+    """
+    marcas = cliente_latest_timestamp
+    clientes = set(cliente_ids) | marcas.keys()
+    if not clientes:
+        return
+
+    ClienteInfo.objects.bulk_create(
+        [ClienteInfo(cliente_id=cliente_id) for cliente_id in clientes],
+        ignore_conflicts=True,
+        batch_size=BATCH_SIZE,
+    )
+
+    atualizacao = {'versao_geracao': F('versao_geracao') + 1}
+    if marcas:
+        # Clientes sem marca no lote mantêm o valor atual. Sem o `default`, o
+        # Case daria NULL e o Greatest também, exceto no PostgreSQL.
+        nova_marca = Case(
+            *[
+                When(cliente_id=cliente_id, then=Value(timestamp))
+                for cliente_id, timestamp in marcas.items()
+            ],
+            default=F(campo),
+            output_field=DateTimeField(),
+        )
+        atualizacao[campo] = Greatest(
+            Coalesce(F(campo), nova_marca), nova_marca
+        )
+    ClienteInfo.objects.filter(cliente_id__in=clientes).update(**atualizacao)
+
+
 def commit_daily_generation(
     daily_generation: list, cliente_latest_timestamp: dict
 ):
@@ -56,45 +125,40 @@ def commit_daily_generation(
 
     Este método utiliza uma transação atômica para garantir a integridade dos dados durante o processo de inserção em lote.
 
+    No PostgreSQL, lotes grandes são gravados com COPY em uma tabela temporária e um único upsert
+    (`copia_com_upsert`); nos demais casos é usado o `bulk_create`.
+
     Args:
         daily_generation (list): Uma lista de objetos representando a geração diária de energia.
-        cliente_latest_timestamp (dict): Um dicionário contendo clientes como chaves e seus respectivos timestamps mais recentes.
+        cliente_latest_timestamp (dict): Um dicionário contendo ids de clientes como chaves e seus respectivos timestamps mais recentes.
 
     Returns:
         None
     """
     with transaction.atomic():
-        GeracaoDiaria.objects.bulk_create(
-            daily_generation,
-            update_conflicts=True,
-            update_fields=[
-                'timestamp',
-                'energystamp',
-            ],
-            unique_fields=('cliente', 'timestamp'),
-            batch_size=BATCH_SIZE,
-        )
-        for cliente, latest_timestamp in cliente_latest_timestamp.items():
-            # Tente obter a linha correspondente ao cliente
-            cliente_info, created = ClienteInfo.objects.get_or_create(
-                cliente=cliente
+        if usa_copy(len(daily_generation)):
+            copia_com_upsert(
+                GeracaoDiaria,
+                daily_generation,
+                campos_unicos=('cliente', 'timestamp'),
+                campos_atualizados=('energystamp',),
             )
-
-            # Verifique se a linha já existe e se latest_timestamp é mais recente
-            if not created:
-                if cliente_info.ultima_geracao_diaria:
-                    if latest_timestamp > cliente_info.ultima_geracao_diaria:
-                        # Se a linha já existir e latest_timestamp for mais recente, atualize ultima_geracao_diaria
-                        cliente_info.ultima_geracao_diaria = latest_timestamp
-                        cliente_info.save()
-                else:
-                    # Se a linha já existe e ultima_geracao_diaria for None, defina ultima_geracao_diaria
-                    cliente_info.ultima_geracao_diaria = latest_timestamp
-                    cliente_info.save()
-            elif created:
-                # Se a linha foi criada agora, defina ultima_geracao_diaria
-                cliente_info.ultima_geracao_diaria = latest_timestamp
-                cliente_info.save()
+        else:
+            GeracaoDiaria.objects.bulk_create(
+                daily_generation,
+                update_conflicts=True,
+                update_fields=[
+                    'timestamp',
+                    'energystamp',
+                ],
+                unique_fields=('cliente', 'timestamp'),
+                batch_size=BATCH_SIZE,
+            )
+        atualiza_marcas_cliente_info(
+            cliente_latest_timestamp,
+            'ultima_geracao_diaria',
+            {geracao.cliente_id for geracao in daily_generation},
+        )
 
 
 def commit_complete_generation(
@@ -105,9 +169,11 @@ def commit_complete_generation(
 
     Este método utiliza uma transação atômica para garantir a integridade dos dados durante o processo de inserção em lote.
 
+    O consolidado mensal (GeracaoMensal) dos meses gravados é atualizado na mesma transação.
+
     Args:
         complete_generation (list): Uma lista de objetos representando a geração completa de energia.
-        cliente_latest_timestamp (dict): Um dicionário contendo clientes como chaves e seus respectivos timestamps mais recentes.
+        cliente_latest_timestamp (dict): Um dicionário contendo ids de clientes como chaves e seus respectivos timestamps mais recentes.
 
     Returns:
         None
@@ -123,27 +189,12 @@ def commit_complete_generation(
             unique_fields=('cliente', 'timestamp'),
             batch_size=BATCH_SIZE,
         )
-        for cliente, latest_timestamp in cliente_latest_timestamp.items():
-            # Tente obter a linha correspondente ao cliente
-            cliente_info, created = ClienteInfo.objects.get_or_create(
-                cliente=cliente
-            )
-
-            # Verifique se a linha já existe e se latest_timestamp é mais recente
-            if not created:
-                if cliente_info.ultima_geracao:
-                    if latest_timestamp > cliente_info.ultima_geracao:
-                        # Se a linha já existir e latest_timestamp for mais recente, atualize ultima_geracao
-                        cliente_info.ultima_geracao = latest_timestamp
-                        cliente_info.save()
-                else:
-                    # Se a linha já existe e ultima_geracao for None, defina ultima_geracao
-                    cliente_info.ultima_geracao = latest_timestamp
-                    cliente_info.save()
-            elif created:
-                # Se a linha foi criada agora, defina ultima_geracao
-                cliente_info.ultima_geracao = latest_timestamp
-                cliente_info.save()
+        atualiza_geracao_mensal(complete_generation)
+        atualiza_marcas_cliente_info(
+            cliente_latest_timestamp,
+            'ultima_geracao',
+            {geracao.cliente_id for geracao in complete_generation},
+        )
 
 
 
@@ -202,12 +253,36 @@ def convert_energy_units(energy_unit: str) -> float:
         return 0
 
 
+def planta_alterada(existente, cliente) -> bool:
+    """
+    Indica se a energia ou as coordenadas de uma planta mudaram.
+
+    Args:
+        existente (Cliente): O cliente gravado na base de dados.
+        cliente (Cliente): O cliente com os dados recebidos do portal.
+
+    Returns:
+        bool: True se algum dos campos atualizados por 'commit_clientes' mudou.
+    """
+    return (
+        float(existente.energy_today) != float(cliente.energy_today)
+        or float(existente.energy_total) != float(cliente.energy_total)
+        or str(existente.latitude) != str(cliente.latitude)
+        or str(existente.longitude) != str(cliente.longitude)
+    )
+
+
 def commit_clientes(clientes: list, dados: list) -> None:
     """
     Commit das informações dos clientes na base de dados.
 
     Este método utiliza uma transação atômica para garantir a integridade dos dados durante o processo de inserção e atualização.
 
+    Os clientes existentes são buscados em uma única consulta e os que mudaram são
+    atualizados com `bulk_update`; os novos clientes e suas relações com a empresa são
+    criados com `bulk_create`. A quantidade de consultas não depende do número de plantas.
+    Se algum cliente foi criado ou atualizado, o mapa das plantas em cache é invalidado.
+
     Args:
         clientes (list): Uma lista de objetos representando clientes.
         dados (list): Uma lista de dicionários contendo dados originais.
@@ -215,39 +290,71 @@ def commit_clientes(clientes: list, dados: list) -> None:
     Returns:
         None
     """
+    # Empresa de cada planta, indexada por (plant_id, plant_name)
+    empresa_por_planta = {
+        (str(planta['plant_id']), planta['plant_name']): planta['empresa_id']
+        for planta in dados
+    }
+
+    # Remove plantas repetidas, mantendo a última leitura recebida
+    clientes_por_chave = {
+        (str(cliente.plant_id), cliente.plant_name): cliente
+        for cliente in clientes
+    }
+
     with transaction.atomic():
-        for cliente in clientes:
-            # Tente obter um cliente existente com o mesmo plant_id e plant_name
-            obj = Cliente.objects.filter(
-                plant_id=cliente.plant_id, plant_name=cliente.plant_name
-            ).first()
+        existentes = {
+            (obj.plant_id, obj.plant_name): obj
+            for obj in Cliente.objects.filter(
+                plant_id__in={
+                    plant_id for plant_id, _ in clientes_por_chave
+                }
+            )
+        }
+
+        atualizar = []
+        novos = []
+        for chave, cliente in clientes_por_chave.items():
+            obj = existentes.get(chave)
 
             if obj is not None:
-                # Se o cliente já existir, atualize os campos necessários
-                obj.energy_today = cliente.energy_today
-                obj.energy_total = cliente.energy_total
-                obj.latitude = cliente.latitude
-                obj.longitude = cliente.longitude
-                obj.save()
+                # Se o cliente já existir e algum campo mudou, atualize-o
+                if planta_alterada(obj, cliente):
+                    obj.energy_today = cliente.energy_today
+                    obj.energy_total = cliente.energy_total
+                    obj.latitude = cliente.latitude
+                    obj.longitude = cliente.longitude
+                    atualizar.append(obj)
             else:
-                # Se o cliente não existir, crie um novo
-                cliente.save()
-
-                # Encontre a empresa correspondente no dados original
-                for planta in dados:
-                    if (
-                        planta['plant_id'] == cliente.plant_id
-                        and planta['plant_name'] == cliente.plant_name
-                    ):
-                        empresa_id = planta['empresa_id']
-                        break
+                novos.append(cliente)
+
+        Cliente.objects.bulk_update(
+            atualizar,
+            ['energy_today', 'energy_total', 'latitude', 'longitude'],
+            batch_size=BATCH_SIZE,
+        )
 
-                empresa = Empresa.objects.get(id=empresa_id)
+        if novos:
+            Cliente.objects.bulk_create(novos, batch_size=BATCH_SIZE)
+
+            # Crie a relação com a empresa para os novos clientes
+            RelacaoClienteEmpresa.objects.bulk_create(
+                [
+                    RelacaoClienteEmpresa(
+                        cliente=cliente,
+                        empresa_id=empresa_por_planta[
+                            (str(cliente.plant_id), cliente.plant_name)
+                        ],
+                    )
+                    for cliente in novos
+                ],
+                ignore_conflicts=True,
+                batch_size=BATCH_SIZE,
+            )
 
-                # Crie a relação com a empresa para o novo cliente
-                relacao, _ = RelacaoClienteEmpresa.objects.get_or_create(
-                    cliente=cliente, empresa=empresa
-                )
+        # Energia ou coordenadas mudaram: o mapa das plantas em cache fica inválido
+        if atualizar or novos:
+            invalida_mapa()
 
         # # Log das consultas SQL
         # for query in connection.queries:
@@ -285,115 +392,107 @@ def append_clientes(dados: list) -> None:
 
 
 
-def append_complete_generation(dados: dict) -> None:
+def append_complete_generation(dados: list) -> None:
     """
     Adiciona dados de geração completa à lista que será inserida na base de dados.
 
     Este método cria objetos de geração completa a partir dos dados fornecidos e os adiciona à base de dados.
+    Registros do dia atual são ignorados, pois o dia ainda não terminou.
 
     Args:
-        dados (dict): Um dicionário contendo informações sobre a geração completa.
-        
+        dados (list): Tuplas `(cliente_id, data, geração)` com a geração completa.
+
     Returns:
         None
     """
     complete_generation = []
-
     unique_values = set()
-    timestamp = ''
-    energystamp = 0
     cliente_latest_timestamp = (
         {}
     )  # Dicionário para armazenar o último timestamp por cliente
 
     new_timezone = pytz.timezone('America/Sao_Paulo')
+    hoje = datetime.today().date()
 
-    for item in dados:
+    for cliente_id, date, generation in dados:
 
-        if item['date'].date() != datetime.today().date():
-            date = item['date']
-            if date.tzinfo is None:
-                aware_datetime = new_timezone.localize(date)
-            else:
-                aware_datetime = date.astimezone(new_timezone)
+        if date.date() == hoje:
+            continue
 
-            cliente = item['cliente']
-            timestamp = aware_datetime
-            energystamp = convert_energy_units(item['generation'])
+        if date.tzinfo is None:
+            timestamp = new_timezone.localize(date)
+        else:
+            timestamp = date.astimezone(new_timezone)
+
+        if (cliente_id, timestamp) in unique_values:
+            continue
+        unique_values.add((cliente_id, timestamp))
 
-            generation = Geracao(
-                cliente=cliente,
-                timestamp=aware_datetime,
+        energystamp = convert_energy_units(generation)
+        complete_generation.append(
+            Geracao(
+                cliente_id=cliente_id,
+                timestamp=timestamp,
                 energystamp=energystamp,
             )
+        )
 
-            if (cliente, timestamp) not in unique_values:
-                complete_generation.append(generation)
-                unique_values.add((cliente, timestamp))
-
-                # Atualize o último timestamp para o cliente atual
-                if energystamp is not None and energystamp != 0:
-                    if cliente not in cliente_latest_timestamp:
-                        cliente_latest_timestamp[cliente] = timestamp
-                    elif timestamp > cliente_latest_timestamp[cliente]:
-                        cliente_latest_timestamp[cliente] = timestamp
+        # Atualize o último timestamp para o cliente atual
+        if energystamp and (
+            cliente_id not in cliente_latest_timestamp
+            or timestamp > cliente_latest_timestamp[cliente_id]
+        ):
+            cliente_latest_timestamp[cliente_id] = timestamp
 
     commit_complete_generation(complete_generation, cliente_latest_timestamp)
 
 
-def append_daily_generation(dados: dict) -> None:
+def append_daily_generation(dados: list) -> None:
     """
     Adiciona dados de geração diária à lista que será inserida na base de dados.
 
     Este método cria objetos de geração diária a partir dos dados fornecidos e os adiciona à base de dados.
 
     Args:
-        dados (dict): Um dicionário contendo informações sobre a geração diária.
+        dados (list): Tuplas `(cliente_id, timestamp, geração)` com a geração diária.
 
     Returns:
         None
     """
     daily_generation = []
     unique_values = set()
-    timestamp = ''
-    energystamp = 0
     cliente_latest_timestamp = (
         {}
     )  # Dicionário para armazenar o último timestamp por cliente
 
-    for item in dados:
+    new_timezone = pytz.timezone('America/Sao_Paulo')
 
-        date = item['date']
-        new_timezone = pytz.timezone('America/Sao_Paulo')
+    for cliente_id, date, generation in dados:
 
         if date.tzinfo is None:
-            aware_datetime = new_timezone.localize(date)
+            timestamp = new_timezone.localize(date)
         else:
-            aware_datetime = date.astimezone(new_timezone)
+            timestamp = date.astimezone(new_timezone)
 
-        cliente = item['cliente']
-        timestamp = aware_datetime
-        energystamp = convert_energy_units(item['generation'])
+        if (cliente_id, timestamp) in unique_values:
+            continue
+        unique_values.add((cliente_id, timestamp))
 
-        generation = GeracaoDiaria(
-            cliente=cliente,
-            timestamp=aware_datetime,
-            energystamp=energystamp,
+        energystamp = convert_energy_units(generation)
+        daily_generation.append(
+            GeracaoDiaria(
+                cliente_id=cliente_id,
+                timestamp=timestamp,
+                energystamp=energystamp,
+            )
         )
 
-        if (cliente, timestamp) not in unique_values:
-            daily_generation.append(generation)
-            unique_values.add((cliente, timestamp))
-
-            # TODO: Otimizar velocidade, não fazer em cada linha
-
-            # Atualize o último timestamp para o cliente atual
-            if energystamp is not None and energystamp != 0:
-                if cliente not in cliente_latest_timestamp:
-                    cliente_latest_timestamp[cliente] = timestamp
-                elif timestamp > cliente_latest_timestamp[cliente]:
-                    cliente_latest_timestamp[cliente] = timestamp
-                # print(cliente_latest_timestamp)
+        # Atualize o último timestamp para o cliente atual
+        if energystamp and (
+            cliente_id not in cliente_latest_timestamp
+            or timestamp > cliente_latest_timestamp[cliente_id]
+        ):
+            cliente_latest_timestamp[cliente_id] = timestamp
 
     # Envie daily_generation e cliente_latest_timestamp para a função commit_daily_generation
     commit_daily_generation(daily_generation, cliente_latest_timestamp)
@@ -422,143 +521,167 @@ def hash_password(password: str) -> str:
     return hash_object.hexdigest()
 
 
-def buscar_ultima_informacao_diaria(cliente):
+def carrega_ultimas_informacoes(clientes, campo: str, modelo) -> dict:
     """
-    Busca a última informação diária de geração para um cliente.
+    Busca em lote a marca de última geração de um conjunto de clientes.
 
-    Este método verifica se há uma entrada na tabela ClienteInfo para o cliente fornecido.
-    
-    Se existir, retorna a data da última geração diária registrada.
-    
-    Caso contrário, tenta buscar a informação diretamente na tabela GeracaoDiaria.
-    
-    Se encontrar registros com energystamp > 0, retorna a data do último registro.
-    
-    Caso contrário, cria uma linha fictícia e retorna a data desta linha.
+    As marcas já gravadas em ClienteInfo são lidas em uma única consulta. Para os
+    clientes sem linha em ClienteInfo, o último timestamp com geração é obtido em
+    uma única consulta agrupada (`Max('timestamp')` por cliente) na tabela de
+    geração, e as linhas de ClienteInfo são criadas em lote. Clientes sem nenhuma
+    geração recebem `MARCA_INICIAL`.
 
     Args:
-        cliente: O cliente para o qual buscar a última informação diária.
+        clientes (iterable): Os clientes do inversor.
+        campo (str): O campo de ClienteInfo ('ultima_geracao' ou 'ultima_geracao_diaria').
+        modelo (Model): A tabela de geração correspondente (Geracao ou GeracaoDiaria).
 
     Returns:
-        datetime or False: A data da última informação diária, ou False se não houver registros.
-
+        dict: O id de cada cliente e a sua marca (datetime ou None).
     """
-    try:
-        ultima_informacao = ClienteInfo.objects.get(
-            Q(cliente__plant_id=cliente.plant_id)
-            & Q(cliente__plant_name=cliente.plant_name)
+    ids = [cliente.pk for cliente in clientes]
+
+    marcas = dict(
+        ClienteInfo.objects.filter(cliente_id__in=ids).values_list(
+            'cliente_id', campo
         )
-        ultimo_dia = (
-            ultima_informacao.ultima_geracao_diaria
-            if ultima_informacao
-            else False
+    )
+
+    faltantes = [cliente_id for cliente_id in ids if cliente_id not in marcas]
+    if faltantes:
+        gravadas = dict(
+            modelo.objects.filter(cliente_id__in=faltantes, energystamp__gt=0)
+            .values('cliente_id')
+            .annotate(ultima=Max('timestamp'))
+            .values_list('cliente_id', 'ultima')
+            .order_by()
         )
+        novas = {
+            cliente_id: gravadas.get(cliente_id, MARCA_INICIAL)
+            for cliente_id in faltantes
+        }
+        ClienteInfo.objects.bulk_create(
+            [
+                ClienteInfo(cliente_id=cliente_id, **{campo: marca})
+                for cliente_id, marca in novas.items()
+            ],
+            ignore_conflicts=True,
+            batch_size=BATCH_SIZE,
+        )
+        marcas.update(novas)
 
-    except ClienteInfo.DoesNotExist:
-        try:
-            t.sleep(5)
-            queryset = GeracaoDiaria.objects.filter(
-                Q(cliente__plant_id=cliente.plant_id)
-                & Q(cliente__plant_name=cliente.plant_name)
-                & Q(energystamp__gt=0)
-            )
-            # printl(str(queryset.query))
-            # Verifique se há registros no queryset
-            if queryset.exists():
-                ultima_informacao = queryset.latest('timestamp')
-                ultimo_dia = ultima_informacao.timestamp
-            else:
-                # Se não houver registros com energystamp > 0, crie uma linha fictícia
-                ultimo_dia = datetime(2001, 1, 1)
-                ultimo_dia = ultimo_dia.replace(
-                    tzinfo=pytz.timezone('America/Sao_Paulo')
-                )
+    return marcas
 
-            ClienteInfo.objects.update_or_create(
-                cliente=cliente, defaults={'ultima_geracao_diaria': ultimo_dia}
-            )
 
-        except GeracaoDiaria.DoesNotExist:
-            # Se não houver registros, crie uma linha fictícia
-            ultimo_dia = datetime(2001, 1, 1)
-            ultimo_dia = ultimo_dia.replace(
-                tzinfo=pytz.timezone('America/Sao_Paulo')
-            )
-            ClienteInfo.objects.update_or_create(
-                cliente=cliente, defaults={'ultima_geracao_diaria': ultimo_dia}
-            )
-            ultimo_dia = False
+def buscar_ultimas_informacoes_diarias(clientes) -> dict:
+    """
+    Busca a última informação diária de geração de todos os clientes de um inversor.
 
-    return ultimo_dia
+    Args:
+        clientes (iterable): Os clientes do inversor.
+
+    Returns:
+        dict: O id de cada cliente e o datetime da sua última geração diária (ou None).
+    """
+    return carrega_ultimas_informacoes(
+        clientes, 'ultima_geracao_diaria', GeracaoDiaria
+    )
 
 
-def buscar_ultima_informacao_completa(cliente):
+def executa_geracao_diaria(
+    contextos: list, inversor: str, busca_cliente
+) -> None:
     """
-    Busca a data da última informação completa de geração para um cliente.
+    Executa a busca de geração diária das plantas de um inversor seguindo o plano de busca.
 
-    Este método verifica se há uma entrada na tabela ClienteInfo para o cliente fornecido.
-    
-    Se existir, retorna a data da última geração completa registrada.
-    
-    Caso contrário, tenta buscar a informação diretamente na tabela Geracao.
-    
-    Se encontrar registros com energystamp > 0, retorna a data do último registro.
-    
-    Caso contrário, cria uma linha fictícia e retorna a data desta linha.
+    As marcas de última geração e o plano (`planeja_geracao_diaria`) são calculados em
+    lote, uma única vez para as plantas de todas as credenciais, antes da busca. Apenas
+    os clientes fora de espera são buscados, cada um nos dias faltantes do seu plano,
+    e a espera dos clientes parados é atualizada ao final.
 
     Args:
-        cliente: O cliente para o qual buscar a última informação completa.
+        contextos (list): Os dicionários `data` de cada credencial do inversor.
 
-    Returns:
-        datetime.date or False: A data da última informação completa, ou False se não houver registros.
+            - clientes (list): Lista de objetos cliente da credencial.
+
+        inversor (str): Nome do inversor.
+        busca_cliente (callable): Função `(data, cliente)` que retorna ou gera a geração diária de uma planta.
 
+    Returns:
+        None
     """
+    clientes = {id(data): list(data['clientes']) for data in contextos}
+    todos = [cliente for lista in clientes.values() for cliente in lista]
+    ultimas_informacoes = buscar_ultimas_informacoes_diarias(todos)
+    planos = planeja_geracao_diaria(todos, ultimas_informacoes)
+
+    for data in contextos:
+        data['ultimas_informacoes'] = ultimas_informacoes
+        data['planos'] = planos
+        data['clientes'] = [
+            cliente for cliente in clientes[id(data)] if cliente.pk in planos
+        ]
     try:
-        ultima_informacao = ClienteInfo.objects.get(
-            Q(cliente__plant_id=cliente.plant_id)
-            & Q(cliente__plant_name=cliente.plant_name)
+        executa_contextos_concorrente(
+            contextos, inversor, busca_cliente, append_daily_generation
         )
-        if ultima_informacao and ultima_informacao.ultima_geracao is not None:
-            ultimo_dia = ultima_informacao.ultima_geracao.date()
-        else:
-            ultimo_dia = False
+    finally:
+        for data in contextos:
+            data['clientes'] = clientes[id(data)]
 
-    except ClienteInfo.DoesNotExist:
-        try:
-            t.sleep(5)
-            queryset = Geracao.objects.filter(
-                Q(cliente__plant_id=cliente.plant_id)
-                & Q(cliente__plant_name=cliente.plant_name)
-                & Q(energystamp__gt=0)
-            )
+    registra_buscas_diarias(planos, ultimas_informacoes)
 
-            # Verifique se há registros no queryset
-            if queryset.exists():
-                ultima_informacao = queryset.latest('timestamp')
-                ultimo_dia = ultima_informacao.timestamp.date()
-            else:
-                # Se não houver registros com energystamp > 0, crie uma linha fictícia
-                ultimo_dia = datetime(2001, 1, 1).date()
-                ultimo_dia = ultimo_dia.replace(
-                    tzinfo=pytz.timezone('America/Sao_Paulo')
-                )
 
-            ClienteInfo.objects.update_or_create(
-                cliente=cliente, defaults={'ultima_geracao': ultimo_dia}
-            )
+def executa_geracao_completa_planejada(
+    contextos: list, inversor: str, busca_cliente
+) -> None:
+    """
+    Executa a busca de geração completa das plantas de um inversor seguindo o plano de busca.
 
-        except Geracao.DoesNotExist:
-            # Se não houver registros, crie uma linha fictícia
-            ultimo_dia = datetime(2001, 1, 1).date()
-            ultimo_dia = ultimo_dia.replace(
-                tzinfo=pytz.timezone('America/Sao_Paulo')
-            )
-            ClienteInfo.objects.update_or_create(
-                cliente=cliente, defaults={'ultima_geracao': ultimo_dia}
-            )
-            ultimo_dia = False
+    O plano (`planeja_geracao_completa`) é calculado em lote, uma única vez para as
+    plantas de todas as credenciais, e cada planta é buscada apenas nos meses faltantes.
+
+    Args:
+        contextos (list): Os dicionários `data` de cada credencial do inversor.
+
+            - clientes (list): Lista de objetos cliente da credencial.
+
+        inversor (str): Nome do inversor.
+        busca_cliente (callable): Função `(data, cliente)` que retorna ou gera a geração completa de uma planta.
+
+    Returns:
+        None
+    """
+    planos = planeja_geracao_completa(
+        [cliente for data in contextos for cliente in data['clientes']]
+    )
+    for data in contextos:
+        data['planos'] = planos
+
+    executa_contextos_concorrente(
+        contextos, inversor, busca_cliente, append_complete_generation
+    )
+
+
+def reautentica(data: dict, sessao, login) -> None:
+    """
+    Refaz o login de uma credencial cuja sessão expirou durante a busca concorrente.
 
-    return ultimo_dia
+    As threads de uma credencial compartilham `data['sess']`. O login é refeito sob
+    uma trava e apenas se a sessão ainda for a mesma que falhou, então várias threads
+    que falham ao mesmo tempo geram um único login e passam a usar a nova sessão.
+
+    Args:
+        data (dict): O dicionário `data` da credencial.
+        sessao (requests.Session): A sessão usada na requisição que falhou.
+        login (callable): A função de login do inversor, que grava a nova sessão em `data`.
+
+    Returns:
+        None
+    """
+    with data.setdefault('trava_login', threading.Lock()):
+        if data['sess'] is sessao:
+            login(data)
 
 
 def login_growatt(data: dict):
@@ -574,7 +697,7 @@ def login_growatt(data: dict):
             Deve incluir as chaves 'sess', 'api_url', 'username', e 'password'.
 
     """
-    data['sess'] = requests.Session()
+    data['sess'] = nova_sessao()
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0.0.0 Safari/537.36 Edg/116.0.1938.81'
     }
@@ -589,12 +712,76 @@ def login_growatt(data: dict):
     return data
 
 
+def lista_pagina_growatt(data: dict, pagina: int) -> dict:
+    """
+    Busca uma página da listagem de plantas da Growatt.
+
+    Args:
+        data (dict): Um dicionário contendo a sessão ('sess') e a URL da API ('api_url').
+        pagina (int): O número da página, a partir de 1.
+
+    Returns:
+        dict: A resposta da listagem, com o total de páginas em 'pages' e as plantas em 'datas'.
+    """
+    response = data['sess'].post(
+        data['api_url'] + 'selectPlant/getPlantList',
+        {
+            'currPage': str(pagina),
+            'plantType': '-1',
+            'orderType': '2',
+            'plantName': '',
+        },
+    )
+    return response.json()
+
+
+def detalha_planta_growatt(data: dict, plant: dict, inversor) -> dict:
+    """
+    Busca os detalhes de uma planta da Growatt e monta o seu dicionário de cliente.
+
+    Args:
+        data (dict): Um dicionário contendo a sessão ('sess'), a URL da API ('api_url') e 'empresa_id'.
+        plant (dict): A planta, como retornada pela listagem.
+        inversor (Inversor): O inversor Growatt.
+
+    Returns:
+        dict: O dicionário do cliente, no formato esperado por 'append_clientes'.
+    """
+    response = data['sess'].post(
+        data['api_url'] + 'plantbC/plantInfo/getPlantTotal',
+        {'plantId': plant['id']},
+    )
+
+    if response.status_code != 500:
+        detalhes = response.json()['obj']
+        energy_total = f"{detalhes['eTotal']} kwh"
+        latitude = detalhes['plant_lat']
+        longitude = detalhes['plant_lng']
+    else:
+        energy_total = 0
+        latitude = 0
+        longitude = 0
+
+    return {
+        'inverter': inversor,
+        'plant_id': plant['id'],
+        'plant_name': plant['plantName'],
+        'energy_today': f"{plant['eToday']} kwh",
+        'energy_total': energy_total,
+        'latitude': latitude,
+        'longitude': longitude,
+        'empresa_id': data['empresa_id'],
+    }
+
+
 def atualiza_clientes_growatt(data: dict) -> None:
     """
     Atualiza informações de clientes do sistema Growatt.
 
-    Este método envia solicitações para obter a lista de plantas e, em seguida, para obter informações detalhadas de cada planta.
-    Com base nas informações obtidas, são gerados dicionários de clientes que são posteriormente enviados para o método 'append_clientes'.
+    A primeira página da listagem informa o total de páginas; as demais páginas e, em
+    seguida, os detalhes de cada planta são buscados de forma concorrente, limitados
+    pela concorrência da Growatt em `CONCORRENCIA_INVERSOR`. Os dicionários de clientes
+    gerados são enviados para o método 'append_clientes'.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -605,70 +792,90 @@ def atualiza_clientes_growatt(data: dict) -> None:
         None
 
     """
-    data['data'] = {
-        'currPage': '1',
-        'plantType': '-1',
-        'orderType': '2',
-        'plantName': '',
-    }
+    primeira = lista_pagina_growatt(data, 1)
+    paginas = [primeira] + mapeia_concorrente(
+        lambda pagina: lista_pagina_growatt(data, pagina),
+        range(2, primeira['pages'] + 1),
+        'growatt',
+    )
+    plantas = [plant for pagina in paginas for plant in pagina['datas']]
 
-    try:
-        response = data['sess'].post(
-            data['api_url'] + 'selectPlant/getPlantList', data['data']
-        )
-    except json.JSONDecodeError as e:
-        print(f'Ocorreu um erro ao decodificar o JSON - Growatt: {e}')
-        print(response.json())
+    inversor = CACHE_INVERSORES.obtem('growatt')
+    clientes = mapeia_concorrente(
+        lambda plant: detalha_planta_growatt(data, plant, inversor),
+        plantas,
+        'growatt',
+    )
 
-    clientes = []
+    append_clientes(clientes)
+
+
+def busca_geracao_growatt(data: dict, cliente):
+    """
+    Busca a geração completa (valores diários por mês) de uma planta Growatt.
 
-    # Obtenha o número total de páginas na primeira resposta
-    total_pages = response.json()['pages']
+    Os registros são gerados mês a mês, nos meses do plano do cliente
+    (`planeja_geracao_completa`), sem acumular o histórico em memória.
 
-    # Itere sobre todas as páginas
-    for page in range(1, total_pages + 1):
-        # Atualize a página atual na solicitação de dados
-        data['data']['currPage'] = str(page)
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Growatt a ser buscada.
+
+    Yields:
+        tuple: `(cliente_id, data, geração)` de cada dia, prontos para `append_complete_generation`.
+    """
+    for day in meses_do_plano(data['planos'][cliente.pk]):
+        payload = {'plantId': cliente.plant_id}
 
-        # Envie a solicitação
         response = data['sess'].post(
-            data['api_url'] + 'selectPlant/getPlantList', data['data']
+            data['api_url'] + 'panel/getDevicesByPlant', data=payload
         )
+        tipo_instalacao = ''
+
+        if 'obj' in response.json():
+            obj = response.json()['obj']
+            if 'max' in obj:
+                tlxSn = obj['max'][0][0]
+                tipo_instalacao = 'comercial'
+            elif 'tlx' in obj:
+                tlxSn = obj['tlx'][0][0]
+                tipo_instalacao = 'residencial'
+                payload['tlxSn'] = tlxSn
+            else:
+                printl('ERRO INTERNO NO JSON', response.json())
+                break
+        else:
+            printl('ERRO EXTERNO NO JSON', response.json())
 
-        # Gere o dicionário de plantas
-        for plant in response.json()['datas']:
-            data['json_data'] = {'plantId': plant['id']}
-            # print(plant['id'])
-
-            response_interno = data['sess'].post(
-                data['api_url'] + 'plantbC/plantInfo/getPlantTotal',
-                data['json_data'],
-            )
+        payload['date'] = day.strftime('%Y-%m')
 
-            if response_interno.status_code != 500:
-                energy_total = (
-                    f"{response_interno.json()['obj']['eTotal']} kwh"
+        try:
+            if tipo_instalacao == 'comercial':
+                response = data['sess'].post(
+                    data['api_url'] + 'indexbC/inv/getInvEnergyMonthChart',
+                    data=payload,
                 )
-                latitude = response_interno.json()['obj']['plant_lat']
-                longitude = response_interno.json()['obj']['plant_lng']
+                registros = response.json()['obj'].get('energy')
             else:
-                energy_total = 0
-                latitude = 0
-                longitude = 0
-
-            cliente = {
-                'inverter': Inversor.objects.get(name='growatt'),
-                'plant_id': plant['id'],
-                'plant_name': plant['plantName'],
-                'energy_today': f"{plant['eToday']} kwh",
-                'energy_total': energy_total,
-                'latitude': latitude,
-                'longitude': longitude,
-                'empresa_id': data['empresa_id'],
-            }
-            clientes.append(cliente)
+                response = data['sess'].post(
+                    data['api_url'] + 'panel/tlx/getTLXEnergyMonthChart',
+                    data=payload,
+                )
+                registros = response.json()['obj']['charts'].get('energy')
+        except json.decoder.JSONDecodeError:
+            # Se ocorrer um erro ao decodificar o JSON, faça algo aqui
+            printl('Erro ao decodificar o JSON GROWATT', response.text)
+            registros = None
 
-    append_clientes(clientes)
+        printl(cliente.plant_name, payload)
+
+        if not registros:
+            continue
+
+        # Percorre os dias do mês do mais recente para o mais antigo
+        for dia in range(len(registros), 0, -1):
+            date = datetime(day.year, day.month, dia)
+            yield (cliente.pk, date, f'{registros[dia - 1]} kwh')
 
 
 def atualiza_geracao_growatt(data: dict) -> None:
@@ -677,6 +884,7 @@ def atualiza_geracao_growatt(data: dict) -> None:
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Growatt. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_completa_planejada`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -691,135 +899,43 @@ def atualiza_geracao_growatt(data: dict) -> None:
         None
 
     """
-    generation = []
-    generation_complete_enumerate = []
-
-    max_empty_months = 4
-
-    for cliente in data['clientes']:
-
-        empty_months = 0
-
-        day = datetime.now()
-        encerrar_loop = False
-
-        ultimo_dia = buscar_ultima_informacao_completa(cliente)
-
-        while empty_months < max_empty_months:
-
-            if encerrar_loop:
-                break
-
-            data['data'] = {'plantId': cliente.plant_id}
-
-            response = data['sess'].post(
-                data['api_url'] + 'panel/getDevicesByPlant', data=data['data']
-            )
-            tipo_instalacao = ''
-
-            if 'obj' in response.json():
-                obj = response.json()['obj']
-                if 'max' in obj:
-                    tlxSn = obj['max'][0][0]
-                    tipo_instalacao = 'comercial'
-                elif 'tlx' in obj:
-                    tlxSn = obj['tlx'][0][0]
-                    tipo_instalacao = 'residencial'
-                    data['data']['tlxSn'] = tlxSn
-                else:
-                    printl('ERRO INTERNO NO JSON', response.json())
-                    break
-            else:
-                printl('ERRO EXTERNO NO JSON', response.json())
-
-            data['data']['date'] = day.strftime('%Y-%m')
-
-            try:
-                if tipo_instalacao == 'comercial':
-                    response = data['sess'].post(
-                        data['api_url'] + 'indexbC/inv/getInvEnergyMonthChart',
-                        data=data['data'],
-                    )
-                    printl('JSON COMERCIAL ID', cliente.plant_id, data['data'])
-                    printl('JSON COMERCIAL', response.json())
-                    registros = response.json()['obj'].get('energy')
-                else:
-                    response = data['sess'].post(
-                        data['api_url'] + 'panel/tlx/getTLXEnergyMonthChart',
-                        data=data['data'],
-                    )
-                    printl(
-                        'JSON RESIDENCIAL ID', cliente.plant_id, data['data']
-                    )
-                    printl('JSON RESIDENCIAL', response.json())
-                    registros = response.json()['obj']['charts'].get('energy')
-            except json.decoder.JSONDecodeError:
-                # Se ocorrer um erro ao decodificar o JSON, faça algo aqui
-                printl('Erro ao decodificar o JSON GROWATT', response.text)
-
-            printl(cliente.plant_name, data['data'], empty_months)
-
-            # t.sleep(5)
-            # printl(response.json())
-
-            if not registros:
-                break
-
-            if all(item is None or item == 0.0 for item in registros):
-                empty_months += 1
-            else:
-                empty_months = 0
-
-            # Iterar sobre os dados de energia
-            for dia, energy in enumerate(registros, start=1):
-
-                # Obtenha o ano e o mês de 'day'
-                year = day.year
-                month = day.month
+    executa_geracao_completa_planejada(
+        [data], 'growatt', busca_geracao_growatt
+    )
 
-                # Crie um objeto datetime para o dia do mês
-                date = datetime(year, month, dia)
 
-                # Crie o dicionário com a data e a geração de energia
-                geracao_completa = {
-                    'date': date,
-                    'generation': energy,
-                }
+def busca_geracao_diaria_growatt(data: dict, cliente):
+    """
+    Busca a geração diária (gráfico horário) de uma planta Growatt.
 
-                # Adicione o dicionário à lista
-                generation_complete_enumerate.append(geracao_completa)
+    Os registros são gerados dia a dia, nos dias do plano do cliente
+    (`planeja_geracao_diaria`), sem acumular o histórico em memória.
 
-            # Ordenando a lista de tuplas pelo primeiro elemento em ordem decrescente
-            sorted_data = sorted(
-                generation_complete_enumerate,
-                key=lambda x: x['date'],
-                reverse=True,
-            )
-            generation_complete_enumerate = []
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Growatt a ser buscada.
 
-            for dados in sorted_data:
-                data_obj = dados['date']
-                if ultimo_dia and (
-                    data_obj.date() < (ultimo_dia - timedelta(days=2))
-                ):
-                    encerrar_loop = True
-                    break
+    Yields:
+        tuple: `(cliente_id, timestamp, geração)` de cada intervalo de 5 minutos, prontos para `append_daily_generation`.
+    """
+    for day in dias_do_plano(data['planos'][cliente.pk]):
+        payload = {
+            'plantId': cliente.plant_id,
+            'date': day.strftime('%Y-%m-%d'),
+        }
+        response = data['sess'].post(
+            data['api_url'] + 'indexbC/inv/getInvEnergyDayChart',
+            data=payload,
+        )
 
-                generation.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': f"{dados['generation']} kwh",
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation) > LIMITE:
-                    append_complete_generation(generation)
-                    generation = []
-            day -= relativedelta(months=1)
+        # 'pac' é a lista de 288 registros (um a cada 5 minutos)
+        registros = response.json()['obj'].get('pac')
+        if not registros:
+            continue
 
-    append_complete_generation(generation)
+        # Percorre os intervalos do mais recente para o mais antigo
+        for i in range(len(registros) - 1, -1, -1):
+            yield (cliente.pk, day + timedelta(minutes=i * 5), registros[i])
 
 
 def atualiza_geracao_diaria_growatt(data: dict) -> None:
@@ -828,6 +944,7 @@ def atualiza_geracao_diaria_growatt(data: dict) -> None:
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Growatt. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_diaria`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -842,97 +959,7 @@ def atualiza_geracao_diaria_growatt(data: dict) -> None:
         None
 
     """
-
-    generation_day = []
-    generation_day_enumerate = []
-    max_empty_days = 60
-
-    for cliente in data['clientes']:
-
-        empty_days = 0
-
-        day = datetime.now()
-        encerrar_loop = False
-
-        ultimo_dia = buscar_ultima_informacao_diaria(cliente)
-
-        while empty_days < max_empty_days:
-            if encerrar_loop:
-                break
-
-            data['data'] = {
-                'plantId': cliente.plant_id,
-                'date': day.strftime('%Y-%m-%d'),
-            }
-            # t.sleep(2)
-            # printl(cliente.plant_name, data['data'], empty_days)
-            response = data['sess'].post(
-                data['api_url'] + 'indexbC/inv/getInvEnergyDayChart',
-                data=data['data'],
-            )
-            # t.sleep(10)
-            # printl(cliente.plant_name, response.json())
-            if not response.json()['obj'].get('pac'):
-                break
-
-            # Suponha que 'pac' é a lista de 288 registros
-            registros = response.json()['obj'].get('pac')
-            # Verifique se todos os registros são None
-            if all(item is None for item in registros):
-                empty_days += 1
-            else:
-                empty_days = 0
-            # printl(response.json())
-            # Data inicial (meia-noite do dia atual)
-            start_time = datetime.strptime(
-                day.strftime('%Y-%m-%d'), '%Y-%m-%d'
-            )
-
-            # Iterar sobre os dados de geração de energia
-            for i, generation in enumerate(response.json()['obj']['pac']):
-
-                # Calcular o timestamp para este intervalo de tempo
-                timestamp = start_time + timedelta(minutes=i * 5)
-
-                # Criar o objeto GeracaoDiaria
-                geracao_diaria = {
-                    'date': timestamp,
-                    'generation': generation,
-                }
-
-                # Adicionar à lista
-                generation_day_enumerate.append(geracao_diaria)
-            # printl(generation_day_enumerate)
-            # Ordenando a lista de tuplas pelo primeiro elemento em ordem decrescente
-            sorted_data = sorted(
-                generation_day_enumerate, key=lambda x: x['date'], reverse=True
-            )
-            generation_day_enumerate = []
-            # printl(sorted_data)
-            for dados in sorted_data:
-                dia = dados['date']
-                # printl(cliente.plant_id, ultimo_dia, dia)
-                if ultimo_dia and (
-                    dia.astimezone(pytz.timezone('America/Sao_Paulo'))
-                    < (ultimo_dia - timedelta(hours=2))
-                ):
-                    encerrar_loop = True
-                    break
-                generation_day.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': dia,
-                        'generation': dados['generation'],
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation_day) > LIMITE:
-                    append_daily_generation(generation_day)
-                    generation_day = []
-            day -= relativedelta(days=1)
-
-    append_daily_generation(generation_day)
+    executa_geracao_diaria([data], 'growatt', busca_geracao_diaria_growatt)
 
 # TODO: Getting these values directly from the files by the Sungrow API is better than hardcoding them...
 LOGIN_RSA_PUBLIC_KEY: asymmetric.rsa.RSAPublicKey = serialization.load_pem_public_key(b"-----BEGIN PUBLIC KEY-----\nMIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQDJRGV7eyd9peLPOIqFg3oionWqpmrjVik2wyJzWqv8it3yAvo/o4OR40ybrZPHq526k6ngvqHOCNJvhrN7wXNUEIT+PXyLuwfWP04I4EDBS3Bn3LcTMAnGVoIka0f5O6lo3I0YtPWwnyhcQhrHWuTietGC0CNwueI11Juq8NV2nwIDAQAB\n-----END PUBLIC KEY-----")
@@ -990,13 +1017,13 @@ class SungrowScraper:
         self.gatewayUrl = "https://gateway.isolarcloud.com.hk"
         self.username = username
         self.password = password
-        self.session: "requests.Session" = requests.session()
+        self.session: "requests.Session" = nova_sessao()
         self.userToken: "str|None" = None
         #TODO: Alterar orgId para contemplar também userId
         self.userId: "int|None" = None
 
     def login(self):
-        self.session = requests.session()
+        self.session = nova_sessao()
         resp = self.session.post(
             f"{self.baseUrl}/userLoginAction_login",
             data={
@@ -1098,7 +1125,7 @@ def atualiza_clientes_sungrow(data):
 
     for plant in plants:
         cliente = {
-            'inverter': Inversor.objects.get(name='sungrow'),
+            'inverter': CACHE_INVERSORES.obtem('sungrow'),
             'plant_id': plant['ps_id'],
             'plant_name': plant['ps_name'],
             'energy_today': f'{plant["today_energy"]["value"]} {plant["today_energy"]["unit"]}',
@@ -1113,105 +1140,64 @@ def atualiza_clientes_sungrow(data):
     append_clientes(clientes)
 
 
-def atualiza_geracao_diaria_sungrow(data):
+def busca_geracao_diaria_sungrow(data: dict, cliente) -> list:
     """
-    Atualiza as informações de geração de energia diária (gráfico horário) para clientes Sungrow.
-
-    Esta função realiza requisições para obter informações mensais sobre a geração
-    de energia de clientes Sungrow. Os dados são processados e armazenados.
+    Busca a geração diária (gráfico horário) de uma planta Sungrow.
 
     Args:
-        data (dict): Um dicionário contendo informações necessárias para a atualização.
-        
-            - sess (requests.Session): Sessão para realizar as requisições.
-            
-            - api_url (str): URL da API Sungrow.
-            
-            - clientes (list): Lista de objetos cliente Sungrow.
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Sungrow a ser buscada.
 
     Returns:
-        None
-
+        list: Registros de geração diária da planta, prontos para `append_daily_generation`.
     """
     # TODO: Lembrar de alterar 'data' para trazer o id do cliente, para facilitar a busca
     generation_day = []
 
-    max_empty_days = 90
-
-    for cliente in data['clientes']:
+    for dia in dias_do_plano(data['planos'][cliente.pk]):
+        formatted_date = dia.strftime('%Y%m%d')
 
-        empty_days = 0
-
-        dia = datetime.now()
-        encerrar_loop = False
-
-        ultimo_dia = buscar_ultima_informacao_diaria(cliente)
-
-        while empty_days < max_empty_days:
-
-            if encerrar_loop == True:
-                break
-
-            formatted_date = dia.strftime('%Y%m%d')
-
-            data['json'].update(
-                {
-                    'ps_id': cliente.plant_id,
-                    'date_id': formatted_date,
-                    'date_type': '1',
-                }
-            )
-
-            response = data['s'].post(
-                '/v1/powerStationService/getHouseholdStoragePsReport',
-                jsn=data['json'],
-            )
-            response = json.loads(response)
+        payload = {
+            **data['json'],
+            'ps_id': cliente.plant_id,
+            'date_id': formatted_date,
+            'date_type': '1',
+        }
 
-            if not response['result_data']['day_data']['point_data_15_list']:
-                empty_days += 1
+        response = data['s'].post(
+            '/v1/powerStationService/getHouseholdStoragePsReport',
+            jsn=payload,
+        )
+        response = json.loads(response)
 
-            else:
-                empty_days = 0
-                # Ordenando a lista de tuplas pelo primeiro elemento em ordem decrescente
-                sorted_data = sorted(
-                    response['result_data']['day_data']['point_data_15_list'],
-                    key=lambda x: x['time_stamp'],
-                    reverse=True,
-                )
-                for energy in sorted_data:
-                    data_obj = datetime.strptime(
-                        energy['time_stamp'], '%Y%m%d%H%M%S'
-                    )
-                    if ultimo_dia and (
-                        data_obj.astimezone(pytz.timezone('America/Sao_Paulo'))
-                        < (ultimo_dia - timedelta(hours=2))
-                    ):
-                        encerrar_loop = True
-                        break
-                    generation_day.append(
-                        {
-                            'plant_id': cliente.plant_id,
-                            'plant_name': cliente.plant_name,
-                            'date': data_obj,
-                            'generation': energy['p83076'],
-                            'cliente': cliente,
-                        }
-                    )
-                    if len(generation_day) > LIMITE:
-                        append_daily_generation(generation_day)
-                        generation_day = []
-            dia -= relativedelta(days=1)
+        # Ordenando a lista de tuplas pelo primeiro elemento em ordem decrescente
+        sorted_data = sorted(
+            response['result_data']['day_data']['point_data_15_list'] or [],
+            key=lambda x: x['time_stamp'],
+            reverse=True,
+        )
+        for energy in sorted_data:
+            data_obj = datetime.strptime(energy['time_stamp'], '%Y%m%d%H%M%S')
+            generation_day.append(
+                {
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': data_obj,
+                    'generation': energy['p83076'],
+                    'cliente': cliente,
+                }
+            )
 
-    append_daily_generation(generation_day)
+    return generation_day
 
 
-def atualiza_geracao_sungrow(data):
+def atualiza_geracao_diaria_sungrow(data):
     """
-    Atualiza as informações de geração de energia para clientes Sungrow.
+    Atualiza as informações de geração de energia diária (gráfico horário) para clientes Sungrow.
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Sungrow. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_diaria`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -1224,90 +1210,88 @@ def atualiza_geracao_sungrow(data):
 
     Returns:
         None
+
     """
+    executa_geracao_diaria([data], 'sungrow', busca_geracao_diaria_sungrow)
 
-    generation = []
 
-    max_empty_months = 4
+def busca_geracao_sungrow(data: dict, cliente) -> list:
+    """
+    Busca a geração completa (valores diários por mês) de uma planta Sungrow.
 
-    for cliente in data['clientes']:
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Sungrow a ser buscada.
 
-        empty_months = 0
+    Returns:
+        list: Registros de geração completa da planta, prontos para `append_complete_generation`.
+    """
+    generation = []
 
-        dia = datetime.now()
-        encerrar_loop = False
+    for dia in meses_do_plano(data['planos'][cliente.pk]):
+        formatted_date = dia.strftime('%Y%m')
 
-        ultimo_dia = buscar_ultima_informacao_completa(cliente)
+        payload = {
+            **data['json'],
+            'ps_id': cliente.plant_id,
+            'date_id': formatted_date,
+            'date_type': '2',
+        }
 
-        while empty_months < max_empty_months:
+        response = data['s'].post(
+            '/v1/powerStationService/getHouseholdStoragePsReport',
+            jsn=payload,
+        )
+        response = json.loads(response)
 
-            if encerrar_loop:
-                break
+        dias = response['result_data']['month_data']['month_data_day_list']
+        for item in dias or []:
+            item['date_id'] = datetime.strptime(str(item['date_id']), '%Y%m%d')
 
-            formatted_date = dia.strftime('%Y%m')
+        # Ordenando a lista de tuplas pelo primeiro elemento em ordem decrescente
+        sorted_data = sorted(
+            dias or [],
+            key=lambda x: x['date_id'],
+            reverse=True,
+        )
 
-            data['json'].update(
+        for day in sorted_data:
+            generation.append(
                 {
-                    'ps_id': cliente.plant_id,
-                    'date_id': formatted_date,
-                    'date_type': '2',
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': day['date_id'],
+                    'generation': day['p83022'],
+                    'cliente': cliente,
                 }
             )
 
-            response = data['s'].post(
-                '/v1/powerStationService/getHouseholdStoragePsReport',
-                jsn=data['json'],
-            )
-            response = json.loads(response)
-
-            if not response['result_data']['month_data'][
-                'month_data_day_list'
-            ]:
-                empty_months += 1
-            else:
-                empty_months = 0
-
-                for item in response['result_data']['month_data'][
-                    'month_data_day_list'
-                ]:
-                    item['date_id'] = datetime.strptime(
-                        str(item['date_id']), '%Y%m%d'
-                    )
-
-                # Ordenando a lista de tuplas pelo primeiro elemento em ordem decrescente
-                sorted_data = sorted(
-                    response['result_data']['month_data'][
-                        'month_data_day_list'
-                    ],
-                    key=lambda x: x['date_id'],
-                    reverse=True,
-                )
+    return generation
 
-                for day in sorted_data:
 
-                    data_obj = day['date_id']
+def atualiza_geracao_sungrow(data):
+    """
+    Atualiza as informações de geração de energia para clientes Sungrow.
 
-                    if ultimo_dia and (
-                        data_obj.date() < (ultimo_dia - timedelta(days=2))
-                    ):
-                        encerrar_loop = True
-                        break
+    Esta função realiza requisições para obter informações mensais sobre a geração
+    de energia de clientes Sungrow. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_completa_planejada`.
 
-                    generation.append(
-                        {
-                            'plant_id': cliente.plant_id,
-                            'plant_name': cliente.plant_name,
-                            'date': data_obj,
-                            'generation': day['p83022'],
-                            'cliente': cliente,
-                        }
-                    )
-                    if len(generation) > LIMITE:
-                        append_complete_generation(generation)
-                        generation = []
-            dia -= relativedelta(months=1)
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a atualização.
+        
+            - sess (requests.Session): Sessão para realizar as requisições.
+            
+            - api_url (str): URL da API Sungrow.
+            
+            - clientes (list): Lista de objetos cliente Sungrow.
 
-    append_complete_generation(generation)
+    Returns:
+        None
+    """
+    executa_geracao_completa_planejada(
+        [data], 'sungrow', busca_geracao_sungrow
+    )
 
 
 # TODO: Goodwe vai precisar de um token. Verificar e ajustar futuramente.
@@ -1326,7 +1310,7 @@ def login_abb_fimer(data):
         None
 
     """
-    data['sess'] = requests.Session()
+    data['sess'] = nova_sessao()
 
     params = {
         'setCookie': 'true',
@@ -1426,7 +1410,7 @@ def atualiza_clientes_abb_fimer(data):
         plant['energy_total'] = response.json()[0].get('value', 0)
 
         cliente = {
-            'inverter': Inversor.objects.get(name='abb_fimer'),
+            'inverter': CACHE_INVERSORES.obtem('abb_fimer'),
             'plant_id': plant['id'],
             'plant_name': plant['name'],
             'energy_today': f'{plant["energy_today"]} kwh',
@@ -1440,12 +1424,59 @@ def atualiza_clientes_abb_fimer(data):
     append_clientes(clientes)
 
 
+def busca_geracao_diaria_abb_fimer(data: dict, cliente):
+    """
+    Busca a geração diária (gráfico horário) de uma planta ABB Fimer.
+
+    Os registros são gerados dia a dia, nos dias do plano do cliente
+    (`planeja_geracao_diaria`), sem acumular o histórico em memória.
+
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta ABB Fimer a ser buscada.
+
+    Yields:
+        tuple: `(cliente_id, timestamp, geração)` de cada intervalo, prontos para `append_daily_generation`.
+    """
+    for dia in dias_do_plano(data['planos'][cliente.pk]):
+        formatted_today = dia.strftime('%Y-%m-%d')
+
+        params = {
+            'agp': 'Min15',
+            'afx': 'Avg',
+            'sdt': f'{formatted_today}T00:00:00.000Z',
+            'edt': f'{formatted_today}T23:59:59.999Z',
+        }
+
+        url = f'{data["api_url"]}/telemetry/v1/plants/{cliente.plant_id}/power/GenerationPower'
+        sessao = data['sess']
+        response = sessao.get(url, params=params)
+        if response.status_code == 502:
+            # O adaptador já repetiu o 502 com espera; o que resta é sessão expirada
+            print('ABB FIMER - Geração diária. Erro 502, refazendo o login.')
+            reautentica(data, sessao, login_abb_fimer)
+            response = data['sess'].get(url, params=params)
+
+        try:
+            itens = response.json()
+        except ValueError:
+            print(response.text)
+            itens = []
+
+        for item in itens:
+            data_obj = datetime.strptime(
+                item['start'], '%Y-%m-%dT%H:%M:%S%z'
+            )
+            yield (cliente.pk, data_obj, item.get('value', 0))
+
+
 def atualiza_geracao_diaria_abb_fimer(data):
     """
     Atualiza as informações de geração de energia diária (gráfico horário) para clientes ABB Fimer.
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes ABB Fimer. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_diaria`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -1460,127 +1491,61 @@ def atualiza_geracao_diaria_abb_fimer(data):
         None
 
     """
-    generation_day = []
-
-    max_empty_days = 90
-
-    for cliente in data['clientes']:
-
-        empty_days = 0
+    executa_geracao_diaria([data], 'abb_fimer', busca_geracao_diaria_abb_fimer)
 
-        dia = datetime.now()
-        encerrar_loop = False
 
-        ultimo_dia = buscar_ultima_informacao_diaria(cliente)
-
-        while empty_days < max_empty_days:
-
-            if encerrar_loop == True:
-                break
-
-            formatted_today = dia.strftime('%Y-%m-%d')
-
-            params = {
-                'agp': 'Min15',
-                'afx': 'Avg',
-                'sdt': f'{formatted_today}T00:00:00.000Z',
-                'edt': f'{formatted_today}T23:59:59.999Z',
-            }
-
-            def busca_geracao_diaria() -> requests.Response:
-                """
-                Busca informações de geração diária para um cliente específico.
-
-                Esta função realiza até 10 tentativas de obter informações de geração diária
-                para um cliente específico da API ABB FIMER. Caso obtenha sucesso, retorna a
-                resposta da requisição. Se ocorrer um erro 502, a função tenta reconectar-se
-                através da função login_abb_fimer().
-
-                Args:
-                    data (dict): Um dicionário contendo informações necessárias para a busca.
-                    
-                        - sess (requests.Session): Sessão para realizar as requisições.
-                        
-                        - api_url (str): URL da API ABB FIMER.
-                        
-                    cliente (Cliente): Um objeto cliente específico para o qual deseja-se obter as informações.
-
-                Returns:
-                    requests.Response: Resposta da requisição HTTP para a API ABB FIMER.
-
-                Raises:
-                    Exception: Se ocorrer um erro durante as tentativas de requisição.
-
-                """
+def busca_geracao_abb_fimer(data: dict, cliente):
+    """
+    Busca a geração completa (valores diários por mês) de uma planta ABB Fimer.
 
-                tentativas = 0
-                max_tentativas = 10
+    Os registros são gerados mês a mês, nos meses do plano do cliente
+    (`planeja_geracao_completa`), sem acumular o histórico em memória.
 
-                while tentativas < max_tentativas:
-                    try:
-                        response = data['sess'].get(
-                            f'{data["api_url"]}/telemetry/v1/plants/{cliente.plant_id}/power/GenerationPower',
-                            params=params,
-                        )
-                        if response.status_code == 502:
-                            raise Exception('Erro 502.')
-                        else:
-                            break
-                    except Exception as e:
-                        print(
-                            f'ABB FIMER - Geração diária. Ocorreu um erro: {e}'
-                        )
-                        login_abb_fimer()
-                    tentativas += 1
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta ABB Fimer a ser buscada.
 
-                return response
+    Yields:
+        tuple: `(cliente_id, data, geração)` de cada dia, prontos para `append_complete_generation`.
+    """
+    tz = pytz.timezone('America/Sao_Paulo')
 
-            response = busca_geracao_diaria()
+    for dia in meses_do_plano(data['planos'][cliente.pk]):
+        _, last_day = calendar.monthrange(dia.year, dia.month)
+        first_day_of_month = dia.replace(day=1)
 
-            soma_dia = 0
+        last_day_of_month = dia.replace(day=last_day)
 
-            try:
-                sorted_data = sorted(
-                    response.json(), key=lambda x: x['start'], reverse=True
-                )
-            except:
-                print(response.json())
+        start_time = tz.localize(
+            datetime.combine(first_day_of_month, time.min)
+        )
+        end_time = tz.localize(
+            datetime.combine(last_day_of_month, time.max)
+        )
 
-            for item in sorted_data:
-                if 'value' not in item:
-                    item['value'] = 0
+        utc_start_time = start_time.astimezone(pytz.utc)
+        utc_end_time = end_time.astimezone(pytz.utc)
 
-                soma_dia += float(item['value'])
-                data_obj = datetime.strptime(
-                    item['start'], '%Y-%m-%dT%H:%M:%S%z'
-                )
-                if ultimo_dia and (
-                    data_obj.astimezone(pytz.timezone('America/Sao_Paulo'))
-                    < (ultimo_dia - timedelta(hours=2))
-                ):
-                    encerrar_loop = True
-                    break
-                generation_day.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': item['value'],
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation_day) > LIMITE:
-                    append_daily_generation(generation_day)
-                    generation_day = []
+        sdt = utc_start_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        edt = utc_end_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
 
-            if soma_dia == 0:
-                empty_days += 1
-            else:
-                empty_days = 0
+        params = {
+            'agp': 'Day',
+            'afx': 'Delta',
+            'sdt': sdt,
+            'edt': edt,
+        }
 
-            dia -= relativedelta(days=1)
+        response = data['sess'].get(
+            f'{data["api_url"]}/telemetry/v1/plants/{cliente.plant_id}/energy/GenerationEnergy',
+            params=params,
+        )
 
-    append_daily_generation(generation_day)
+        for item in response.json():
+            data_obj = datetime.strptime(
+                item['start'], '%Y-%m-%dT%H:%M:%S%z'
+            )
+            yield (cliente.pk, data_obj, f"{item.get('value', 0)} kwh")
 
 
 def atualiza_geracao_abb_fimer(data):
@@ -1589,6 +1554,7 @@ def atualiza_geracao_abb_fimer(data):
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes ABB Fimer. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_completa_planejada`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -1602,97 +1568,9 @@ def atualiza_geracao_abb_fimer(data):
     Returns:
         None
     """
-
-    generation = []
-
-    max_empty_months = 4
-
-    for cliente in data['clientes']:
-
-        empty_months = 0
-
-        tz = pytz.timezone('America/Sao_Paulo')
-
-        dia = datetime.now()
-        encerrar_loop = False
-
-        ultimo_dia = buscar_ultima_informacao_completa(cliente)
-
-        while empty_months < max_empty_months:
-
-            if encerrar_loop:
-                break
-
-            _, last_day = calendar.monthrange(dia.year, dia.month)
-            first_day_of_month = dia.replace(day=1)
-
-            last_day_of_month = dia.replace(day=last_day)
-
-            start_time = tz.localize(
-                datetime.combine(first_day_of_month, time.min)
-            )
-            end_time = tz.localize(
-                datetime.combine(last_day_of_month, time.max)
-            )
-
-            utc_start_time = start_time.astimezone(pytz.utc)
-            utc_end_time = end_time.astimezone(pytz.utc)
-
-            sdt = utc_start_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-            edt = utc_end_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-
-            params = {
-                'agp': 'Day',
-                'afx': 'Delta',
-                'sdt': sdt,
-                'edt': edt,
-            }
-
-            response = data['sess'].get(
-                f'{data["api_url"]}/telemetry/v1/plants/{cliente.plant_id}/energy/GenerationEnergy',
-                params=params,
-            )
-
-            soma_dia = 0
-
-            sorted_data = sorted(
-                response.json(), key=lambda x: x['start'], reverse=True
-            )
-
-            for item in sorted_data:
-                if 'value' not in item:
-                    item['value'] = 0
-                data_obj = datetime.strptime(
-                    item['start'], '%Y-%m-%dT%H:%M:%S%z'
-                )
-                if ultimo_dia and (
-                    data_obj.date() < (ultimo_dia - timedelta(days=2))
-                ):
-                    encerrar_loop = True
-                    break
-
-                generation.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': f"{item['value']} kwh",
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation) > LIMITE:
-                    append_complete_generation(generation)
-                    generation = []
-                soma_dia += item['value']
-
-            if soma_dia == 0:
-                empty_months += 1
-            else:
-                empty_months = 0
-
-            dia -= relativedelta(months=1)
-
-    append_complete_generation(generation)
+    executa_geracao_completa_planejada(
+        [data], 'abb_fimer', busca_geracao_abb_fimer
+    )
 
 
 def login_fronius(data):
@@ -1711,7 +1589,7 @@ def login_fronius(data):
     api_url = data['api_url']
 
     # Inicia uma sessão
-    data['sess'] = requests.Session()
+    data['sess'] = nova_sessao()
 
     # Obtém o sessionDataKey da página de login
     response = data['sess'].get(f'{api_url}/Account/ExternalLogin')
@@ -1817,14 +1695,16 @@ def atualiza_clientes_fronius(data):
         address = f'{rua.group(1)}, {cidade.group(1)}, {cep.group(1)}'
         geo_url = f'https://geocode.maps.co/search?q={address}&api_key={GEOCODE_API}'
 
-        t.sleep(1.1)
-        location = requests.get(geo_url.format(address=quote(address)))
+        location = nova_sessao().get(
+            geo_url.format(address=quote(address))
+        )
 
         if location.text == '[]':
             address = f'{rua.group(1)}'
             geo_url = f'https://geocode.maps.co/search?q={address}&api_key={GEOCODE_API}'
-            t.sleep(1.1)
-            location = requests.get(geo_url.format(address=quote(address)))
+            location = nova_sessao().get(
+                geo_url.format(address=quote(address))
+            )
 
         plant['latitude'] = 0 if location.text == '[]' else location.json()[0]['lat']
         plant['longitude'] = 0 if location.text == '[]' else location.json()[0]['lon']
@@ -1850,7 +1730,7 @@ def atualiza_clientes_fronius(data):
     # Cria registros de clientes com as informações obtidas
     for plant in plants:
         cliente = {
-            'inverter': Inversor.objects.get(name='fronius'),
+            'inverter': CACHE_INVERSORES.obtem('fronius'),
             'plant_id': plant['id'],
             'plant_name': plant['name'],
             'energy_today': plant['energy_today'],
@@ -1865,12 +1745,64 @@ def atualiza_clientes_fronius(data):
     append_clientes(clientes)
 
 
+def busca_geracao_diaria_fronius(data: dict, cliente) -> list:
+    """
+    Busca a geração diária (gráfico horário) de uma planta Fronius.
+
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Fronius a ser buscada.
+
+    Returns:
+        list: Registros de geração diária da planta, prontos para `append_daily_generation`.
+    """
+    generation_day = []
+
+    for dia in dias_do_plano(data['planos'][cliente.pk]):
+        params = {
+            'pvSystemId': cliente.plant_id,
+            'year': dia.year,
+            'month': dia.month,
+            'day': dia.day,
+            'interval': 'day',
+            'view': 'production',
+        }
+
+        response = data['sess'].get(
+            f'{data["api_url"]}/Chart/GetChartNew', params=params
+        )
+
+        if not response.json()['settings']['series']:
+            continue
+
+        sorted_data = sorted(
+            response.json()['settings']['series'][0]['data'],
+            key=lambda x: x[0],
+            reverse=True,
+        )
+
+        for timestamp, energia in sorted_data:
+            data_obj = datetime.fromtimestamp(timestamp / 1000)
+            generation_day.append(
+                {
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': data_obj,
+                    'generation': energia,
+                    'cliente': cliente,
+                }
+            )
+
+    return generation_day
+
+
 def atualiza_geracao_diaria_fronius(data):
     """
     Atualiza as informações de geração de energia diária (gráfico horário) para clientes Fronius.
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Fronius. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_diaria`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -1885,67 +1817,58 @@ def atualiza_geracao_diaria_fronius(data):
         None
 
     """
-    generation_day = []
-
-    for cliente in data['clientes']:
+    executa_geracao_diaria([data], 'fronius', busca_geracao_diaria_fronius)
 
-        dia = datetime.now()
-        encerrar_loop = False
 
-        ultimo_dia = buscar_ultima_informacao_diaria(cliente)
-
-        while True:
+def busca_geracao_fronius(data: dict, cliente) -> list:
+    """
+    Busca a geração completa (valores diários por mês) de uma planta Fronius.
 
-            if encerrar_loop == True:
-                break
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Fronius a ser buscada.
 
-            params = {
-                'pvSystemId': cliente.plant_id,
-                'year': dia.year,
-                'month': dia.month,
-                'day': dia.day,
-                'interval': 'day',
-                'view': 'production',
-            }
+    Returns:
+        list: Registros de geração completa da planta, prontos para `append_complete_generation`.
+    """
+    generation = []
 
-            response = data['sess'].get(
-                f'{data["api_url"]}/Chart/GetChartNew', params=params
-            )
+    for dia in meses_do_plano(data['planos'][cliente.pk]):
+        params = {
+            'pvSystemId': cliente.plant_id,
+            'year': dia.year,
+            'month': dia.month,
+            'day': dia.day,
+            'interval': 'month',
+            'view': 'production',
+        }
 
-            if not response.json()['settings']['series']:
-                break
+        response = data['sess'].get(
+            f'{data["api_url"]}/Chart/GetChartNew', params=params
+        )
+        # print(response.json())
+        if not response.json()['settings']['series']:
+            continue
+
+        sorted_data = sorted(
+            response.json()['settings']['series'][0]['data'],
+            key=lambda x: x[0],
+            reverse=True,
+        )
 
-            sorted_data = sorted(
-                response.json()['settings']['series'][0]['data'],
-                key=lambda x: x[0],
-                reverse=True,
+        for timestamp, energia in sorted_data:
+            data_obj = datetime.fromtimestamp(timestamp / 1000)
+            generation.append(
+                {
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': data_obj,
+                    'generation': f'{energia} kwh',
+                    'cliente': cliente,
+                }
             )
 
-            for timestamp, energia in sorted_data:
-                data_obj = datetime.fromtimestamp(timestamp / 1000)
-
-                if ultimo_dia and (
-                    data_obj.astimezone(pytz.timezone('America/Sao_Paulo'))
-                    < (ultimo_dia - timedelta(hours=2))
-                ):
-                    encerrar_loop = True
-                    break
-
-                generation_day.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': energia,
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation_day) > LIMITE:
-                    append_daily_generation(generation_day)
-                    generation_day = []
-            dia -= relativedelta(days=1)
-
-    append_daily_generation(generation_day)
+    return generation
 
 
 def atualiza_geracao_fronius(data):
@@ -1954,6 +1877,7 @@ def atualiza_geracao_fronius(data):
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Fronius. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_completa_planejada`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -1967,64 +1891,9 @@ def atualiza_geracao_fronius(data):
     Returns:
         None
     """
-    generation = []
-
-    for cliente in data['clientes']:
-
-        dia = datetime.now()
-        encerrar_loop = False
-
-        ultimo_dia = buscar_ultima_informacao_completa(cliente)
-
-        while True:
-
-            if encerrar_loop:
-                break
-
-            params = {
-                'pvSystemId': cliente.plant_id,
-                'year': dia.year,
-                'month': dia.month,
-                'day': dia.day,
-                'interval': 'month',
-                'view': 'production',
-            }
-
-            response = data['sess'].get(
-                f'{data["api_url"]}/Chart/GetChartNew', params=params
-            )
-            # print(response.json())
-            if not response.json()['settings']['series']:
-                break
-
-            sorted_data = sorted(
-                response.json()['settings']['series'][0]['data'],
-                key=lambda x: x[0],
-                reverse=True,
-            )
-
-            for timestamp, energia in sorted_data:
-                data_obj = datetime.fromtimestamp(timestamp / 1000)
-                if ultimo_dia and (
-                    data_obj.date() < (ultimo_dia - timedelta(days=2))
-                ):
-                    encerrar_loop = True
-                    break
-                generation.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': f'{energia} kwh',
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation) > LIMITE:
-                    append_complete_generation(generation)
-                    generation = []
-            dia -= relativedelta(months=1)
-
-    append_complete_generation(generation)
+    executa_geracao_completa_planejada(
+        [data], 'fronius', busca_geracao_fronius
+    )
 
 
 def login_refusol(data):
@@ -2044,7 +1913,7 @@ def login_refusol(data):
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
     # Inicializa uma sessão
-    data['sess'] = requests.Session()
+    data['sess'] = nova_sessao()
 
     # Define o idioma para Português
     data['sess'].cookies.update({'PL': 'pt-PT'})
@@ -2197,7 +2066,7 @@ def atualiza_clientes_refusol(data):
     # Cria objetos Cliente e os adiciona à lista de clientes
     for plant in plants:
         cliente = {
-            'inverter': Inversor.objects.get(name='refusol'),
+            'inverter': CACHE_INVERSORES.obtem('refusol'),
             'plant_id': plant['id'],
             'plant_name': plant['name'],
             'energy_today': f'{plant["energy_today"]} kwh',
@@ -2208,8 +2077,72 @@ def atualiza_clientes_refusol(data):
         }
         clientes.append(cliente)
 
-    # Adiciona os clientes atualizados ao sistema
-    append_clientes(clientes)
+    # Adiciona os clientes atualizados ao sistema
+    append_clientes(clientes)
+
+
+def busca_geracao_diaria_refusol(data: dict, cliente) -> list:
+    """
+    Busca a geração diária (gráfico horário) de uma planta Refusol.
+
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Refusol a ser buscada.
+
+    Returns:
+        list: Registros de geração diária da planta, prontos para `append_daily_generation`.
+    """
+    generation_day = []
+
+    for dia in dias_do_plano(data['planos'][cliente.pk]):
+        json = {
+            'channels': [
+                {
+                    'ChannelId': 1,
+                    'ChartData': [],
+                    'ChartInterval': 0,
+                    'DataType': 4,
+                    'IsPlantDataAccessibleBasedOnLicense': True,
+                    'MeasureUnit': 0,
+                    'MeasureUnitCode': 'W',
+                    'SolarObject': {
+                        'Firmware': None,
+                        'Id': cliente.plant_id,
+                        'Type': 0,
+                    },
+                    'Visible': True,
+                }
+            ],
+            'year': dia.year,
+            'month': dia.month,
+            'day': dia.day,
+        }
+
+        response = data['sess'].post(data['url'], json=json, verify=False)
+        try:
+            response_data = response.json()['d'][0]['ChartData']
+        except json.JSONDecodeError as e:
+            print(f'Ocorreu um erro ao decodificar o JSON: {e}')
+            print(response.json())
+
+        for item in response_data:
+
+            if item['DateTime']['Day'] == dia.day:
+                data_obj = datetime.strptime(
+                    f"{item['DateTime']['Year']}:{item['DateTime']['Month']}:{item['DateTime']['Day']} {item['DateTime']['Hour']}:{item['DateTime']['Minute']}",
+                    '%Y:%m:%d %H:%M',
+                )
+                generation_day.append(
+                    {
+                        'plant_id': cliente.plant_id,
+                        'plant_name': cliente.plant_name,
+                        'date': data_obj,
+                        'generation': item['Value']['Value1'],
+                        'cliente': cliente,
+                    }
+                )
+
+    return generation_day
 
 
 def atualiza_geracao_diaria_refusol(data):
@@ -2218,6 +2151,7 @@ def atualiza_geracao_diaria_refusol(data):
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Refusol. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_diaria`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -2232,94 +2166,67 @@ def atualiza_geracao_diaria_refusol(data):
         None
 
     """
-    generation_day = []
-    empty_days = 0
-    max_empty_days = 360
+    executa_geracao_diaria([data], 'refusol', busca_geracao_diaria_refusol)
 
-    for cliente in data['clientes']:
 
-        dia = datetime.now()
-        encerrar_loop = False
+def busca_geracao_refusol(data: dict, cliente) -> list:
+    """
+    Busca a geração completa (valores diários por mês) de uma planta Refusol.
 
-        ultimo_dia = buscar_ultima_informacao_diaria(cliente)
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Refusol a ser buscada.
 
-        while True:
+    Returns:
+        list: Registros de geração completa da planta, prontos para `append_complete_generation`.
+    """
+    generation = []
 
-            if encerrar_loop == True:
-                break
+    for dia in meses_do_plano(data['planos'][cliente.pk]):
+        response_data = get_data_refusol(cliente, 1, data, dia)['d'][0][
+            'ChartData'
+        ]
 
-            json = {
-                'channels': [
-                    {
-                        'ChannelId': 1,
-                        'ChartData': [],
-                        'ChartInterval': 0,
-                        'DataType': 4,
-                        'IsPlantDataAccessibleBasedOnLicense': True,
-                        'MeasureUnit': 0,
-                        'MeasureUnitCode': 'W',
-                        'SolarObject': {
-                            'Firmware': None,
-                            'Id': cliente.plant_id,
-                            'Type': 0,
-                        },
-                        'Visible': True,
-                    }
-                ],
-                'year': dia.year,
-                'month': dia.month,
-                'day': dia.day,
-            }
+        def get_data(item: dict) -> datetime:
+            """
+            Converte dados de data fornecidos em um dicionário para um objeto datetime.
 
-            response = data['sess'].post(data['url'], json=json, verify=False)
-            try:
-                response_data = response.json()['d'][0]['ChartData']
-            except json.JSONDecodeError as e:
-                print(f'Ocorreu um erro ao decodificar o JSON: {e}')
-                print(response.json())
-
-            if any(
-                item['DateTime']['Day'] == dia.day
-                and item['DateTime']['Month'] == dia.month
-                and item['DateTime']['Year'] == dia.year
-                for item in response_data
-            ):
-                empty_days = 0
-            else:
-                empty_days += 1
+            Args:
+                item (dict): Dicionário contendo informações sobre a data.
 
-            if empty_days >= max_empty_days:
-                break
+                    - 'DateTime' (dict): Dicionário com chaves 'Year', 'Month' e 'Day'
+                    representando ano, mês e dia, respectivamente.
 
-            for item in response_data:
+            Returns:
+                datetime: Objeto datetime representando a data extraída do dicionário.
 
-                if item['DateTime']['Day'] == dia.day:
-                    data_obj = datetime.strptime(
-                        f"{item['DateTime']['Year']}:{item['DateTime']['Month']}:{item['DateTime']['Day']} {item['DateTime']['Hour']}:{item['DateTime']['Minute']}",
-                        '%Y:%m:%d %H:%M',
-                    )
-                    if ultimo_dia and (
-                        data_obj.astimezone(pytz.timezone('America/Sao_Paulo'))
-                        < (ultimo_dia - timedelta(hours=2))
-                    ):
-                        encerrar_loop = True
-                        break
-                    generation_day.append(
-                        {
-                            'plant_id': cliente.plant_id,
-                            'plant_name': cliente.plant_name,
-                            'date': data_obj,
-                            'generation': item['Value']['Value1'],
-                            'cliente': cliente,
-                        }
-                    )
-                    if len(generation_day) > LIMITE:
-                        append_daily_generation(generation_day)
-                        generation_day = []
+            Example:
+                >>> data_info = {'DateTime': {'Year': 2023, 'Month': 11, 'Day': 17}}
+                >>> get_data(data_info)
+                datetime.datetime(2023, 11, 17, 0, 0)
+            """
+            data_str = f"{item['DateTime']['Year']}:{item['DateTime']['Month']}:{item['DateTime']['Day']}"
+            data_obj = datetime.strptime(data_str, '%Y:%m:%d')
+            return data_obj
+
+        sorted_data = sorted(response_data, key=get_data, reverse=True)
 
-            dia -= relativedelta(days=1)
+        for item in sorted_data:
+            data_obj = datetime.strptime(
+                f"{item['DateTime']['Year']}:{item['DateTime']['Month']}:{item['DateTime']['Day']}",
+                '%Y:%m:%d',
+            )
+            generation.append(
+                {
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': data_obj,
+                    'generation': f"{item['Value']['Value1']} kwh",
+                    'cliente': cliente,
+                }
+            )
 
-    append_daily_generation(generation_day)
+    return generation
 
 
 def atualiza_geracao_refusol(data):
@@ -2328,6 +2235,7 @@ def atualiza_geracao_refusol(data):
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Refusol. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_completa_planejada`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -2341,87 +2249,9 @@ def atualiza_geracao_refusol(data):
     Returns:
         None
     """
-
-    generation = []
-    max_empty_months = 12
-    empty_months = 0
-
-    for cliente in data['clientes']:
-
-        dia = datetime.now()
-        encerrar_loop = False
-
-        ultimo_dia = buscar_ultima_informacao_completa(cliente)
-
-        while True:
-
-            if encerrar_loop:
-                break
-
-            data['data'] = get_data_refusol(cliente, 1, data, dia)
-            response_data = data['data']['d'][0]['ChartData']
-            if any(
-                item['DateTime']['Day'] == dia.day
-                and item['DateTime']['Month'] == dia.month
-                and item['DateTime']['Year'] == dia.year
-                for item in response_data
-            ):
-                empty_months = 0
-            else:
-                empty_months += 1
-
-            if empty_months >= max_empty_months:
-                break
-
-            def get_data(item: dict) -> datetime:
-                """
-                Converte dados de data fornecidos em um dicionário para um objeto datetime.
-
-                Args:
-                    item (dict): Dicionário contendo informações sobre a data.
-                    
-                        - 'DateTime' (dict): Dicionário com chaves 'Year', 'Month' e 'Day'
-                        representando ano, mês e dia, respectivamente.
-
-                Returns:
-                    datetime: Objeto datetime representando a data extraída do dicionário.
-
-                Example:
-                    >>> data_info = {'DateTime': {'Year': 2023, 'Month': 11, 'Day': 17}}
-                    >>> get_data(data_info)
-                    datetime.datetime(2023, 11, 17, 0, 0)
-                """
-                data_str = f"{item['DateTime']['Year']}:{item['DateTime']['Month']}:{item['DateTime']['Day']}"
-                data_obj = datetime.strptime(data_str, '%Y:%m:%d')
-                return data_obj
-
-            sorted_data = sorted(response_data, key=get_data, reverse=True)
-
-            for item in sorted_data:
-                data_obj = datetime.strptime(
-                    f"{item['DateTime']['Year']}:{item['DateTime']['Month']}:{item['DateTime']['Day']}",
-                    '%Y:%m:%d',
-                )
-                if ultimo_dia and (
-                    data_obj.date() < (ultimo_dia - timedelta(days=2))
-                ):
-                    encerrar_loop = True
-                    break
-                generation.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': f"{item['Value']['Value1']} kwh",
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation) > LIMITE:
-                    append_complete_generation(generation)
-                    generation = []
-            dia -= relativedelta(months=1)
-
-    append_complete_generation(generation)
+    executa_geracao_completa_planejada(
+        [data], 'refusol', busca_geracao_refusol
+    )
 
 
 def login_deye(data):
@@ -2445,7 +2275,7 @@ def login_deye(data):
 
         try:
 
-            data['sess'] = requests.Session()
+            data['sess'] = nova_sessao()
 
             data['json'] = {
                 'grant_type': 'mdc_password',
@@ -2505,7 +2335,7 @@ def login_deye(data):
         except Exception as e:
             print(e)
             tentativa += 1
-            t.sleep(5)
+            espera_nova_tentativa(tentativa)
 
 
 def atualiza_clientes_deye(data):
@@ -2567,7 +2397,7 @@ def atualiza_clientes_deye(data):
     for plant in plants:
 
         cliente = {
-            'inverter': Inversor.objects.get(name=data['inversor']),
+            'inverter': CACHE_INVERSORES.obtem(data['inversor']),
             'plant_id': plant['id'],
             'plant_name': plant['name'],
             'energy_today': f'{plant["energy_today"]} kwh',
@@ -2581,145 +2411,112 @@ def atualiza_clientes_deye(data):
     append_clientes(clientes)
 
 
-def atualiza_geracao_diaria_deye(data):
+def busca_geracao_diaria_deye(data: dict, cliente) -> list:
     """
-    Atualiza as informações de geração de energia diária (gráfico horário) para clientes Deye.
-
-    Esta função realiza requisições para obter informações mensais sobre a geração
-    de energia de clientes Deye. Os dados são processados e armazenados.
+    Busca a geração diária (gráfico horário) de uma planta Deye.
 
     Args:
-        data (dict): Um dicionário contendo informações necessárias para a atualização.
-        
-            - sess (requests.Session): Sessão para realizar as requisições.
-            
-            - api_url (str): URL da API Deye.
-            
-            - clientes (list): Lista de objetos cliente Deye.
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Deye a ser buscada.
 
     Returns:
-        None
-
+        list: Registros de geração diária da planta, prontos para `append_daily_generation`.
     """
     generation_day = []
-    LIMITE = 50
     # print('clientes', data['clientes'])
-    for cliente in data['clientes']:
-
-        dia = datetime.now()
-        encerrar_loop = False
-
-        ultimo_dia = buscar_ultima_informacao_diaria(cliente)
-
-        while True:
 
-            if encerrar_loop == True:
-                break
-
-            params = {
-                'year': dia.year,
-                'month': dia.month,
-                'day': dia.day,
-            }
+    for dia in dias_do_plano(data['planos'][cliente.pk]):
+        params = {
+            'year': dia.year,
+            'month': dia.month,
+            'day': dia.day,
+        }
 
-            def busca_geracao_diaria():
-                """
-                Realiza tentativas de busca de dados de geração diária.
+        def busca_geracao_diaria():
+            """
+            Realiza tentativas de busca de dados de geração diária.
 
-                Returns:
-                    response.json() (dict): Dicionário contendo os dados de geração diária, conforme a resposta da API.
+            Returns:
+                response.json() (dict): Dicionário contendo os dados de geração diária, conforme a resposta da API.
 
-                Raises:
-                    Exception: Erro genérico em caso de falha na requisição.
-                    Exception: Erro 500 se o status da resposta for 500.
+            Raises:
+                Exception: Erro genérico em caso de falha na requisição.
+                Exception: Erro 500 se o status da resposta for 500.
 
-                """
+            """
 
-                tentativas = 0
-                max_tentativas = 10
+            tentativas = 0
+            max_tentativas = 10
 
-                while tentativas < max_tentativas:
-                    try:
-                        response = data['sess'].get(
-                            f'{data["api_url"]}/maintain-s/history/power/{cliente.plant_id}/record',
-                            params=params,
-                            headers=data['headers'],
-                        )
-                        # print('response text', response.text)
-                        if response.status_code == 500:
-                            raise Exception(
-                                'Deye - Geração diária - Erro 500.'
-                            )
-                        else:
-                            break
-                    except Exception as e:
-                        print(f'Deye - Geração diária. Ocorreu um erro: {e}')
-                        t.sleep(5)
-                        login_deye(data)
-                    tentativas += 1
-
-                return response.json()
-
-            response_data = busca_geracao_diaria()
-
-            # print('response_data', response_data)
-
-            if 'records' not in response_data:
+            while tentativas < max_tentativas:
                 try:
-                    print(response_data)
-                    print(response_data.json())
+                    response = data['sess'].get(
+                        f'{data["api_url"]}/maintain-s/history/power/{cliente.plant_id}/record',
+                        params=params,
+                        headers=data['headers'],
+                    )
+                    # print('response text', response.text)
+                    if response.status_code == 500:
+                        raise Exception(
+                            'Deye - Geração diária - Erro 500.'
+                        )
+                    else:
+                        break
                 except Exception as e:
-                    print('erro deye geração diária', e)
-                break
+                    print(f'Deye - Geração diária. Ocorreu um erro: {e}')
+                    espera_nova_tentativa(tentativas + 1)
+                    login_deye(data)
+                tentativas += 1
 
-            sorted_data = sorted(
-                response_data['records'],
-                key=lambda x: datetime.fromtimestamp(x['dateTime']),
-                reverse=True,
-            )
+            return response.json()
 
-            for energy in sorted_data:
-                data_obj = datetime.fromtimestamp(energy['dateTime'])
-                # #DEBUG
-                # print(data_obj)
-                # t.sleep(1)
+        response_data = busca_geracao_diaria()
 
-                if ultimo_dia and (
-                    data_obj.astimezone(pytz.timezone('America/Sao_Paulo'))
-                    < (ultimo_dia - timedelta(hours=2))
-                ):
-                    encerrar_loop = True
-                    break
+        # print('response_data', response_data)
 
-                generation_day.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': energy['generationPower'],
-                        'cliente': cliente,
-                    }
-                )
-                # #DEBUG
-                # print(generation_day)
-                # t.sleep(1)
+        if 'records' not in response_data:
+            try:
+                print(response_data)
+                print(response_data.json())
+            except Exception as e:
+                print('erro deye geração diária', e)
+            break
 
-                if len(generation_day) > LIMITE:
-                    # print('generation_day', generation_day)
-                    append_daily_generation(generation_day)
-                    generation_day = []
-            t.sleep(0.25)
-            dia -= relativedelta(days=1)
+        sorted_data = sorted(
+            response_data['records'],
+            key=lambda x: datetime.fromtimestamp(x['dateTime']),
+            reverse=True,
+        )
+
+        for energy in sorted_data:
+            data_obj = datetime.fromtimestamp(energy['dateTime'])
+            # #DEBUG
+            # print(data_obj)
+            # t.sleep(1)
+
+            generation_day.append(
+                {
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': data_obj,
+                    'generation': energy['generationPower'],
+                    'cliente': cliente,
+                }
+            )
+            # #DEBUG
+            # print(generation_day)
+            # t.sleep(1)
 
-    append_daily_generation(generation_day)
+    return generation_day
 
 
-def atualiza_geracao_deye(data):
+def atualiza_geracao_diaria_deye(data):
     """
-    Atualiza as informações de geração de energia para clientes Deye.
+    Atualiza as informações de geração de energia diária (gráfico horário) para clientes Deye.
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Deye. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_diaria`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -2732,104 +2529,120 @@ def atualiza_geracao_deye(data):
 
     Returns:
         None
+
     """
+    executa_geracao_diaria([data], 'deye', busca_geracao_diaria_deye)
 
-    generation = []
-    LIMITE = 50
 
-    for cliente in data['clientes']:
+def busca_geracao_deye(data: dict, cliente) -> list:
+    """
+    Busca a geração completa (valores diários por mês) de uma planta Deye.
 
-        dia = datetime.now()
-        encerrar_loop = False
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Deye a ser buscada.
 
-        ultimo_dia = buscar_ultima_informacao_completa(cliente)
+    Returns:
+        list: Registros de geração completa da planta, prontos para `append_complete_generation`.
+    """
+    generation = []
 
-        while True:
+    for dia in meses_do_plano(data['planos'][cliente.pk]):
+        params = {
+            'year': dia.year,
+            'month': dia.month,
+        }
 
-            if encerrar_loop:
-                break
+        def busca_geracao_completa():
+            """
+            Realiza tentativas de busca de dados de geração completa.
 
-            params = {
-                'year': dia.year,
-                'month': dia.month,
-            }
+            Returns:
+                dict: Dicionário contendo os dados de geração completa, conforme a resposta da API.
 
-            def busca_geracao_completa():
-                """
-                Realiza tentativas de busca de dados de geração completa.
+            Raises:
+                Exception: Erro genérico em caso de falha na requisição.
+                Exception: Erro 500 se o status da resposta for 500.
 
-                Returns:
-                    dict: Dicionário contendo os dados de geração completa, conforme a resposta da API.
+            """
 
-                Raises:
-                    Exception: Erro genérico em caso de falha na requisição.
-                    Exception: Erro 500 se o status da resposta for 500.
+            tentativas = 0
+            max_tentativas = 10
 
-                """
+            while tentativas < max_tentativas:
+                try:
+                    response = data['sess'].get(
+                        f'{data["api_url"]}/maintain-s/history/power/{cliente.plant_id}/stats/month',
+                        params=params,
+                        headers=data['headers'],
+                    )
+                    if response.status_code == 500:
+                        raise Exception('Deye - Geração - Erro 500.')
+                    else:
+                        break
+                except Exception as e:
+                    print(f'Deye - Geração. Ocorreu um erro: {e}')
+                    espera_nova_tentativa(tentativas + 1)
+                    login_deye(data)
+                tentativas += 1
 
-                tentativas = 0
-                max_tentativas = 10
+            return response.json()
 
-                while tentativas < max_tentativas:
-                    try:
-                        response = data['sess'].get(
-                            f'{data["api_url"]}/maintain-s/history/power/{cliente.plant_id}/stats/month',
-                            params=params,
-                            headers=data['headers'],
-                        )
-                        if response.status_code == 500:
-                            raise Exception('Deye - Geração - Erro 500.')
-                        else:
-                            break
-                    except Exception as e:
-                        print(f'Deye - Geração. Ocorreu um erro: {e}')
-                        t.sleep(5)
-                        login_deye(data)
-                    tentativas += 1
+        response_data = busca_geracao_completa()
 
-                return response.json()
+        if 'records' not in response_data:
+            try:
+                print(response_data)
+                print(response_data.json())
+            except Exception as e:
+                print('erro deye geração completa', e)
+            break
 
-            response_data = busca_geracao_completa()
+        sorted_data = sorted(
+            response_data['records'],
+            key=lambda x: datetime.strptime(x['acceptDay'], '%Y%m%d'),
+            reverse=True,
+        )
 
-            if 'records' not in response_data:
-                try:
-                    print(response_data)
-                    print(response_data.json())
-                except Exception as e:
-                    print('erro deye geração completa', e)
-                break
+        for energy in sorted_data:
+            data_obj = datetime.strptime(energy['acceptDay'], '%Y%m%d')
 
-            sorted_data = sorted(
-                response_data['records'],
-                key=lambda x: datetime.strptime(x['acceptDay'], '%Y%m%d'),
-                reverse=True,
+            generation.append(
+                {
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': data_obj,
+                    'generation': f"{energy['generationValue']} kwh",
+                    'cliente': cliente,
+                }
             )
 
-            for energy in sorted_data:
-                data_obj = datetime.strptime(energy['acceptDay'], '%Y%m%d')
+    return generation
 
-                if ultimo_dia and (
-                    data_obj.date() < (ultimo_dia - timedelta(days=2))
-                ):
-                    encerrar_loop = True
-                    break
 
-                generation.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': f"{energy['generationValue']} kwh",
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation) > LIMITE:
-                    append_complete_generation(generation)
-                    generation = []
-            t.sleep(0.1)
-            dia -= relativedelta(months=1)
+def atualiza_geracao_deye(data):
+    """
+    Atualiza as informações de geração de energia para clientes Deye.
+
+    Esta função realiza requisições para obter informações mensais sobre a geração
+    de energia de clientes Deye. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_completa_planejada`.
+
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a atualização.
+        
+            - sess (requests.Session): Sessão para realizar as requisições.
+            
+            - api_url (str): URL da API Deye.
+            
+            - clientes (list): Lista de objetos cliente Deye.
 
-    append_complete_generation(generation)
+    Returns:
+        None
+    """
+    executa_geracao_completa_planejada(
+        [data], 'deye', busca_geracao_deye
+    )
 
 
 def login_canadian(data):
@@ -2855,7 +2668,7 @@ def login_canadian(data):
 
         try:
 
-            data['sess'] = requests.Session()
+            data['sess'] = nova_sessao()
 
             data['sess'].headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
@@ -2899,6 +2712,7 @@ def login_canadian(data):
                 f'{data["api_url"]}/announcement-s/app/upgrade/add-version',
                 json=json_data,
                 headers=headers,
+                timeout=TIMEOUT_PADRAO,
             )
 
             set_cookie_header = response.headers.get('Set-Cookie')
@@ -2975,7 +2789,7 @@ def login_canadian(data):
         except Exception as e:
             print(e)
             tentativa += 1
-            t.sleep(5)
+            espera_nova_tentativa(tentativa)
 
 
 def atualiza_clientes_canadian(data):
@@ -3037,7 +2851,7 @@ def atualiza_clientes_canadian(data):
     for plant in plants:
 
         cliente = {
-            'inverter': Inversor.objects.get(name=data['inversor']),
+            'inverter': CACHE_INVERSORES.obtem(data['inversor']),
             'plant_id': plant['id'],
             'plant_name': plant['name'],
             'energy_today': f'{plant["energy_today"]} kwh',
@@ -3052,142 +2866,109 @@ def atualiza_clientes_canadian(data):
     append_clientes(clientes)
 
 
-def atualiza_geracao_diaria_canadian(data):
+def busca_geracao_diaria_canadian(data: dict, cliente) -> list:
     """
-    Atualiza as informações de geração de energia diária (gráfico horário) para clientes Canadian.
-
-    Esta função realiza requisições para obter informações mensais sobre a geração
-    de energia de clientes Canadian. Os dados são processados e armazenados.
+    Busca a geração diária (gráfico horário) de uma planta Canadian.
 
     Args:
-        data (dict): Um dicionário contendo informações necessárias para a atualização.
-        
-            - sess (requests.Session): Sessão para realizar as requisições.
-            
-            - api_url (str): URL da API Canadian.
-            
-            - clientes (list): Lista de objetos cliente Canadian.
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Canadian a ser buscada.
 
     Returns:
-        None
-
+        list: Registros de geração diária da planta, prontos para `append_daily_generation`.
     """
     generation_day = []
-    LIMITE = 50
-
-    for cliente in data['clientes']:
-
-        dia = datetime.now()
-        encerrar_loop = False
-
-        ultimo_dia = buscar_ultima_informacao_diaria(cliente)
-
-        while True:
-
-            if encerrar_loop == True:
-                break
-
-            params = {
-                'year': dia.year,
-                'month': dia.month,
-                'day': dia.day,
-            }
 
-            def busca_geracao_diaria():
-                """
-                Realiza tentativas de busca de dados de geração diária.
-
-                Returns:
-                    dict: Dicionário contendo os dados de geração diária, conforme a resposta da API.
-
-                Raises:
-                    Exception: Erro genérico em caso de falha na requisição.
-                    Exception: Erro 500 se o status da resposta for 500.
+    for dia in dias_do_plano(data['planos'][cliente.pk]):
+        params = {
+            'year': dia.year,
+            'month': dia.month,
+            'day': dia.day,
+        }
 
-                """
+        def busca_geracao_diaria():
+            """
+            Realiza tentativas de busca de dados de geração diária.
 
-                tentativas = 0
-                max_tentativas = 10
+            Returns:
+                dict: Dicionário contendo os dados de geração diária, conforme a resposta da API.
 
-                while tentativas < max_tentativas:
-                    try:
-                        response = data['sess'].get(
-                            f'{data["api_url"]}/maintain-s/history/power/{cliente.plant_id}/record',
-                            params=params,
-                        )
-                        if response.status_code == 500:
-                            raise Exception(
-                                'Canadian - Geração diária - Erro 500.'
-                            )
-                        else:
-                            break
-                    except Exception as e:
-                        print(
-                            f'Canadian - Geração diária. Ocorreu um erro: {e}'
-                        )
-                        t.sleep(5)
-                        login_canadian(data)
-                    tentativas += 1
+            Raises:
+                Exception: Erro genérico em caso de falha na requisição.
+                Exception: Erro 500 se o status da resposta for 500.
 
-                return response.json()
+            """
 
-            response_data = busca_geracao_diaria()
+            tentativas = 0
+            max_tentativas = 10
 
-            if 'records' not in response_data:
+            while tentativas < max_tentativas:
                 try:
-                    print(response_data)
-                    print(response_data.json())
+                    response = data['sess'].get(
+                        f'{data["api_url"]}/maintain-s/history/power/{cliente.plant_id}/record',
+                        params=params,
+                    )
+                    if response.status_code == 500:
+                        raise Exception(
+                            'Canadian - Geração diária - Erro 500.'
+                        )
+                    else:
+                        break
                 except Exception as e:
-                    print('erro canadian geração diária', e)
-                break
+                    print(
+                        f'Canadian - Geração diária. Ocorreu um erro: {e}'
+                    )
+                    espera_nova_tentativa(tentativas + 1)
+                    login_canadian(data)
+                tentativas += 1
 
-            sorted_data = sorted(
-                response_data['records'],
-                key=lambda x: datetime.fromtimestamp(x['dateTime']),
-                reverse=True,
-            )
+            return response.json()
+
+        response_data = busca_geracao_diaria()
 
-            for energy in sorted_data:
-                data_obj = datetime.fromtimestamp(energy['dateTime'])
-                # #DEBUG
-                # print(data_obj)
-                # t.sleep(1)
+        if 'records' not in response_data:
+            try:
+                print(response_data)
+                print(response_data.json())
+            except Exception as e:
+                print('erro canadian geração diária', e)
+            break
 
-                if ultimo_dia and (
-                    data_obj.astimezone(pytz.timezone('America/Sao_Paulo'))
-                    < (ultimo_dia - timedelta(hours=2))
-                ):
-                    encerrar_loop = True
-                    break
+        sorted_data = sorted(
+            response_data['records'],
+            key=lambda x: datetime.fromtimestamp(x['dateTime']),
+            reverse=True,
+        )
 
-                generation_day.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': energy['generationPower'],
-                        'cliente': cliente,
-                    }
-                )
-                # #DEBUG
-                # print(generation_day)
-                # t.sleep(1)
+        for energy in sorted_data:
+            data_obj = datetime.fromtimestamp(energy['dateTime'])
+            # #DEBUG
+            # print(data_obj)
+            # t.sleep(1)
 
-                if len(generation_day) > LIMITE:
-                    append_daily_generation(generation_day)
-                    generation_day = []
-            t.sleep(0.25)
-            dia -= relativedelta(days=1)
+            generation_day.append(
+                {
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': data_obj,
+                    'generation': energy['generationPower'],
+                    'cliente': cliente,
+                }
+            )
+            # #DEBUG
+            # print(generation_day)
+            # t.sleep(1)
 
-    append_daily_generation(generation_day)
+    return generation_day
 
 
-def atualiza_geracao_canadian(data):
+def atualiza_geracao_diaria_canadian(data):
     """
-    Atualiza as informações de geração de energia para clientes Canadian.
+    Atualiza as informações de geração de energia diária (gráfico horário) para clientes Canadian.
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Canadian. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_diaria`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -3200,102 +2981,119 @@ def atualiza_geracao_canadian(data):
 
     Returns:
         None
+
     """
-    generation = []
-    LIMITE = 50
+    executa_geracao_diaria([data], 'canadian', busca_geracao_diaria_canadian)
 
-    for cliente in data['clientes']:
 
-        dia = datetime.now()
-        encerrar_loop = False
+def busca_geracao_canadian(data: dict, cliente) -> list:
+    """
+    Busca a geração completa (valores diários por mês) de uma planta Canadian.
+
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Canadian a ser buscada.
 
-        ultimo_dia = buscar_ultima_informacao_completa(cliente)
+    Returns:
+        list: Registros de geração completa da planta, prontos para `append_complete_generation`.
+    """
+    generation = []
 
-        while True:
+    for dia in meses_do_plano(data['planos'][cliente.pk]):
+        params = {
+            'year': dia.year,
+            'month': dia.month,
+        }
 
-            if encerrar_loop:
-                break
+        def busca_geracao_completa():
+            """
+            Realiza tentativas de busca de dados de geração completa.
 
-            params = {
-                'year': dia.year,
-                'month': dia.month,
-            }
+            Returns:
+                dict: Dicionário contendo os dados de geração completa, conforme a resposta da API.
 
-            def busca_geracao_completa():
-                """
-                Realiza tentativas de busca de dados de geração completa.
+            Raises:
+                Exception: Erro genérico em caso de falha na requisição.
+                Exception: Erro 500 se o status da resposta for 500.
 
-                Returns:
-                    dict: Dicionário contendo os dados de geração completa, conforme a resposta da API.
+            """
 
-                Raises:
-                    Exception: Erro genérico em caso de falha na requisição.
-                    Exception: Erro 500 se o status da resposta for 500.
+            tentativas = 0
+            max_tentativas = 10
 
-                """
+            while tentativas < max_tentativas:
+                try:
+                    response = data['sess'].get(
+                        f'{data["api_url"]}/maintain-s/history/power/{cliente.plant_id}/stats/month',
+                        params=params,
+                    )
+                    if response.status_code == 500:
+                        raise Exception('Canadian - Geração - Erro 500.')
+                    else:
+                        break
+                except Exception as e:
+                    print(f'Canadian - Geração. Ocorreu um erro: {e}')
+                    espera_nova_tentativa(tentativas + 1)
+                    login_canadian(data)
+                tentativas += 1
 
-                tentativas = 0
-                max_tentativas = 10
+            return response.json()
 
-                while tentativas < max_tentativas:
-                    try:
-                        response = data['sess'].get(
-                            f'{data["api_url"]}/maintain-s/history/power/{cliente.plant_id}/stats/month',
-                            params=params,
-                        )
-                        if response.status_code == 500:
-                            raise Exception('Canadian - Geração - Erro 500.')
-                        else:
-                            break
-                    except Exception as e:
-                        print(f'Canadian - Geração. Ocorreu um erro: {e}')
-                        t.sleep(5)
-                        login_canadian(data)
-                    tentativas += 1
+        response_data = busca_geracao_completa()
+
+        if 'records' not in response_data:
+            try:
+                print(response_data)
+                print(response_data.json())
+            except Exception as e:
+                print('erro canadian geração completa', e)
+            break
 
-                return response.json()
+        sorted_data = sorted(
+            response_data['records'],
+            key=lambda x: datetime.strptime(x['acceptDay'], '%Y%m%d'),
+            reverse=True,
+        )
 
-            response_data = busca_geracao_completa()
+        for energy in sorted_data:
+            data_obj = datetime.strptime(energy['acceptDay'], '%Y%m%d')
 
-            if 'records' not in response_data:
-                try:
-                    print(response_data)
-                    print(response_data.json())
-                except Exception as e:
-                    print('erro canadian geração completa', e)
-                break
+            generation.append(
+                {
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': data_obj,
+                    'generation': f"{energy['generationValue']} kwh",
+                    'cliente': cliente,
+                }
+            )
+
+    return generation
 
-            sorted_data = sorted(
-                response_data['records'],
-                key=lambda x: datetime.strptime(x['acceptDay'], '%Y%m%d'),
-                reverse=True,
-            )
 
-            for energy in sorted_data:
-                data_obj = datetime.strptime(energy['acceptDay'], '%Y%m%d')
+def atualiza_geracao_canadian(data):
+    """
+    Atualiza as informações de geração de energia para clientes Canadian.
 
-                if ultimo_dia and (
-                    data_obj.date() < (ultimo_dia - timedelta(days=2))
-                ):
-                    encerrar_loop = True
-                    break
+    Esta função realiza requisições para obter informações mensais sobre a geração
+    de energia de clientes Canadian. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_completa_planejada`.
 
-                generation.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': f"{energy['generationValue']} kwh",
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation) > LIMITE:
-                    append_complete_generation(generation)
-                    generation = []
-            t.sleep(0.1)
-            dia -= relativedelta(months=1)
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a atualização.
+        
+            - sess (requests.Session): Sessão para realizar as requisições.
+            
+            - api_url (str): URL da API Canadian.
+            
+            - clientes (list): Lista de objetos cliente Canadian.
 
-    append_complete_generation(generation)
+    Returns:
+        None
+    """
+    executa_geracao_completa_planejada(
+        [data], 'canadian', busca_geracao_canadian
+    )
 
 
 def login_ecosolys(data):
@@ -3331,7 +3129,7 @@ def login_ecosolys(data):
 
     """
     # Inicia uma sessão e desabilita os avisos de segurança.
-    data['sess'] = requests.Session()
+    data['sess'] = nova_sessao()
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
     # Configurações iniciais.
@@ -3454,15 +3252,17 @@ def atualiza_clientes_ecosolys(data):
         geo_url = f'https://geocode.maps.co/search?q={address}&api_key={GEOCODE_API}'
 
         # Obtém informações de localização da API de geocodificação.
-        t.sleep(1.1)
-        location = requests.get(geo_url.format(address=quote(address)))
+        location = nova_sessao().get(
+            geo_url.format(address=quote(address))
+        )
 
         # Se a localização não for encontrada, tenta novamente sem UF.
         if location.text == '[]':
             address = f'{rua}, {cidade}'
             geo_url = f'https://geocode.maps.co/search?q={address}&api_key={GEOCODE_API}'
-            t.sleep(1.1)
-            location = requests.get(geo_url.format(address=quote(address)))
+            location = nova_sessao().get(
+                geo_url.format(address=quote(address))
+            )
 
         # Obtém latitude e longitude ou define como 0 se não encontrado.
         latitude = 0 if location.text == '[]' else location.json()[0]['lat']
@@ -3497,7 +3297,7 @@ def atualiza_clientes_ecosolys(data):
     # Para cada planta, cria registros de clientes.
     for plant in plants:
         cliente = {
-            'inverter': Inversor.objects.get(name='ecosolys'),
+            'inverter': CACHE_INVERSORES.obtem('ecosolys'),
             'plant_id': plant['id'],
             'plant_name': plant['name'],
             'energy_today': f'{plant["energy_today"]} kwh',
@@ -3513,12 +3313,66 @@ def atualiza_clientes_ecosolys(data):
     append_clientes(clientes)
 
 
+def busca_geracao_ecosolys(data: dict, cliente) -> list:
+    """
+    Busca a geração completa (valores diários por mês) de uma planta Ecosolys.
+
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Ecosolys a ser buscada.
+
+    Returns:
+        list: Registros de geração completa da planta, prontos para `append_complete_generation`.
+    """
+    generation = []
+
+    for dia in meses_do_plano(data['planos'][cliente.pk]):
+        for plant in data['plants']:
+            if plant['id'] == int(cliente.plant_id):
+                id_inversor = plant['inversor']
+
+        params = {
+            'inversorId': id_inversor,
+            'mes': dia.strftime('%Y-%m-%d'),
+        }
+
+        response = data['sess'].get(
+            f'{data["api_url"]}/api-v1/inversor/geracao/mes',
+            params=params,
+        )
+
+        if not response.json()['dados']:
+            continue
+
+        sorted_data = sorted(
+            response.json()['dados'],
+            key=lambda x: datetime.strptime(x['data'], '%Y-%m-%d'),
+            reverse=True,
+        )
+
+        for energy in sorted_data:
+            data_obj = datetime.strptime(energy['data'], '%Y-%m-%d')
+
+            generation.append(
+                {
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': data_obj,
+                    'generation': f"{energy['quantidade']} kwh",
+                    'cliente': cliente,
+                }
+            )
+
+    return generation
+
+
 def atualiza_geracao_ecosolys(data):
     """
     Atualiza as informações de geração de energia para clientes Ecosolys.
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Ecosolys. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_completa_planejada`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -3532,68 +3386,62 @@ def atualiza_geracao_ecosolys(data):
     Returns:
         None
     """
-    generation = []
-
-    for cliente in data['clientes']:
-
-        dia = datetime.now()
-        encerrar_loop = False
+    executa_geracao_completa_planejada(
+        [data], 'ecosolys', busca_geracao_ecosolys
+    )
 
-        ultimo_dia = buscar_ultima_informacao_completa(cliente)
 
-        while True:
+def busca_geracao_diaria_ecosolys(data: dict, cliente) -> list:
+    """
+    Busca a geração diária (gráfico horário) de uma planta Ecosolys.
 
-            if encerrar_loop:
-                break
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Ecosolys a ser buscada.
 
-            for plant in data['plants']:
-                if plant['id'] == int(cliente.plant_id):
-                    id_inversor = plant['inversor']
+    Returns:
+        list: Registros de geração diária da planta, prontos para `append_daily_generation`.
+    """
+    generation_day = []
 
-            params = {
-                'inversorId': id_inversor,
-                'mes': dia.strftime('%Y-%m-%d'),
-            }
+    for dia in dias_do_plano(data['planos'][cliente.pk]):
+        for plant in data['plants']:
+            if plant['id'] == int(cliente.plant_id):
+                id_inversor = plant['inversor']
 
-            response = data['sess'].get(
-                f'{data["api_url"]}/api-v1/inversor/geracao/mes',
-                params=params,
-            )
+        params = {
+            'inversorId': id_inversor,
+            'dia': dia.strftime('%Y-%m-%d'),
+        }
 
-            if not response.json()['dados']:
-                break
+        response = data['sess'].get(
+            f'{data["api_url"]}/api-v1/inversor/geracao/dia',
+            params=params,
+        )
 
-            sorted_data = sorted(
-                response.json()['dados'],
-                key=lambda x: datetime.strptime(x['data'], '%Y-%m-%d'),
-                reverse=True,
-            )
+        if not response.json()['dados']:
+            continue
 
-            for energy in sorted_data:
-                data_obj = datetime.strptime(energy['data'], '%Y-%m-%d')
+        sorted_data = sorted(
+            response.json()['dados'],
+            key=lambda x: datetime.strptime(x['data'], '%Y-%m-%dT%H:%M'),
+            reverse=True,
+        )
 
-                if ultimo_dia and (
-                    data_obj.date() < (ultimo_dia - timedelta(days=2))
-                ):
-                    encerrar_loop = True
-                    break
+        for energy in sorted_data:
+            data_obj = datetime.strptime(energy['data'], '%Y-%m-%dT%H:%M')
 
-                generation.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': f"{energy['quantidade']} kwh",
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation) > LIMITE:
-                    append_complete_generation(generation)
-                    generation = []
-            dia = dia.replace(day=1)
-            dia -= relativedelta(months=1)
+            generation_day.append(
+                {
+                    'plant_id': plant['id'],
+                    'plant_name': plant['name'],
+                    'date': data_obj,
+                    'generation': f"{energy['quantidade']} kwh",
+                    'cliente': cliente,
+                }
+            )
 
-    append_complete_generation(generation)
+    return generation_day
 
 
 def atualiza_geracao_diaria_ecosolys(data):
@@ -3602,6 +3450,7 @@ def atualiza_geracao_diaria_ecosolys(data):
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Ecosolys. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_diaria`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -3616,69 +3465,7 @@ def atualiza_geracao_diaria_ecosolys(data):
         None
 
     """
-    # TODO: Adicionar limite de dias em todos eu acho, pra buscar datas mais antigas
-    generation_day = []
-
-    for cliente in data['clientes']:
-
-        dia = datetime.now()
-        encerrar_loop = False
-
-        ultimo_dia = buscar_ultima_informacao_diaria(cliente)
-
-        while True:
-
-            if encerrar_loop == True:
-                break
-
-            for plant in data['plants']:
-                if plant['id'] == int(cliente.plant_id):
-                    id_inversor = plant['inversor']
-
-            params = {
-                'inversorId': id_inversor,
-                'dia': dia.strftime('%Y-%m-%d'),
-            }
-
-            response = data['sess'].get(
-                f'{data["api_url"]}/api-v1/inversor/geracao/dia',
-                params=params,
-            )
-
-            if not response.json()['dados']:
-                break
-
-            sorted_data = sorted(
-                response.json()['dados'],
-                key=lambda x: datetime.strptime(x['data'], '%Y-%m-%dT%H:%M'),
-                reverse=True,
-            )
-
-            for energy in sorted_data:
-                data_obj = datetime.strptime(energy['data'], '%Y-%m-%dT%H:%M')
-
-                if ultimo_dia and (
-                    data_obj.astimezone(pytz.timezone('America/Sao_Paulo'))
-                    < (ultimo_dia - timedelta(hours=2))
-                ):
-                    encerrar_loop = True
-                    break
-
-                generation_day.append(
-                    {
-                        'plant_id': plant['id'],
-                        'plant_name': plant['name'],
-                        'date': data_obj,
-                        'generation': f"{energy['quantidade']} kwh",
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation_day) > LIMITE:
-                    append_daily_generation(generation_day)
-                    generation_day = []
-            dia -= relativedelta(days=1)
-
-    append_daily_generation(generation_day)
+    executa_geracao_diaria([data], 'ecosolys', busca_geracao_diaria_ecosolys)
 
 
 def apply_q_b(value):
@@ -3983,6 +3770,8 @@ def retrieve_auth(endpoint, e, now):
         
     Note:
         Esta função é a replicação exata do javascript de login dos sistemas Solis.
+        As requisições usam `ASSINADOR_SOLIS`, equivalente e mais rápido; esta função
+        é mantida como referência.
     """
     num2 = '0101100111111011000001111101110001000100011'
     num2_hash = apply_q_b(num2)
@@ -4020,6 +3809,69 @@ def retrieve_auth(endpoint, e, now):
     return token
 
 
+class AssinadorSolis:
+    """
+    Assina as requisições da API da Solis.
+
+    Equivalente a `retrieve_auth`, mas a chave do HMAC (as três transformações
+    `apply_q_b`) é derivada uma única vez, na criação do objeto, e o MD5 do conteúdo
+    é calculado com `hashlib` em vez da função `n`, que replica o MD5 do javascript
+    do portal em Python puro.
+
+    Attributes:
+        prefixo (str): O prefixo do token, como 'WEB 2424'.
+    """
+
+    def __init__(self, local: str = 'WEB', codigo: str = '2424'):
+        self.prefixo = f'{local} {codigo}'
+        num2 = apply_q_b('0101100111111011000001111101110001000100011')
+        jia_mi = apply_q_b('01010111010001000110101100110111110000010100')
+        num4 = apply_q_b('00111111101001100101010101110011')
+        self._chave = (
+            str(int(num2, 2)) + hex(int(jia_mi, 2))[2:] + hex(int(num4, 2))[2:]
+        ).encode('utf-8')
+
+    @staticmethod
+    def conteudo_md5(conteudo: str) -> str:
+        """
+        Calcula o MD5 do conteúdo codificado em base64, como a função `n`.
+
+        Args:
+            conteudo (str): O conteúdo da requisição.
+
+        Returns:
+            str: O MD5 do conteúdo em UTF-8, codificado em base64.
+        """
+        digest = hashlib.md5(
+            conteudo.replace('\r\n', '\n').encode('utf-8')
+        ).digest()
+        return base64.b64encode(digest).decode('utf-8')
+
+    def assina(self, endpoint: str, conteudo: str, now: str) -> str:
+        """
+        Gera o cabeçalho de autorização de uma requisição POST.
+
+        Args:
+            endpoint (str): O caminho do endpoint, como '/station/list'.
+            conteudo (str): O JSON da requisição sem espaços.
+            now (str): A data da requisição no formato do cabeçalho 'time'.
+
+        Returns:
+            str: O token de autorização, no mesmo formato de `retrieve_auth`.
+        """
+        mensagem = (
+            f'POST\n{self.conteudo_md5(conteudo)}\napplication/json\n'
+            f'{now}\n{endpoint}'
+        )
+        assinatura = hmac.new(
+            self._chave, mensagem.encode('utf-8'), hashlib.sha1
+        ).digest()
+        return f'{self.prefixo}:{base64.b64encode(assinatura).decode("utf-8")}'
+
+
+ASSINADOR_SOLIS = AssinadorSolis()
+
+
 def login_solis(data):
     """
     Realiza o login no sistema Solis.
@@ -4067,13 +3919,12 @@ def login_solis(data):
         json_string = json.dumps(json_data)
         e = json_string.replace(' ', '')
 
-        authorization = retrieve_auth('/user/login2', e, now)
+        authorization = ASSINADOR_SOLIS.assina('/user/login2', e, now)
 
-        data['sess'] = requests.Session()
+        data['sess'] = nova_sessao()
 
         json_str = json.dumps(json_data, separators=(',', ':'))
-        md5_hash = hashlib.md5(json_str.encode('utf-8')).digest()
-        content_md5 = base64.b64encode(md5_hash).decode('utf-8')
+        content_md5 = ASSINADOR_SOLIS.conteudo_md5(json_str)
 
         data['headers'] = {
             'authorization': authorization,
@@ -4095,8 +3946,8 @@ def login_solis(data):
             print(
                 f'Erro: csrfToken não encontrado na resposta. Tentativa {tentativa + 1} de {max_tentativas}'
             )
-            t.sleep(5)
             tentativa += 1
+            espera_nova_tentativa(tentativa)
 
     else:
         print(
@@ -4150,11 +4001,10 @@ def atualiza_clientes_solis(data):
     json_string = json.dumps(json_data)
     e = json_string.replace(' ', '')
 
-    authorization = retrieve_auth('/station/list', e, now)
+    authorization = ASSINADOR_SOLIS.assina('/station/list', e, now)
 
     json_str = json.dumps(json_data, separators=(',', ':'))
-    md5_hash = hashlib.md5(json_str.encode('utf-8')).digest()
-    content_md5 = base64.b64encode(md5_hash).decode('utf-8')
+    content_md5 = ASSINADOR_SOLIS.conteudo_md5(json_str)
 
     data['headers'].update(
         {
@@ -4187,7 +4037,7 @@ def atualiza_clientes_solis(data):
     for plant in plants:
 
         cliente = {
-            'inverter': Inversor.objects.get(name='solis'),
+            'inverter': CACHE_INVERSORES.obtem('solis'),
             'plant_id': plant['id'],
             'plant_name': plant['name'],
             'energy_today': f'{plant["energy_today"]}',
@@ -4201,139 +4051,107 @@ def atualiza_clientes_solis(data):
     append_clientes(clientes)
 
 
-def atualiza_geracao_diaria_solis(data):
+def busca_geracao_diaria_solis(data: dict, cliente) -> list:
     """
-    Atualiza as informações de geração de energia diária (gráfico horário) para clientes Solis.
-
-    Esta função realiza requisições para obter informações mensais sobre a geração
-    de energia de clientes Solis. Os dados são processados e armazenados.
+    Busca a geração diária (gráfico horário) de uma planta Solis.
 
     Args:
-        data (dict): Um dicionário contendo informações necessárias para a atualização.
-        
-            - sess (requests.Session): Sessão para realizar as requisições.
-            
-            - api_url (str): URL da API Solis.
-            
-            - clientes (list): Lista de objetos cliente Solis.
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Solis a ser buscada.
 
     Returns:
-        None
-
+        list: Registros de geração diária da planta, prontos para `append_daily_generation`.
     """
     generation_day = []
 
-    for cliente in data['clientes']:
-
-        dia = datetime.now()
-        encerrar_loop = False
-
-        ultimo_dia = buscar_ultima_informacao_diaria(cliente)
+    for dia in dias_do_plano(data['planos'][cliente.pk]):
+        # Define as configurações regionais para inglês
+        locale.setlocale(locale.LC_TIME, 'en_US.utf8')
 
-        while True:
+        now = datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT')
 
-            if encerrar_loop == True:
-                break
+        json_data = {
+            'id': cliente.plant_id,
+            'language': '9',
+            'localTimeZone': -3,
+            'money': 'BRL',
+            'time': dia.strftime('%Y-%m-%d'),
+            'timeZone': -3,
+            'version': 1,
+        }
 
-            # Define as configurações regionais para inglês
-            locale.setlocale(locale.LC_TIME, 'en_US.utf8')
+        json_string = json.dumps(json_data)
+        e = json_string.replace(' ', '')
 
-            now = datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT')
+        authorization = ASSINADOR_SOLIS.assina('/chart/station/day/v2', e, now)
 
-            json_data = {
-                'id': cliente.plant_id,
-                'language': '9',
-                'localTimeZone': -3,
-                'money': 'BRL',
-                'time': dia.strftime('%Y-%m-%d'),
-                'timeZone': -3,
-                'version': 1,
-            }
+        json_str = json.dumps(json_data, separators=(',', ':'))
+        content_md5 = ASSINADOR_SOLIS.conteudo_md5(json_str)
 
-            json_string = json.dumps(json_data)
-            e = json_string.replace(' ', '')
+        headers = {
+            **data['headers'],
+            'token': data['token'],
+            'time': now,
+            'authorization': authorization,
+            'content-md5': content_md5,
+        }
 
-            authorization = retrieve_auth('/chart/station/day/v2', e, now)
+        response = data['sess'].post(
+            f'{data["api_url"]}/chart/station/day/v2',
+            headers=headers,
+            json=json_data,
+        )
 
-            json_str = json.dumps(json_data, separators=(',', ':'))
-            md5_hash = hashlib.md5(json_str.encode('utf-8')).digest()
-            content_md5 = base64.b64encode(md5_hash).decode('utf-8')
+        response_data = response.json()
 
-            data['headers'].update(
-                {
-                    'token': data['token'],
-                    'time': now,
-                    'authorization': authorization,
-                    'content-md5': content_md5,
-                }
-            )
+        if not response_data['data']:
+            continue
 
-            response = data['sess'].post(
-                f'{data["api_url"]}/chart/station/day/v2',
-                headers=data['headers'],
-                json=json_data,
+        records = [
+            {'power': power, 'time': time}
+            for power, time in zip(
+                response_data['data']['power'],
+                response_data['data']['time'],
             )
+        ]
+
+        sorted_data = sorted(
+            records,
+            key=lambda x: datetime.fromtimestamp(
+                x['time'] / 1000.0, data['tz']
+            ),
+            reverse=True,
+        )
 
-            response_data = response.json()
-
-            if not response_data['data']:
-                break
+        for record in sorted_data:
 
-            records = [
-                {'power': power, 'time': time}
-                for power, time in zip(
-                    response_data['data']['power'],
-                    response_data['data']['time'],
-                )
-            ]
+            energy = record['power']
+            timestamp = record['time']
 
-            sorted_data = sorted(
-                records,
-                key=lambda x: datetime.fromtimestamp(
-                    x['time'] / 1000.0, data['tz']
-                ),
-                reverse=True,
+            data_obj = datetime.fromtimestamp(
+                timestamp / 1000.0, data['tz']
             )
 
-            for record in sorted_data:
-
-                energy = record['power']
-                timestamp = record['time']
-
-                data_obj = datetime.fromtimestamp(
-                    timestamp / 1000.0, data['tz']
-                )
-
-                if ultimo_dia and (
-                    data_obj.astimezone(pytz.timezone('America/Sao_Paulo'))
-                    < (ultimo_dia - timedelta(hours=2))
-                ):
-                    encerrar_loop = True
-                    break
-
-                generation_day.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': energy,
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation_day) > LIMITE:
-                    append_daily_generation(generation_day)
-                    generation_day = []
-            dia -= relativedelta(days=1)
+            generation_day.append(
+                {
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': data_obj,
+                    'generation': energy,
+                    'cliente': cliente,
+                }
+            )
 
-    append_daily_generation(generation_day)
+    return generation_day
 
 
-def atualiza_geracao_solis(data):
+def atualiza_geracao_diaria_solis(data):
     """
-    Atualiza as informações de geração de energia para clientes Solis.
+    Atualiza as informações de geração de energia diária (gráfico horário) para clientes Solis.
 
     Esta função realiza requisições para obter informações mensais sobre a geração
     de energia de clientes Solis. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_diaria`.
 
     Args:
         data (dict): Um dicionário contendo informações necessárias para a atualização.
@@ -4346,96 +4164,113 @@ def atualiza_geracao_solis(data):
 
     Returns:
         None
+
+    """
+    executa_geracao_diaria([data], 'solis', busca_geracao_diaria_solis)
+
+
+def busca_geracao_solis(data: dict, cliente) -> list:
+    """
+    Busca a geração completa (valores diários por mês) de uma planta Solis.
+
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a busca.
+        cliente (Cliente): A planta Solis a ser buscada.
+
+    Returns:
+        list: Registros de geração completa da planta, prontos para `append_complete_generation`.
     """
     generation = []
 
-    for cliente in data['clientes']:
+    for dia in meses_do_plano(data['planos'][cliente.pk]):
+        # Define as configurações regionais para inglês
+        locale.setlocale(locale.LC_TIME, 'en_US.utf8')
 
-        dia = datetime.now()
-        encerrar_loop = False
+        now = datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT')
 
-        ultimo_dia = buscar_ultima_informacao_completa(cliente)
+        json_data = {
+            'id': cliente.plant_id,
+            'language': '9',
+            'localTimeZone': -3,
+            'money': 'BRL',
+            'month': dia.strftime('%Y-%m'),
+            'timeZone': -3,
+            'version': 1,
+        }
 
-        while True:
+        json_string = json.dumps(json_data)
+        e = json_string.replace(' ', '')
 
-            if encerrar_loop:
-                break
+        authorization = ASSINADOR_SOLIS.assina('/chart/station/month', e, now)
 
-            # Define as configurações regionais para inglês
-            locale.setlocale(locale.LC_TIME, 'en_US.utf8')
+        json_str = json.dumps(json_data, separators=(',', ':'))
+        content_md5 = ASSINADOR_SOLIS.conteudo_md5(json_str)
 
-            now = datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT')
+        headers = {
+            **data['headers'],
+            'token': data['token'],
+            'time': now,
+            'authorization': authorization,
+            'content-md5': content_md5,
+        }
 
-            json_data = {
-                'id': cliente.plant_id,
-                'language': '9',
-                'localTimeZone': -3,
-                'money': 'BRL',
-                'month': dia.strftime('%Y-%m'),
-                'timeZone': -3,
-                'version': 1,
-            }
+        response = data['sess'].post(
+            f'{data["api_url"]}/chart/station/month',
+            headers=headers,
+            json=json_data,
+        )
 
-            json_string = json.dumps(json_data)
-            e = json_string.replace(' ', '')
+        response_data = response.json()
 
-            authorization = retrieve_auth('/chart/station/month', e, now)
+        if not response_data['data']:
+            continue
 
-            json_str = json.dumps(json_data, separators=(',', ':'))
-            md5_hash = hashlib.md5(json_str.encode('utf-8')).digest()
-            content_md5 = base64.b64encode(md5_hash).decode('utf-8')
+        sorted_data = sorted(
+            response_data['data'],
+            key=lambda x: datetime.fromtimestamp(
+                x['date'] / 1000.0, data['tz']
+            ),
+            reverse=True,
+        )
 
-            data['headers'].update(
-                {
-                    'token': data['token'],
-                    'time': now,
-                    'authorization': authorization,
-                    'content-md5': content_md5,
-                }
+        for energy in sorted_data:
+            data_obj = datetime.fromtimestamp(
+                energy['date'] / 1000.0, data['tz']
             )
 
-            response = data['sess'].post(
-                f'{data["api_url"]}/chart/station/month',
-                headers=data['headers'],
-                json=json_data,
+            generation.append(
+                {
+                    'plant_id': cliente.plant_id,
+                    'plant_name': cliente.plant_name,
+                    'date': data_obj,
+                    'generation': f'{energy["energy"]} kwh',
+                    'cliente': cliente,
+                }
             )
 
-            response_data = response.json()
+    return generation
 
-            if not response_data['data']:
-                break
-
-            sorted_data = sorted(
-                response_data['data'],
-                key=lambda x: datetime.fromtimestamp(
-                    x['date'] / 1000.0, data['tz']
-                ),
-                reverse=True,
-            )
 
-            for energy in sorted_data:
-                data_obj = datetime.fromtimestamp(
-                    energy['date'] / 1000.0, data['tz']
-                )
+def atualiza_geracao_solis(data):
+    """
+    Atualiza as informações de geração de energia para clientes Solis.
 
-                if ultimo_dia and (
-                    data_obj.date() < (ultimo_dia - timedelta(days=2))
-                ):
-                    encerrar_loop = True
-                    break
+    Esta função realiza requisições para obter informações mensais sobre a geração
+    de energia de clientes Solis. Os dados são processados e armazenados.
+    As plantas são buscadas de forma concorrente por `executa_geracao_completa_planejada`.
 
-                generation.append(
-                    {
-                        'plant_id': cliente.plant_id,
-                        'plant_name': cliente.plant_name,
-                        'date': data_obj,
-                        'generation': f'{energy["energy"]} kwh',
-                        'cliente': cliente,
-                    }
-                )
-                if len(generation) > LIMITE:
-                    append_complete_generation(generation)
-                    generation = []
-            dia -= relativedelta(months=1)
+    Args:
+        data (dict): Um dicionário contendo informações necessárias para a atualização.
+        
+            - sess (requests.Session): Sessão para realizar as requisições.
+            
+            - api_url (str): URL da API Solis.
+            
+            - clientes (list): Lista de objetos cliente Solis.
 
-    append_complete_generation(generation)
+    Returns:
+        None
+    """
+    executa_geracao_completa_planejada(
+        [data], 'solis', busca_geracao_solis
+    )
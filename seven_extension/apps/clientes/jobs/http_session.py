@@ -0,0 +1,115 @@
+import requests
+from apps.clientes.jobs.fetch_engine import CONCORRENCIA_MAXIMA
+from apps.clientes.jobs.limite_taxa import balde_host, segundos_retry_after
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Tempo máximo (em segundos) para conectar e para aguardar a resposta dos portais
+TIMEOUT_PADRAO = (10, 60)
+
+# Conexões mantidas por host. Acompanha o limite de threads de um inversor, para que
+# nenhuma thread do pool descarte a conexão ao devolvê-la.
+TAMANHO_POOL = CONCORRENCIA_MAXIMA
+
+# Hosts distintos com pool mantido em memória (um por portal de inversor)
+HOSTS_POOL = 20
+
+# Repetições automáticas para falhas de conexão e respostas de sobrecarga do portal.
+# O erro 500 fica de fora porque alguns portais o usam para sessão expirada,
+# tratada pelas rotinas de cada inversor com um novo login. O erro 429 é tratado
+# pelo limitador de taxa de cada host (ver `limite_taxa`).
+RETRY_PADRAO = Retry(
+    total=3,
+    connect=3,
+    read=2,
+    backoff_factor=1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=None,
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Novas tentativas de uma requisição recusada com 429, respeitando o Retry-After
+TENTATIVAS_429 = 3
+
+# Respostas que indicam sobrecarga do portal e reduzem a taxa do host
+STATUS_SOBRECARGA = (429, 502, 503)
+
+# Adaptador compartilhado por todas as sessões: as conexões de cada host são
+# reaproveitadas entre logins e entre execuções dos jobs.
+_adaptador = HTTPAdapter(
+    pool_connections=HOSTS_POOL,
+    pool_maxsize=TAMANHO_POOL,
+    max_retries=RETRY_PADRAO,
+)
+
+
+class SessaoInversor(requests.Session):
+    """
+    Sessão HTTP usada nos portais de inversores.
+
+    Cada login cria a sua própria sessão (cookies e cabeçalhos não são compartilhados),
+    mas todas usam o mesmo pool de conexões, com retry e timeout padrão, e o mesmo
+    limitador de taxa por host.
+
+    Attributes:
+        timeout (tuple): Timeout de conexão e de leitura aplicado quando a requisição não define um.
+    """
+
+    def __init__(self, timeout: tuple = TIMEOUT_PADRAO):
+        super().__init__()
+        self.timeout = timeout
+        self.mount('https://', _adaptador)
+        self.mount('http://', _adaptador)
+
+    def request(self, method, url, **kwargs):
+        """
+        Realiza a requisição aplicando o timeout padrão quando nenhum for informado.
+
+        Antes de cada envio, aguarda a vez no balde de tokens do host. Respostas de
+        sobrecarga reduzem a taxa do host e, no caso do 429, a requisição é repetida
+        depois do tempo pedido no Retry-After.
+
+        Args:
+            method (str): O método HTTP.
+            url (str): A URL da requisição.
+            **kwargs: Argumentos repassados para `requests.Session.request`.
+
+        Returns:
+            requests.Response: A resposta da requisição.
+        """
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+
+        balde = balde_host(url)
+        for _ in range(TENTATIVAS_429):
+            balde.aguarda()
+            response = super().request(method, url, **kwargs)
+
+            if response.status_code not in STATUS_SOBRECARGA:
+                balde.recompensa()
+                break
+
+            balde.penaliza(
+                segundos_retry_after(response.headers.get('Retry-After'))
+            )
+            if response.status_code != 429:
+                break
+
+        return response
+
+    def close(self):
+        """
+        Encerra a sessão sem fechar o pool de conexões, que é compartilhado.
+        """
+        self.cookies.clear()
+
+
+def nova_sessao() -> SessaoInversor:
+    """
+    Cria uma sessão para o login em um portal de inversor.
+
+    Returns:
+        SessaoInversor: A nova sessão, ligada ao pool de conexões compartilhado.
+    """
+    return SessaoInversor()
@@ -0,0 +1,401 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Protocol
+
+import pytz
+from apps.clientes.jobs import get_inversor_energy as gie
+from apps.clientes.jobs.sessao_cache import executa_autenticado
+from apps.clientes.models import Cliente, CredencialInversor
+from django.db import connection
+
+
+class AdaptadorInversor(Protocol):
+    """
+    Interface comum dos inversores.
+
+    Cada inversor informa como autenticar, atualizar a lista de plantas e buscar a
+    geração de uma planta. Concorrência, lotes de gravação, cache de sessão e
+    plano de busca são aplicados de forma igual a todos em `executa_geracao_horaria`
+    e `executa_geracao_completa`.
+
+    Attributes:
+        nome (str): O nome do inversor, igual ao `Inversor.name`.
+        api_url (str): A URL base da API do portal.
+    """
+
+    nome: str
+    api_url: str
+
+    def prepara(self, data: dict) -> None:
+        """Completa `data` com as chaves específicas do inversor, antes do login."""
+
+    def login(self, data: dict) -> None:
+        """Autentica no portal e guarda a sessão em `data`."""
+
+    def atualiza_clientes(self, data: dict) -> None:
+        """Atualiza a lista de plantas (Cliente) do inversor."""
+
+    def busca_geracao_diaria(self, data: dict, cliente) -> list:
+        """Busca a geração diária (gráfico horário) de uma planta."""
+
+    def busca_geracao(self, data: dict, cliente) -> list:
+        """Busca a geração completa (valores diários) de uma planta."""
+
+
+class AdaptadorFuncoes:
+    """
+    Adaptador montado a partir das funções de um inversor em `get_inversor_energy`.
+
+    Attributes:
+        nome (str): O nome do inversor.
+        api_url (str): A URL base da API do portal.
+        extras (dict): Chaves fixas adicionadas a `data` antes do login.
+    """
+
+    def __init__(
+        self,
+        nome: str,
+        api_url: str,
+        login: Callable,
+        atualiza_clientes: Callable,
+        busca_geracao_diaria: Callable,
+        busca_geracao: Callable,
+        extras: dict = None,
+        prepara: Callable = None,
+    ):
+        self.nome = nome
+        self.api_url = api_url
+        self.extras = extras or {}
+        self.login = login
+        self.atualiza_clientes = atualiza_clientes
+        self.busca_geracao_diaria = busca_geracao_diaria
+        self.busca_geracao = busca_geracao
+        self._prepara = prepara
+
+    def prepara(self, data: dict) -> None:
+        data['api_url'] = self.api_url
+        data.update(self.extras)
+        if self._prepara is not None:
+            self._prepara(data)
+
+
+INVERSORES = {}
+
+
+def registra_inversor(adaptador: AdaptadorInversor) -> AdaptadorInversor:
+    """
+    Registra o adaptador de um inversor.
+
+    Args:
+        adaptador (AdaptadorInversor): O adaptador a registrar.
+
+    Returns:
+        AdaptadorInversor: O próprio adaptador.
+    """
+    INVERSORES[adaptador.nome] = adaptador
+    return adaptador
+
+
+def obtem_inversor(nome: str) -> AdaptadorInversor:
+    """
+    Retorna o adaptador registrado de um inversor.
+
+    Args:
+        nome (str): O nome do inversor.
+
+    Returns:
+        AdaptadorInversor: O adaptador do inversor.
+
+    Raises:
+        KeyError: Se o inversor não estiver registrado.
+    """
+    return INVERSORES[nome]
+
+
+def _senha_sha256(data: dict) -> None:
+    data['hashed_password'] = gie.hash_password(data['password'])
+
+
+registra_inversor(
+    AdaptadorFuncoes(
+        'growatt',
+        'https://server.growatt.com/',
+        gie.login_growatt,
+        gie.atualiza_clientes_growatt,
+        gie.busca_geracao_diaria_growatt,
+        gie.busca_geracao_growatt,
+    )
+)
+registra_inversor(
+    AdaptadorFuncoes(
+        'sungrow',
+        'https://gateway.isolarcloud.com.hk',
+        gie.login_sungrow,
+        gie.atualiza_clientes_sungrow,
+        gie.busca_geracao_diaria_sungrow,
+        gie.busca_geracao_sungrow,
+    )
+)
+registra_inversor(
+    AdaptadorFuncoes(
+        'abb_fimer',
+        'https://www.auroravision.net',
+        gie.login_abb_fimer,
+        gie.atualiza_clientes_abb_fimer,
+        gie.busca_geracao_diaria_abb_fimer,
+        gie.busca_geracao_abb_fimer,
+    )
+)
+registra_inversor(
+    AdaptadorFuncoes(
+        'fronius',
+        'https://www.solarweb.com',
+        gie.login_fronius,
+        gie.atualiza_clientes_fronius,
+        gie.busca_geracao_diaria_fronius,
+        gie.busca_geracao_fronius,
+    )
+)
+registra_inversor(
+    AdaptadorFuncoes(
+        'refusol',
+        'https://refu-log.com',
+        gie.login_refusol,
+        gie.atualiza_clientes_refusol,
+        gie.busca_geracao_diaria_refusol,
+        gie.busca_geracao_refusol,
+    )
+)
+registra_inversor(
+    AdaptadorFuncoes(
+        'canadian',
+        'https://monitoring.csisolar.com',
+        gie.login_canadian,
+        gie.atualiza_clientes_canadian,
+        gie.busca_geracao_diaria_canadian,
+        gie.busca_geracao_canadian,
+        extras={'inversor': 'canadian'},
+        prepara=_senha_sha256,
+    )
+)
+registra_inversor(
+    AdaptadorFuncoes(
+        'deye',
+        'https://pro.solarmanpv.com',
+        gie.login_deye,
+        gie.atualiza_clientes_deye,
+        gie.busca_geracao_diaria_deye,
+        gie.busca_geracao_deye,
+        extras={'inversor': 'deye'},
+        prepara=_senha_sha256,
+    )
+)
+registra_inversor(
+    AdaptadorFuncoes(
+        'ecosolys',
+        'https://portal.ecosolys.com.br:8843',
+        gie.login_ecosolys,
+        gie.atualiza_clientes_ecosolys,
+        gie.busca_geracao_diaria_ecosolys,
+        gie.busca_geracao_ecosolys,
+        extras={
+            'provider': 'https://portal.ecosolys.com.br:9443/auth/realms/ecoSolys/protocol/openid-connect'
+        },
+    )
+)
+registra_inversor(
+    AdaptadorFuncoes(
+        'solis',
+        'https://www.soliscloud.com:15555',
+        gie.login_solis,
+        gie.atualiza_clientes_solis,
+        gie.busca_geracao_diaria_solis,
+        gie.busca_geracao_solis,
+        extras={'tz': pytz.timezone('America/Sao_Paulo')},
+    )
+)
+
+
+# Credenciais de um mesmo inversor autenticadas ao mesmo tempo
+CONCORRENCIA_LOGIN = 4
+
+
+def _autentica_credencial(adaptador: AdaptadorInversor, credencial) -> dict:
+    """
+    Autentica uma credencial e atualiza a lista de plantas da conta.
+
+    Usa a sessão em cache da credencial (`executa_autenticado`) quando ainda válida.
+
+    Args:
+        adaptador (AdaptadorInversor): O adaptador do inversor.
+        credencial (CredencialInversor): A credencial a autenticar.
+
+    Returns:
+        dict: O dicionário `data` autenticado da credencial.
+    """
+    data = {
+        'empresa_id': credencial.empresa_id,
+        'username': credencial.usuario,
+        'password': credencial.senha,
+    }
+    adaptador.prepara(data)
+
+    try:
+        executa_autenticado(
+            data, credencial, adaptador.login, adaptador.atualiza_clientes
+        )
+    finally:
+        connection.close()
+
+    return data
+
+
+def distribui_clientes(
+    nome: str, credenciais: list, autenticadas: list
+) -> list:
+    """
+    Define quais plantas do inversor são buscadas com cada credencial autenticada.
+
+    Uma credencial de cliente (`CredencialInversor.cliente`) busca apenas aquela planta.
+    As demais buscam as plantas da sua empresa (RelacaoClienteEmpresa); se uma empresa
+    tiver mais de uma credencial, as plantas ficam com a primeira. Uma planta nunca é
+    buscada com a credencial de outra empresa: plantas sem credencial própria, ou cuja
+    credencial falhou no login, são ignoradas e registradas no log.
+
+    Se o inversor tiver uma única credencial, ela busca todas as plantas, como antes
+    da divisão por credencial.
+
+    Args:
+        nome (str): O nome do inversor.
+        credenciais (list): Todas as credenciais do inversor, na ordem de prioridade.
+        autenticadas (list): As credenciais que fizeram login, na mesma ordem.
+
+    Returns:
+        list: A lista de plantas (Cliente) de cada credencial autenticada, na mesma ordem.
+    """
+    clientes = list(
+        Cliente.objects.filter(inverter__name=nome).select_related(
+            'relacaoclienteempresa'
+        )
+    )
+    if len(credenciais) == 1:
+        return [clientes] if autenticadas else []
+
+    por_cliente = {}
+    por_empresa = {}
+    for credencial in credenciais:
+        if credencial.cliente_id:
+            por_cliente.setdefault(credencial.cliente_id, credencial.pk)
+        elif credencial.empresa_id:
+            por_empresa.setdefault(credencial.empresa_id, credencial.pk)
+
+    indices = {
+        credencial.pk: indice for indice, credencial in enumerate(autenticadas)
+    }
+    distribuicao = [[] for _ in autenticadas]
+    sem_credencial = []
+    com_falha = []
+    for cliente in clientes:
+        relacao = getattr(cliente, 'relacaoclienteempresa', None)
+        credencial_id = por_cliente.get(
+            cliente.pk,
+            por_empresa.get(relacao.empresa_id if relacao else None),
+        )
+        if credencial_id is None:
+            sem_credencial.append(cliente.plant_name)
+        elif credencial_id not in indices:
+            com_falha.append(cliente.plant_name)
+        else:
+            distribuicao[indices[credencial_id]].append(cliente)
+
+    if sem_credencial:
+        print(
+            f'{nome} - Plantas ignoradas, sem credencial da própria empresa: {sem_credencial}'
+        )
+    if com_falha:
+        print(
+            f'{nome} - Plantas ignoradas, credencial sem login: {com_falha}'
+        )
+
+    return distribuicao
+
+
+def autentica_credenciais(nome: str) -> list:
+    """
+    Autentica todas as credenciais de um inversor e atualiza as suas plantas.
+
+    Os logins são feitos em paralelo (até `CONCORRENCIA_LOGIN`) e de forma isolada:
+    a falha de uma credencial é registrada e as demais seguem normalmente.
+
+    Args:
+        nome (str): O nome do inversor.
+
+    Returns:
+        list: Os dicionários `data` das credenciais autenticadas, com as plantas de cada uma em 'clientes'.
+    """
+    adaptador = obtem_inversor(nome)
+    credenciais = list(
+        CredencialInversor.objects.filter(inversor__name=nome).order_by('id')
+    )
+
+    autenticadas = []
+    contextos = []
+    with ThreadPoolExecutor(
+        max_workers=CONCORRENCIA_LOGIN, thread_name_prefix=f'{nome}_login'
+    ) as executor:
+        futuros = [
+            executor.submit(_autentica_credencial, adaptador, credencial)
+            for credencial in credenciais
+        ]
+        for credencial, futuro in zip(credenciais, futuros):
+            try:
+                contextos.append(futuro.result())
+                autenticadas.append(credencial)
+            except Exception as e:
+                print(
+                    f'{nome} - Erro ao autenticar a credencial {credencial.usuario}: {e}'
+                )
+
+    for data, clientes in zip(
+        contextos, distribui_clientes(nome, credenciais, autenticadas)
+    ):
+        data['clientes'] = clientes
+
+    return contextos
+
+
+def executa_geracao_horaria(nome: str) -> None:
+    """
+    Executa o job horário de um inversor: login, plantas e geração diária.
+
+    Todas as credenciais do inversor são atendidas na mesma execução, com as plantas
+    de todas elas buscadas em um único pool e gravadas pela mesma etapa de gravação.
+
+    Args:
+        nome (str): O nome do inversor.
+
+    Returns:
+        None
+    """
+    contextos = autentica_credenciais(nome)
+    gie.executa_geracao_diaria(
+        contextos, nome, obtem_inversor(nome).busca_geracao_diaria
+    )
+
+
+def executa_geracao_completa(nome: str) -> None:
+    """
+    Executa o job diário de um inversor: login, plantas e geração completa.
+
+    Todas as credenciais do inversor são atendidas na mesma execução, com as plantas
+    de todas elas buscadas em um único pool e gravadas pela mesma etapa de gravação.
+
+    Args:
+        nome (str): O nome do inversor.
+
+    Returns:
+        None
+    """
+    contextos = autentica_credenciais(nome)
+    gie.executa_geracao_completa_planejada(
+        contextos, nome, obtem_inversor(nome).busca_geracao
+    )
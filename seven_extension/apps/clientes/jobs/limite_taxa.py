@@ -0,0 +1,155 @@
+import threading
+import time as t
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+# Requisições por segundo de cada host: (taxa inicial, taxa máxima).
+# A taxa cai pela metade a cada resposta de sobrecarga (429, 502 ou 503) e volta a subir
+# aos poucos a cada resposta normal, até a taxa máxima.
+LIMITES_HOST = {
+    'geocode.maps.co': (1, 1),  # Limite do plano gratuito da API de geocodificação
+    'www.solarweb.com': (2, 8),  # Fronius
+    'portal.ecosolys.com.br': (2, 8),
+    'pro.solarmanpv.com': (4, 16),  # Deye
+    'monitoring.csisolar.com': (4, 16),  # Canadian
+}
+LIMITE_PADRAO = (8, 32)
+
+# Menor taxa a que um host pode ser reduzido (uma requisição a cada 5 segundos)
+TAXA_MINIMA = 0.2
+
+# Quanto a taxa sobe a cada resposta normal
+AUMENTO_TAXA = 0.1
+
+# Espera (em segundos) antes de repetir um login ou uma requisição que falhou,
+# dobrada a cada falha seguida até o máximo
+ESPERA_BASE = 5
+ESPERA_MAXIMA = 60
+
+
+def segundos_retry_after(valor: str) -> float:
+    """
+    Converte o cabeçalho Retry-After em segundos.
+
+    Args:
+        valor (str): O valor do cabeçalho, em segundos ou em data HTTP.
+
+    Returns:
+        float: Os segundos a aguardar, ou 0 se o valor for inválido.
+    """
+    if not valor:
+        return 0
+    try:
+        return max(0.0, float(valor))
+    except ValueError:
+        pass
+    try:
+        data = parsedate_to_datetime(valor)
+    except (TypeError, ValueError):
+        return 0
+    return max(0.0, (data - datetime.now(timezone.utc)).total_seconds())
+
+
+class BaldeTokens:
+    """
+    Balde de tokens que limita a taxa de requisições a um host.
+
+    É compartilhado por todas as threads que acessam o mesmo host. Cada requisição
+    consome um token; quando não há tokens, a thread aguarda a vez dela.
+
+    Attributes:
+        taxa (float): Requisições por segundo permitidas no momento.
+        taxa_maxima (float): Limite superior da taxa.
+    """
+
+    def __init__(self, taxa: float, taxa_maxima: float):
+        self.taxa = taxa
+        self.taxa_maxima = taxa_maxima
+        self._tokens = 1.0
+        self._ultimo = t.monotonic()
+        self._trava = threading.Lock()
+
+    def aguarda(self) -> None:
+        """
+        Reserva um token, aguardando até que ele esteja disponível.
+
+        Returns:
+            None
+        """
+        with self._trava:
+            agora = t.monotonic()
+            self._tokens = min(
+                max(1.0, self.taxa),
+                self._tokens + (agora - self._ultimo) * self.taxa,
+            )
+            self._ultimo = agora
+            self._tokens -= 1
+            espera = -self._tokens / self.taxa if self._tokens < 0 else 0
+
+        if espera:
+            t.sleep(espera)
+
+    def penaliza(self, espera: float = 0) -> None:
+        """
+        Reduz a taxa pela metade e, se informado, pausa o host.
+
+        Args:
+            espera (float): Segundos em que nenhuma requisição deve ser feita (Retry-After).
+
+        Returns:
+            None
+        """
+        with self._trava:
+            self.taxa = max(TAXA_MINIMA, self.taxa / 2)
+            if espera:
+                self._tokens = 0.0
+                self._ultimo = max(self._ultimo, t.monotonic() + espera)
+
+    def recompensa(self) -> None:
+        """
+        Aumenta a taxa após uma resposta normal, até a taxa máxima.
+
+        Returns:
+            None
+        """
+        with self._trava:
+            self.taxa = min(self.taxa_maxima, self.taxa + AUMENTO_TAXA)
+
+
+_baldes = {}
+_trava_baldes = threading.Lock()
+
+
+def balde_host(url: str) -> BaldeTokens:
+    """
+    Retorna o balde de tokens do host de uma URL, criando-o no primeiro uso.
+
+    Args:
+        url (str): A URL da requisição.
+
+    Returns:
+        BaldeTokens: O balde compartilhado do host.
+    """
+    host = urlsplit(url).hostname or ''
+    with _trava_baldes:
+        if host not in _baldes:
+            _baldes[host] = BaldeTokens(*LIMITES_HOST.get(host, LIMITE_PADRAO))
+        return _baldes[host]
+
+
+def espera_nova_tentativa(falhas: int) -> None:
+    """
+    Aguarda antes de repetir um login ou uma requisição que falhou.
+
+    Usado nas rotinas que repetem o login ou a requisição. A espera dobra a cada falha
+    seguida, até `ESPERA_MAXIMA`. Só afeta a thread que falhou: o host é penalizado
+    apenas nas respostas de sobrecarga, pela `SessaoInversor`.
+
+    Args:
+        falhas (int): Quantidade de falhas seguidas, a partir de 1.
+
+    Returns:
+        None
+    """
+    t.sleep(min(ESPERA_BASE * 2 ** max(falhas - 1, 0), ESPERA_MAXIMA))
@@ -0,0 +1,144 @@
+import json
+
+from apps.clientes.models import Cliente, VersaoCache
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F
+
+# Nome da versão do mapa das plantas em VersaoCache
+VERSAO_MAPA = 'mapa_plantas'
+
+# Casas decimais das coordenadas no GeoJSON (5 casas ≈ 1 metro)
+PRECISAO_COORDENADAS = 5
+
+
+def status_planta(energy_today: float, energy_total: float) -> str:
+    """
+    Retorna o status de uma planta, usado na cor do marcador no mapa.
+
+    Args:
+        energy_today (float): A energia gerada hoje.
+        energy_total (float): A energia total gerada.
+
+    Returns:
+        str: 'online', 'sem_comunicacao' (sem geração hoje) ou 'nunca_comunicou'.
+    """
+    if energy_today == 0 and energy_total == 0:
+        return 'nunca_comunicou'
+    if energy_today == 0:
+        return 'sem_comunicacao'
+    return 'online'
+
+
+def versao_mapa() -> int:
+    """
+    Retorna a versão atual do mapa das plantas.
+
+    Returns:
+        int: A versão, ou 0 se o mapa nunca foi invalidado.
+    """
+    versao = (
+        VersaoCache.objects.filter(nome=VERSAO_MAPA)
+        .values_list('versao', flat=True)
+        .first()
+    )
+    return versao or 0
+
+
+def invalida_mapa() -> None:
+    """
+    Invalida o mapa das plantas em cache em todos os processos.
+
+    A versão fica no banco, então a invalidação feita pelo runscheduler (em
+    `commit_clientes`) vale também para os processos do servidor web.
+
+    Returns:
+        None
+    """
+    atualizadas = VersaoCache.objects.filter(nome=VERSAO_MAPA).update(
+        versao=F('versao') + 1
+    )
+    if not atualizadas:
+        _, criada = VersaoCache.objects.get_or_create(
+            nome=VERSAO_MAPA, defaults={'versao': 1}
+        )
+        if not criada:
+            VersaoCache.objects.filter(nome=VERSAO_MAPA).update(
+                versao=F('versao') + 1
+            )
+
+
+def monta_geojson(clientes) -> str:
+    """
+    Monta o GeoJSON das plantas.
+
+    Plantas sem coordenadas (vazias, inválidas ou 0, 0) ficam de fora.
+
+    Args:
+        clientes (QuerySet): Os clientes do mapa.
+
+    Returns:
+        str: Uma FeatureCollection com um ponto por planta, com o nome e o status.
+    """
+    features = []
+    for nome, latitude, longitude, energy_today, energy_total in (
+        clientes.values_list(
+            'plant_name',
+            'latitude',
+            'longitude',
+            'energy_today',
+            'energy_total',
+        ).order_by('plant_name')
+    ):
+        try:
+            latitude = round(float(latitude), PRECISAO_COORDENADAS)
+            longitude = round(float(longitude), PRECISAO_COORDENADAS)
+        except (TypeError, ValueError):
+            continue
+        if latitude == 0 and longitude == 0:
+            continue
+
+        features.append(
+            {
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'Point',
+                    'coordinates': [longitude, latitude],
+                },
+                'properties': {
+                    'nome': nome,
+                    'status': status_planta(energy_today, energy_total),
+                },
+            }
+        )
+
+    return json.dumps(
+        {'type': 'FeatureCollection', 'features': features},
+        ensure_ascii=False,
+        separators=(',', ':'),
+    )
+
+
+def geojson_plantas(user_empresa, versao: int) -> str:
+    """
+    Retorna o GeoJSON das plantas visíveis para uma empresa, do cache se possível.
+
+    Args:
+        user_empresa: O id da empresa do usuário, ou 'admin' para todas as plantas.
+        versao (int): A versão atual do mapa, retornada por `versao_mapa`.
+
+    Returns:
+        str: O GeoJSON das plantas.
+    """
+    cache = caches[settings.CACHE_MAPA]
+    chave = f'{VERSAO_MAPA}:{user_empresa}:{versao}'
+    geojson = cache.get(chave)
+    if geojson is None:
+        clientes = Cliente.objects.all()
+        if user_empresa != 'admin':
+            clientes = clientes.filter(
+                relacaoclienteempresa__empresa=user_empresa
+            )
+        geojson = monta_geojson(clientes)
+        cache.set(chave, geojson)
+    return geojson
@@ -0,0 +1,244 @@
+from datetime import date, datetime
+
+import pytz
+from apps.clientes.models import GeracaoDiaria
+from dateutil.relativedelta import relativedelta
+from django.db import connection, transaction
+
+FUSO = pytz.timezone('America/Sao_Paulo')
+
+# Meses à frente do mês atual que devem ter partição criada
+MESES_FUTUROS = 3
+
+
+def _tabela() -> str:
+    return GeracaoDiaria._meta.db_table
+
+
+def nome_particao(mes: date) -> str:
+    """
+    Retorna o nome da partição mensal da GeracaoDiaria.
+
+    Args:
+        mes (date): Qualquer dia do mês da partição.
+
+    Returns:
+        str: O nome da tabela da partição, como 'clientes_geracaodiaria_202401'.
+    """
+    return f'{_tabela()}_{mes:%Y%m}'
+
+
+def _limites(mes: date) -> tuple:
+    """
+    Retorna o início e o fim (exclusivo) de um mês no fuso de São Paulo.
+
+    Args:
+        mes (date): Qualquer dia do mês.
+
+    Returns:
+        tuple: Os datetimes de início e fim do mês.
+    """
+    inicio = mes.replace(day=1)
+    fim = inicio + relativedelta(months=1)
+    return (
+        FUSO.localize(datetime.combine(inicio, datetime.min.time())),
+        FUSO.localize(datetime.combine(fim, datetime.min.time())),
+    )
+
+
+def tabela_particionada() -> bool:
+    """
+    Indica se a tabela da GeracaoDiaria já é particionada.
+
+    Returns:
+        bool: True se a tabela é uma tabela particionada do PostgreSQL.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_partitioned_table p '
+            'JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = %s',
+            [_tabela()],
+        )
+        return cursor.fetchone() is not None
+
+
+def lista_particoes() -> list:
+    """
+    Lista as partições mensais anexadas à tabela da GeracaoDiaria.
+
+    Returns:
+        list: Os nomes das partições mensais, em ordem cronológica. A partição padrão não é incluída.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT c.relname FROM pg_inherits i '
+            'JOIN pg_class c ON c.oid = i.inhrelid '
+            'JOIN pg_class p ON p.oid = i.inhparent '
+            'WHERE p.relname = %s ORDER BY c.relname',
+            [_tabela()],
+        )
+        return [
+            nome
+            for (nome,) in cursor.fetchall()
+            if nome != f'{_tabela()}_padrao'
+        ]
+
+
+def converte_tabela_particionada() -> int:
+    """
+    Converte a tabela da GeracaoDiaria em uma tabela particionada por mês.
+
+    A tabela atual é renomeada, uma tabela particionada por `timestamp` é criada
+    com as mesmas colunas e restrições e as linhas são copiadas para as partições
+    mensais, criadas desde o mês mais antigo até `MESES_FUTUROS` à frente. Linhas
+    fora de qualquer partição mensal vão para a partição padrão. Tudo é feito em
+    uma única transação, e a tabela antiga é removida ao final.
+
+    A chave primária passa a ser (id, timestamp), exigência do PostgreSQL para
+    tabelas particionadas, e o id passa a usar uma sequência comum, já que
+    colunas identity não são aceitas em tabelas particionadas. A restrição de
+    unicidade (cliente, timestamp), usada nos upserts, é mantida.
+
+    Returns:
+        int: A quantidade de partições mensais criadas.
+    """
+    qn = connection.ops.quote_name
+    tabela = _tabela()
+    legado = f'{tabela}_legado'
+    # O nome padrão da sequência continua em uso pela coluna identity da tabela antiga
+    sequencia = f'{tabela}_p_id_seq'
+    cliente = GeracaoDiaria._meta.get_field('cliente')
+    tabela_cliente = cliente.related_model._meta.db_table
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE {qn(tabela)} RENAME TO {qn(legado)}')
+        cursor.execute(
+            f'SELECT COALESCE(MAX(id), 0) + 1, MIN("timestamp") FROM {qn(legado)}'
+        )
+        proximo_id, mais_antigo = cursor.fetchone()
+
+        cursor.execute(
+            f'CREATE SEQUENCE {qn(sequencia)} START WITH %s', [proximo_id]
+        )
+        cursor.execute(
+            f'CREATE TABLE {qn(tabela)} ('
+            f"id bigint NOT NULL DEFAULT nextval('{sequencia}'::regclass), "
+            f'"timestamp" timestamp with time zone NOT NULL, '
+            f'energystamp double precision NOT NULL, '
+            f'cliente_id bigint NOT NULL, '
+            f'CONSTRAINT {qn(f"{tabela}_p_pkey")} PRIMARY KEY (id, "timestamp"), '
+            f'CONSTRAINT {qn(f"{tabela}_p_cliente_timestamp_uniq")} '
+            f'UNIQUE (cliente_id, "timestamp"), '
+            f'CONSTRAINT {qn(f"{tabela}_p_cliente_id_fk")} '
+            f'FOREIGN KEY (cliente_id) REFERENCES {qn(tabela_cliente)} (id) '
+            f'DEFERRABLE INITIALLY DEFERRED'
+            f') PARTITION BY RANGE ("timestamp")'
+        )
+        cursor.execute(
+            f'ALTER SEQUENCE {qn(sequencia)} OWNED BY {qn(tabela)}.id'
+        )
+        cursor.execute(
+            f'CREATE INDEX {qn("idx_gerdia_Dtimestamp_p")} '
+            f'ON {qn(tabela)} ("timestamp" DESC)'
+        )
+        cursor.execute(
+            f'CREATE TABLE {qn(f"{tabela}_padrao")} '
+            f'PARTITION OF {qn(tabela)} DEFAULT'
+        )
+
+        inicio = (
+            mais_antigo.astimezone(FUSO).date()
+            if mais_antigo
+            else date.today()
+        )
+        criadas = cria_particoes(inicio)
+
+        cursor.execute(
+            f'INSERT INTO {qn(tabela)} (id, "timestamp", energystamp, cliente_id) '
+            f'SELECT id, "timestamp", energystamp, cliente_id FROM {qn(legado)}'
+        )
+        cursor.execute(f'DROP TABLE {qn(legado)}')
+
+    return criadas
+
+
+def cria_particoes(inicio: date = None, meses_futuros: int = MESES_FUTUROS) -> int:
+    """
+    Cria as partições mensais que faltam, de `inicio` até `meses_futuros` à frente.
+
+    Linhas que já estejam na partição padrão dentro do mês de uma nova partição
+    são movidas para ela antes de anexá-la.
+
+    Args:
+        inicio (date): O primeiro mês a garantir. Por padrão, o mês atual.
+        meses_futuros (int): Quantos meses à frente do atual devem ter partição.
+
+    Returns:
+        int: A quantidade de partições criadas.
+    """
+    qn = connection.ops.quote_name
+    tabela = _tabela()
+    padrao = f'{tabela}_padrao'
+    existentes = set(lista_particoes())
+
+    mes = (inicio or date.today()).replace(day=1)
+    ultimo = date.today().replace(day=1) + relativedelta(months=meses_futuros)
+
+    criadas = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        while mes <= ultimo:
+            particao = nome_particao(mes)
+            if particao not in existentes:
+                de, ate = _limites(mes)
+                cursor.execute(
+                    f'CREATE TABLE {qn(particao)} '
+                    f'(LIKE {qn(tabela)} INCLUDING DEFAULTS)'
+                )
+                cursor.execute(
+                    f'WITH movidas AS (DELETE FROM {qn(padrao)} '
+                    f'WHERE "timestamp" >= %s AND "timestamp" < %s RETURNING *) '
+                    f'INSERT INTO {qn(particao)} SELECT * FROM movidas',
+                    [de, ate],
+                )
+                cursor.execute(
+                    f'ALTER TABLE {qn(tabela)} ATTACH PARTITION {qn(particao)} '
+                    f'FOR VALUES FROM (%s) TO (%s)',
+                    [de, ate],
+                )
+                criadas += 1
+            mes += relativedelta(months=1)
+
+    return criadas
+
+
+def desanexa_particoes(anteriores_a: date, remove: bool = False) -> list:
+    """
+    Desanexa as partições mensais anteriores a um mês.
+
+    Uma partição desanexada continua no banco como tabela comum, fora das
+    consultas da GeracaoDiaria, e pode ser arquivada ou removida depois.
+
+    Args:
+        anteriores_a (date): As partições de meses anteriores a este são desanexadas.
+        remove (bool): Se True, as partições desanexadas são removidas.
+
+    Returns:
+        list: Os nomes das partições desanexadas.
+    """
+    qn = connection.ops.quote_name
+    tabela = _tabela()
+    limite = nome_particao(anteriores_a.replace(day=1))
+
+    antigas = [
+        particao for particao in lista_particoes() if particao < limite
+    ]
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        for particao in antigas:
+            cursor.execute(
+                f'ALTER TABLE {qn(tabela)} DETACH PARTITION {qn(particao)}'
+            )
+            if remove:
+                cursor.execute(f'DROP TABLE {qn(particao)}')
+
+    return antigas
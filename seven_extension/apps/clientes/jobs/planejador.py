@@ -0,0 +1,381 @@
+import calendar
+from datetime import date, datetime, time, timedelta
+
+import pytz
+from apps.clientes.models import ClienteInfo, Geracao, GeracaoDiaria
+from dateutil.relativedelta import relativedelta
+from django.db.models import Count, Max, Min
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+
+BATCH_SIZE = 50
+
+# Marca usada para clientes sem nenhuma geração registrada
+MARCA_INICIAL = pytz.timezone('America/Sao_Paulo').localize(datetime(2001, 1, 1))
+
+# Dias examinados na GeracaoDiaria. Um cliente sem geração nesse período é
+# buscado a partir do início dele.
+HORIZONTE_DIAS = 90
+
+# Meses examinados na Geracao pelo job de geração completa
+HORIZONTE_MESES = 24
+
+# Os dias sem geração anteriores ao último dia com geração (lacunas) são
+# verificados de novo no máximo uma vez neste intervalo
+INTERVALO_LACUNAS = timedelta(days=1)
+
+# O mês do último dia gravado menos esta margem é buscado de novo pelo job de
+# geração completa, pois os valores dos últimos dias ainda podem mudar
+MARGEM_GERACAO_COMPLETA = timedelta(days=2)
+
+# Sem geração nova há mais que isso, o cliente é considerado parado e entra em espera
+TOLERANCIA_PARADO = timedelta(days=1)
+
+# Espera após cada execução sem geração nova: 2h, 4h, 8h... até ESPERA_MAXIMA
+ESPERA_BASE = timedelta(hours=1)
+ESPERA_MAXIMA = timedelta(days=1)
+
+
+def intervalos_faltantes(inicio: date, fim: date, cobertos) -> list:
+    """
+    Retorna os intervalos de dias consecutivos de um período que não estão cobertos.
+
+    Args:
+        inicio (date): O primeiro dia do período.
+        fim (date): O último dia do período.
+        cobertos (set): Os dias com geração.
+
+    Returns:
+        list: Tuplas `(primeiro, último)` de cada intervalo, do mais recente para o mais antigo.
+    """
+    intervalos = []
+    dia = fim
+    while dia >= inicio:
+        if dia in cobertos:
+            dia -= timedelta(days=1)
+            continue
+
+        ultimo = dia
+        while dia >= inicio and dia not in cobertos:
+            dia -= timedelta(days=1)
+        intervalos.append((dia + timedelta(days=1), ultimo))
+
+    return intervalos
+
+
+def dias_a_buscar(
+    hoje: date, limite: date, cobertos, verifica_lacunas: bool
+) -> list:
+    """
+    Calcula os intervalos de dias que o job de geração diária deve buscar para um cliente.
+
+    Os dias do último dia com geração até hoje são sempre buscados; o último dia
+    com geração por poder estar incompleto. As lacunas entre o primeiro e o último
+    dia com geração só são incluídas se `verifica_lacunas`. Sem nenhum dia com
+    geração, todo o período desde `limite` é buscado.
+
+    Args:
+        hoje (date): O dia atual.
+        limite (date): O primeiro dia do horizonte.
+        cobertos (set): Os dias do horizonte com geração.
+        verifica_lacunas (bool): Se as lacunas devem ser incluídas.
+
+    Returns:
+        list: Tuplas `(primeiro, último)` de cada intervalo, do mais recente para o mais antigo.
+    """
+    if not cobertos:
+        return [(limite, hoje)]
+
+    ultimo = max(cobertos)
+    intervalos = [(ultimo, hoje)]
+    if verifica_lacunas:
+        intervalos.extend(
+            intervalos_faltantes(
+                min(cobertos), ultimo - timedelta(days=1), cobertos
+            )
+        )
+    return intervalos
+
+
+def meses_a_buscar(
+    hoje: date,
+    limite: date,
+    dias_por_mes: dict,
+    primeiro_dia=None,
+    ultimo_dia=None,
+) -> list:
+    """
+    Calcula os meses que o job de geração completa deve buscar para um cliente.
+
+    São buscados os meses desde o último dia gravado (menos `MARGEM_GERACAO_COMPLETA`)
+    até o mês atual e, entre o primeiro dia gravado e esse ponto, os meses com dias
+    faltando. Sem nenhum dia gravado, todos os meses desde `limite` são buscados.
+
+    Args:
+        hoje (date): O dia atual.
+        limite (date): O primeiro dia do primeiro mês do horizonte.
+        dias_por_mes (dict): A quantidade de dias gravados de cada mês, pelo seu primeiro dia.
+        primeiro_dia (date): O primeiro dia gravado no horizonte, ou None.
+        ultimo_dia (date): O último dia gravado no horizonte, ou None.
+
+    Returns:
+        list: O primeiro dia de cada mês, do mais recente para o mais antigo.
+    """
+    mes = hoje.replace(day=1)
+    recente = limite
+    if ultimo_dia is not None:
+        recente = max(
+            (ultimo_dia - MARGEM_GERACAO_COMPLETA).replace(day=1), limite
+        )
+
+    meses = []
+    while mes >= recente:
+        meses.append(mes)
+        mes -= relativedelta(months=1)
+
+    if primeiro_dia is None:
+        return meses
+
+    while mes >= primeiro_dia.replace(day=1):
+        dias = calendar.monthrange(mes.year, mes.month)[1]
+        if mes < primeiro_dia:
+            dias -= primeiro_dia.day - 1
+        if dias_por_mes.get(mes, 0) < dias:
+            meses.append(mes)
+        mes -= relativedelta(months=1)
+
+    return meses
+
+
+def dias_do_plano(plano: dict):
+    """
+    Gera os dias a buscar de um cliente, do mais recente para o mais antigo.
+
+    Args:
+        plano (dict): O plano do cliente, gerado por `planeja_geracao_diaria`.
+
+    Yields:
+        datetime: A meia-noite de cada dia.
+    """
+    for inicio, fim in plano['intervalos']:
+        dia = fim
+        while dia >= inicio:
+            yield datetime.combine(dia, time.min)
+            dia -= timedelta(days=1)
+
+
+def meses_do_plano(plano: dict):
+    """
+    Gera os meses a buscar de um cliente, do mais recente para o mais antigo.
+
+    Args:
+        plano (dict): O plano do cliente, gerado por `planeja_geracao_completa`.
+
+    Yields:
+        datetime: A meia-noite do primeiro dia de cada mês.
+    """
+    for mes in plano['meses']:
+        yield datetime.combine(mes, time.min)
+
+
+def planeja_geracao_diaria(clientes, ultimas_informacoes: dict) -> dict:
+    """
+    Define quais clientes e quais dias o job de geração diária deve buscar.
+
+    A cobertura de cada cliente nos últimos `HORIZONTE_DIAS` é lida da GeracaoDiaria
+    (ver `dias_a_buscar`). Para os clientes cujas lacunas não foram verificadas no
+    último `INTERVALO_LACUNAS`, são lidos todos os dias com geração; para os demais,
+    basta o último, em uma consulta mais leve.
+
+    Clientes em espera (ver `registra_buscas_diarias`) ficam fora do plano.
+
+    Args:
+        clientes (iterable): Os clientes do inversor.
+        ultimas_informacoes (dict): A última geração diária de cada cliente, por id.
+
+    Returns:
+        dict: Para cada id de cliente a buscar, um dicionário com 'intervalos', os
+            intervalos de dias a buscar, e 'lacunas', se as lacunas foram incluídas.
+    """
+    ids = [cliente.pk for cliente in clientes]
+    agora = timezone.now()
+    hoje = timezone.localdate()
+    limite = hoje - timedelta(days=HORIZONTE_DIAS)
+
+    em_espera = set()
+    com_lacunas = set(ids)
+    infos = ClienteInfo.objects.filter(cliente_id__in=ids).values_list(
+        'cliente_id', 'proxima_busca_diaria', 'proxima_verificacao_lacunas'
+    )
+    for cliente_id, proxima_busca, proxima_lacunas in infos:
+        if proxima_busca and proxima_busca > agora:
+            em_espera.add(cliente_id)
+        if proxima_lacunas and proxima_lacunas > agora:
+            com_lacunas.discard(cliente_id)
+    com_lacunas -= em_espera
+
+    # O filtro direto no timestamp usa o índice e a poda das partições da GeracaoDiaria
+    tz = timezone.get_current_timezone()
+    geracoes = GeracaoDiaria.objects.filter(
+        timestamp__gte=timezone.make_aware(datetime.combine(limite, time.min)),
+        energystamp__gt=0,
+    )
+
+    cobertos = {}
+    for cliente_id, dia in (
+        geracoes.filter(cliente_id__in=com_lacunas)
+        .annotate(dia=TruncDate('timestamp', tzinfo=tz))
+        .values_list('cliente_id', 'dia')
+        .distinct()
+        .order_by()
+    ):
+        cobertos.setdefault(cliente_id, set()).add(dia)
+
+    for cliente_id, ultima in (
+        geracoes.filter(cliente_id__in=set(ids) - com_lacunas - em_espera)
+        .values('cliente_id')
+        .annotate(ultima=Max('timestamp'))
+        .values_list('cliente_id', 'ultima')
+        .order_by()
+    ):
+        cobertos[cliente_id] = {timezone.localtime(ultima).date()}
+
+    planos = {}
+    for cliente_id in ids:
+        if cliente_id in em_espera:
+            continue
+
+        lacunas = cliente_id in com_lacunas
+        planos[cliente_id] = {
+            'intervalos': dias_a_buscar(
+                hoje, limite, cobertos.get(cliente_id, set()), lacunas
+            ),
+            'lacunas': lacunas,
+        }
+
+    return planos
+
+
+def planeja_geracao_completa(clientes) -> dict:
+    """
+    Define quais meses o job de geração completa deve buscar de cada cliente.
+
+    A cobertura de cada cliente nos últimos `HORIZONTE_MESES` é lida da Geracao em
+    uma única consulta agrupada por mês (ver `meses_a_buscar`).
+
+    Args:
+        clientes (iterable): Os clientes do inversor.
+
+    Returns:
+        dict: Para cada id de cliente, um dicionário com 'meses', os meses a buscar.
+    """
+    ids = [cliente.pk for cliente in clientes]
+    hoje = timezone.localdate()
+    limite = hoje.replace(day=1) - relativedelta(months=HORIZONTE_MESES - 1)
+    tz = timezone.get_current_timezone()
+
+    geracoes = Geracao.objects.filter(
+        cliente_id__in=ids,
+        timestamp__gte=timezone.make_aware(datetime.combine(limite, time.min)),
+    )
+
+    dias_por_mes = {}
+    for cliente_id, mes, dias in (
+        geracoes.annotate(mes=TruncMonth('timestamp', tzinfo=tz))
+        .values('cliente_id', 'mes')
+        .annotate(dias=Count('id'))
+        .values_list('cliente_id', 'mes', 'dias')
+        .order_by()
+    ):
+        dias_por_mes.setdefault(cliente_id, {})[
+            timezone.localtime(mes).date()
+        ] = dias
+
+    extremos = {
+        cliente_id: (
+            timezone.localtime(primeira).date(),
+            timezone.localtime(ultima).date(),
+        )
+        for cliente_id, primeira, ultima in (
+            geracoes.values('cliente_id')
+            .annotate(primeira=Min('timestamp'), ultima=Max('timestamp'))
+            .values_list('cliente_id', 'primeira', 'ultima')
+            .order_by()
+        )
+    }
+
+    return {
+        cliente_id: {
+            'meses': meses_a_buscar(
+                hoje,
+                limite,
+                dias_por_mes.get(cliente_id, {}),
+                *extremos.get(cliente_id, (None, None)),
+            )
+        }
+        for cliente_id in ids
+    }
+
+
+def espera_busca_diaria(buscas_vazias: int) -> timedelta:
+    """
+    Retorna a espera de um cliente parado após uma quantidade de buscas vazias seguidas.
+
+    Args:
+        buscas_vazias (int): As execuções seguidas sem geração nova.
+
+    Returns:
+        timedelta: A espera, que dobra a cada busca vazia, até `ESPERA_MAXIMA`.
+    """
+    return min(ESPERA_BASE * 2 ** min(buscas_vazias, 10), ESPERA_MAXIMA)
+
+
+def registra_buscas_diarias(planos: dict, ultimas_informacoes: dict) -> None:
+    """
+    Atualiza a espera dos clientes após uma execução do job de geração diária.
+
+    Um cliente cuja última geração continua mais antiga que `TOLERANCIA_PARADO`
+    tem a contagem de buscas vazias incrementada e só volta a ser buscado após
+    `espera_busca_diaria`. Os demais têm a espera zerada. Os clientes cujas lacunas
+    foram buscadas só têm as lacunas verificadas de novo após `INTERVALO_LACUNAS`.
+
+    Args:
+        planos (dict): Os planos da execução, por id de cliente.
+        ultimas_informacoes (dict): A última geração diária de cada cliente antes da execução.
+
+    Returns:
+        None
+    """
+    agora = timezone.now()
+    alterados = []
+
+    for info in ClienteInfo.objects.filter(cliente_id__in=planos.keys()):
+        marca = info.ultima_geracao_diaria
+        parado = marca is None or marca < agora - TOLERANCIA_PARADO
+        alterado = planos[info.cliente_id]['lacunas']
+        if alterado:
+            info.proxima_verificacao_lacunas = agora + INTERVALO_LACUNAS
+
+        if parado and marca == ultimas_informacoes.get(info.cliente_id):
+            info.buscas_vazias_diarias += 1
+            info.proxima_busca_diaria = agora + espera_busca_diaria(
+                info.buscas_vazias_diarias
+            )
+            alterado = True
+        elif info.buscas_vazias_diarias or info.proxima_busca_diaria:
+            info.buscas_vazias_diarias = 0
+            info.proxima_busca_diaria = None
+            alterado = True
+
+        if alterado:
+            alterados.append(info)
+
+    ClienteInfo.objects.bulk_update(
+        alterados,
+        [
+            'buscas_vazias_diarias',
+            'proxima_busca_diaria',
+            'proxima_verificacao_lacunas',
+        ],
+        batch_size=BATCH_SIZE,
+    )
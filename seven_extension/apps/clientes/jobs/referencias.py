@@ -0,0 +1,132 @@
+import threading
+import time
+
+from apps.clientes.models import Concessionaria, Empresa, Inversor, TipoUsuario
+from django.db.models.signals import post_delete, post_save
+
+# Segundos até uma tabela ser relida mesmo sem gravação neste processo. As
+# gravações feitas em outro processo (ex.: admin no servidor web e leitura no
+# runscheduler), ou por `update()`, que não dispara sinais, aparecem depois disso.
+VALIDADE_REFERENCIAS = 300
+
+
+class CacheReferencia:
+    """
+    Cache por processo de uma tabela de referência pequena.
+
+    A tabela é lida inteira na primeira consulta e mantida em memória, indexada pelo
+    id e por um campo único. O cache é descartado quando uma linha é salva ou removida
+    neste processo, e relido após `VALIDADE_REFERENCIAS` segundos.
+
+    Os objetos retornados são compartilhados entre as threads e não devem ser alterados.
+
+    Args:
+        modelo (Model): O modelo da tabela.
+        campo (str): O campo único usado em `obtem`.
+        ordem (str): O campo que define a ordem de `todos`.
+    """
+
+    def __init__(self, modelo, campo: str, ordem: str):
+        self.modelo = modelo
+        self.campo = campo
+        self.ordem = ordem
+        self._trava = threading.Lock()
+        self._tabela = None
+        self._carregada_em = 0.0
+
+    def _carrega(self, recarrega: bool = False) -> tuple:
+        """
+        Retorna a tabela em cache, lendo-a do banco se necessário.
+
+        Args:
+            recarrega (bool): Se True, lê a tabela mesmo que o cache esteja válido.
+
+        Returns:
+            tuple: Os objetos em ordem, por id e pelo campo único.
+        """
+        with self._trava:
+            if (
+                recarrega
+                or self._tabela is None
+                or time.monotonic() - self._carregada_em > VALIDADE_REFERENCIAS
+            ):
+                objetos = list(self.modelo.objects.order_by(self.ordem))
+                self._tabela = (
+                    objetos,
+                    {objeto.pk: objeto for objeto in objetos},
+                    {
+                        getattr(objeto, self.campo): objeto
+                        for objeto in objetos
+                    },
+                )
+                self._carregada_em = time.monotonic()
+            return self._tabela
+
+    def _busca(self, indice: int, valor):
+        objeto = self._carrega()[indice].get(valor)
+        if objeto is None:
+            # Linha criada em outro processo desde a última leitura
+            objeto = self._carrega(recarrega=True)[indice].get(valor)
+        if objeto is None:
+            raise self.modelo.DoesNotExist(
+                f'{self.modelo.__name__} não encontrado: {valor}'
+            )
+        return objeto
+
+    def obtem(self, valor):
+        """
+        Retorna o objeto pelo campo único.
+
+        Args:
+            valor: O valor do campo único.
+
+        Returns:
+            Model: O objeto. Levanta `DoesNotExist` se não existir.
+        """
+        return self._busca(2, valor)
+
+    def por_id(self, pk):
+        """
+        Retorna o objeto pelo id.
+
+        Args:
+            pk: O id do objeto.
+
+        Returns:
+            Model: O objeto. Levanta `DoesNotExist` se não existir.
+        """
+        return self._busca(1, pk)
+
+    def todos(self) -> list:
+        """
+        Retorna todos os objetos da tabela.
+
+        Returns:
+            list: Os objetos, ordenados por `ordem`.
+        """
+        return list(self._carrega()[0])
+
+    def invalida(self, **kwargs) -> None:
+        """
+        Descarta o cache. Conectado aos sinais de gravação e remoção do modelo.
+
+        Returns:
+            None
+        """
+        with self._trava:
+            self._tabela = None
+
+
+CACHE_INVERSORES = CacheReferencia(Inversor, 'name', 'name')
+EMPRESAS = CacheReferencia(Empresa, 'cnpj', 'nome')
+TIPOS_USUARIO = CacheReferencia(TipoUsuario, 'nome_tipo', 'nome_tipo')
+CONCESSIONARIAS = CacheReferencia(Concessionaria, 'nome', 'nome')
+
+for _cache in (CACHE_INVERSORES, EMPRESAS, TIPOS_USUARIO, CONCESSIONARIAS):
+    for _sinal in (post_save, post_delete):
+        _sinal.connect(
+            _cache.invalida,
+            sender=_cache.modelo,
+            weak=False,
+            dispatch_uid=f'referencias_{_cache.modelo.__name__}',
+        )
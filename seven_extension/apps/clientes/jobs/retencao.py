@@ -0,0 +1,217 @@
+from datetime import timedelta
+
+from apps.clientes.jobs.cache_grafico import invalida_graficos
+from apps.clientes.models import Cliente, GeracaoDiaria, GeracaoHoraria
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Avg, Count, Max
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+BATCH_SIZE = 500
+
+# Horas mais recentes que isso ainda podem receber leituras (o job diário busca de
+# novo o último dia coberto) e não são agregadas
+ATRASO_AGREGACAO = timedelta(days=2)
+
+# Clientes agregados por transação
+CLIENTES_POR_LOTE = 100
+
+
+def monta_geracao_horaria(horas) -> list:
+    """
+    Monta os objetos GeracaoHoraria a partir das horas agregadas no banco.
+
+    Args:
+        horas (iterable): Dicionários com 'cliente_id', 'hora', 'energia',
+            'potencia_pico' e 'amostras'. Energias nulas são gravadas como 0.
+
+    Returns:
+        list: Os objetos GeracaoHoraria, ainda não gravados.
+    """
+    return [
+        GeracaoHoraria(
+            cliente_id=hora['cliente_id'],
+            timestamp=hora['hora'],
+            energia=hora['energia'] or 0,
+            potencia_pico=hora['potencia_pico'] or 0,
+            amostras=hora['amostras'],
+        )
+        for hora in horas
+    ]
+
+
+def filtro_agregacao(ultima, corte) -> dict:
+    """
+    Monta o filtro das leituras de um cliente que devem ser agregadas.
+
+    A última hora agregada entra no filtro para ser recalculada por completo, já que
+    pode ter recebido leituras depois da agregação anterior.
+
+    Args:
+        ultima (datetime): A última hora agregada do cliente, ou None se não houver.
+        corte (datetime): O instante a partir do qual as leituras ainda não são agregadas.
+
+    Returns:
+        dict: Os argumentos do filtro sobre GeracaoDiaria.
+    """
+    filtro = {'timestamp__lt': corte}
+    if ultima is not None:
+        filtro['timestamp__gte'] = ultima
+    return filtro
+
+
+def recalcula_geracao_horaria(geracao) -> int:
+    """
+    Recalcula a geração horária a partir de um queryset de GeracaoDiaria.
+
+    As leituras são agregadas no banco por cliente e hora, e gravadas em GeracaoHoraria
+    com `bulk_create(update_conflicts=True)`. Como cada hora é agregada novamente por
+    completo, a operação pode ser repetida sem duplicar valores.
+
+    Args:
+        geracao (QuerySet): As leituras de GeracaoDiaria cujas horas devem ser recalculadas.
+            As horas precisam estar completas no queryset.
+
+    Returns:
+        int: A quantidade de horas gravadas.
+    """
+    horas = (
+        geracao.annotate(hora=TruncHour('timestamp'))
+        .values('cliente_id', 'hora')
+        .annotate(
+            energia=Avg('energystamp'),
+            potencia_pico=Max('energystamp'),
+            amostras=Count('id'),
+        )
+        .order_by()
+    )
+
+    agregadas = monta_geracao_horaria(horas)
+
+    GeracaoHoraria.objects.bulk_create(
+        agregadas,
+        update_conflicts=True,
+        update_fields=['energia', 'potencia_pico', 'amostras'],
+        unique_fields=('cliente', 'timestamp'),
+        batch_size=BATCH_SIZE,
+    )
+
+    return len(agregadas)
+
+
+def agrega_geracao_horaria(cliente_ids=None) -> int:
+    """
+    Agrega em GeracaoHoraria as leituras da GeracaoDiaria ainda não agregadas.
+
+    A última hora agregada de cada cliente é lida em uma única consulta, e apenas as
+    leituras a partir dela (que é agregada de novo) e anteriores a `ATRASO_AGREGACAO`
+    são processadas, em uma consulta por cliente limitada pelo timestamp. Clientes sem
+    nenhuma hora agregada têm todo o histórico agregado.
+
+    Args:
+        cliente_ids (iterable): Os ids dos clientes. Por padrão, todos os clientes.
+
+    Returns:
+        int: A quantidade de horas gravadas.
+    """
+    corte = timezone.now() - ATRASO_AGREGACAO
+    if cliente_ids is None:
+        cliente_ids = Cliente.objects.values_list('id', flat=True)
+    clientes = sorted(cliente_ids)
+    marcas = dict(
+        GeracaoHoraria.objects.filter(cliente_id__in=clientes)
+        .values('cliente_id')
+        .annotate(ultima=Max('timestamp'))
+        .values_list('cliente_id', 'ultima')
+        .order_by()
+    )
+
+    total = 0
+    for indice in range(0, len(clientes), CLIENTES_POR_LOTE):
+        alterados = []
+        with transaction.atomic():
+            for cliente_id in clientes[indice : indice + CLIENTES_POR_LOTE]:
+                geracao = GeracaoDiaria.objects.filter(
+                    cliente_id=cliente_id,
+                    **filtro_agregacao(marcas.get(cliente_id), corte),
+                )
+
+                horas = recalcula_geracao_horaria(geracao)
+                if horas:
+                    alterados.append(cliente_id)
+                    total += horas
+
+            if alterados:
+                invalida_graficos(alterados)
+
+    return total
+
+
+def limite_expurgo(dias: int, agora):
+    """
+    Calcula o instante antes do qual as leituras da GeracaoDiaria podem ser removidas.
+
+    Args:
+        dias (int): Dias de leituras de 5/15 minutos mantidos.
+        agora (datetime): O instante atual.
+
+    Returns:
+        datetime: O limite, nunca mais recente que `ATRASO_AGREGACAO`.
+    """
+    return agora - max(timedelta(days=dias), ATRASO_AGREGACAO)
+
+
+def expurga_geracao_diaria(dias: int) -> int:
+    """
+    Remove as leituras da GeracaoDiaria mais antigas que `dias`.
+
+    Só remove leituras já agregadas: o horizonte nunca é menor que `ATRASO_AGREGACAO`,
+    e o job agrega antes de expurgar.
+
+    Args:
+        dias (int): Dias de leituras de 5/15 minutos mantidos.
+
+    Returns:
+        int: A quantidade de leituras removidas.
+    """
+    limite = limite_expurgo(dias, timezone.now())
+    removidas, _ = GeracaoDiaria.objects.filter(timestamp__lt=limite).delete()
+    return removidas
+
+
+def usa_geracao_horaria(inicio) -> bool:
+    """
+    Indica se o gráfico diário deve ler a geração horária em vez da GeracaoDiaria.
+
+    Args:
+        inicio (datetime): O início do período do gráfico.
+
+    Returns:
+        bool: True se o período começa antes de `settings.GERACAO_ALTA_RESOLUCAO_DIAS`.
+    """
+    return inicio < timezone.now() - timedelta(
+        days=settings.GERACAO_ALTA_RESOLUCAO_DIAS
+    )
+
+
+def executa_retencao() -> None:
+    """
+    Agrega a geração horária e, se configurado, expurga as leituras antigas.
+
+    O expurgo usa `settings.GERACAO_DIARIA_RETENCAO_DIAS`; com 0, nada é removido.
+    O horizonte nunca é menor que `settings.GERACAO_ALTA_RESOLUCAO_DIAS`, para que o
+    gráfico não fique sem leituras no período em que ainda lê a GeracaoDiaria.
+
+    Returns:
+        None
+    """
+    agrega_geracao_horaria()
+
+    if settings.GERACAO_DIARIA_RETENCAO_DIAS:
+        expurga_geracao_diaria(
+            max(
+                settings.GERACAO_DIARIA_RETENCAO_DIAS,
+                settings.GERACAO_ALTA_RESOLUCAO_DIAS,
+            )
+        )
@@ -0,0 +1,227 @@
+import json
+from datetime import timedelta
+
+import requests
+from apps.clientes.jobs.get_inversor_energy import SungrowScraper
+from apps.clientes.jobs.http_session import nova_sessao
+from apps.clientes.models import SessaoCredencial
+from django.utils import timezone
+
+# Tempo pelo qual um login é reaproveitado antes de ser refeito
+VALIDADE_SESSAO = timedelta(hours=12)
+
+
+def _serializa_sessao(sess: requests.Session) -> dict:
+    """
+    Converte os cookies e cabeçalhos de uma sessão em um dicionário serializável.
+
+    Args:
+        sess (requests.Session): A sessão autenticada.
+
+    Returns:
+        dict: Os cookies (com domínio e caminho) e os cabeçalhos da sessão.
+    """
+    return {
+        'cookies': [
+            {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain,
+                'path': cookie.path,
+                'secure': cookie.secure,
+                'expires': cookie.expires,
+            }
+            for cookie in sess.cookies
+        ],
+        'headers': dict(sess.headers),
+    }
+
+
+def _restaura_sessao(estado: dict) -> requests.Session:
+    """
+    Recria uma sessão a partir do dicionário gerado por `_serializa_sessao`.
+
+    Args:
+        estado (dict): Os cookies e cabeçalhos da sessão.
+
+    Returns:
+        requests.Session: Uma nova sessão com o mesmo estado de autenticação.
+    """
+    sess = nova_sessao()
+    sess.headers.clear()
+    sess.headers.update(estado['headers'])
+    for cookie in estado['cookies']:
+        sess.cookies.set(
+            cookie['name'],
+            cookie['value'],
+            domain=cookie['domain'],
+            path=cookie['path'],
+            secure=cookie['secure'],
+            expires=cookie['expires'],
+        )
+    return sess
+
+
+def _serializa_valor(valor):
+    """
+    Converte um valor do dicionário `data` para JSON, quando possível.
+
+    Args:
+        valor: O valor criado pelo login (sessão, scraper da Sungrow, token, cabeçalhos...).
+
+    Returns:
+        O valor serializável, ou None se o valor não puder ser guardado.
+    """
+    if isinstance(valor, requests.Session):
+        return {'__sessao__': _serializa_sessao(valor)}
+    if isinstance(valor, SungrowScraper):
+        return {
+            '__sungrow__': {
+                'userToken': valor.userToken,
+                'sessao': _serializa_sessao(valor.session),
+            }
+        }
+    try:
+        json.dumps(valor)
+    except (TypeError, ValueError):
+        return None
+    return valor
+
+
+def _restaura_valor(valor, data: dict):
+    """
+    Reconstrói um valor serializado por `_serializa_valor`.
+
+    Args:
+        valor: O valor guardado no cache.
+        data (dict): Dicionário do job, usado para recriar o scraper da Sungrow.
+
+    Returns:
+        O valor pronto para ser colocado de volta em `data`.
+    """
+    if isinstance(valor, dict) and '__sessao__' in valor:
+        return _restaura_sessao(valor['__sessao__'])
+    if isinstance(valor, dict) and '__sungrow__' in valor:
+        scraper = SungrowScraper(data['username'], data['password'])
+        scraper.userToken = valor['__sungrow__']['userToken']
+        scraper.session = _restaura_sessao(valor['__sungrow__']['sessao'])
+        return scraper
+    return valor
+
+
+def salva_sessao(
+    data: dict, credencial, chaves: list, expira_em=None
+) -> None:
+    """
+    Guarda no cache o estado de autenticação presente em `data`.
+
+    Args:
+        data (dict): Dicionário do job já autenticado.
+        credencial (CredencialInversor): A credencial dona da sessão.
+        chaves (list): As chaves de `data` criadas pelo login.
+        expira_em (datetime, optional): Expiração da sessão. Por padrão, agora + `VALIDADE_SESSAO`.
+
+    Returns:
+        None
+    """
+    estado = {}
+    for chave in chaves:
+        valor = _serializa_valor(data.get(chave))
+        if valor is not None:
+            estado[chave] = valor
+
+    SessaoCredencial.objects.update_or_create(
+        credencial=credencial,
+        defaults={
+            'dados': json.dumps(estado),
+            'expira_em': expira_em or timezone.now() + VALIDADE_SESSAO,
+        },
+    )
+
+
+def restaura_sessao(data: dict, credencial):
+    """
+    Coloca em `data` a sessão em cache da credencial, se ainda for válida.
+
+    Args:
+        data (dict): Dicionário do job.
+        credencial (CredencialInversor): A credencial a ser autenticada.
+
+    Returns:
+        SessaoCredencial or None: O registro restaurado, ou None se não houver sessão válida.
+    """
+    sessao = SessaoCredencial.objects.filter(
+        credencial=credencial, expira_em__gt=timezone.now()
+    ).first()
+
+    if sessao is None:
+        return None
+
+    for chave, valor in json.loads(sessao.dados).items():
+        data[chave] = _restaura_valor(valor, data)
+
+    return sessao
+
+
+def invalida_sessao(credencial) -> None:
+    """
+    Remove a sessão em cache da credencial, forçando um novo login.
+
+    Args:
+        credencial (CredencialInversor): A credencial cuja sessão deve ser descartada.
+
+    Returns:
+        None
+    """
+    SessaoCredencial.objects.filter(credencial=credencial).delete()
+
+
+def executa_autenticado(data: dict, credencial, login, etapa) -> None:
+    """
+    Executa a primeira etapa de um job reaproveitando o login em cache.
+
+    Se houver sessão válida em cache, ela é restaurada e `etapa` é executada. Caso a etapa
+    falhe com a sessão restaurada (por exemplo, token expirado no portal), o cache é
+    descartado, o login é refeito e a etapa é executada novamente. Sem sessão em cache,
+    o login é feito e, após a etapa ter sucesso, a nova sessão é guardada.
+
+    A sessão só é guardada depois da etapa, pois alguns logins (como o da Sungrow)
+    só autenticam na primeira requisição.
+
+    Args:
+        data (dict): Dicionário do job com as credenciais ('username', 'password', ...).
+        credencial (CredencialInversor): A credencial usada no job.
+        login (callable): Função de login do inversor, como `login_growatt`.
+        etapa (callable): Primeira etapa autenticada, como `atualiza_clientes_growatt`.
+
+    Returns:
+        None
+    """
+    sessao = restaura_sessao(data, credencial)
+
+    if sessao is not None:
+        chaves = list(json.loads(sessao.dados))
+        try:
+            etapa(data)
+        except Exception as e:
+            print(
+                f'{credencial.inversor} - Sessão em cache recusada, refazendo login: {e}'
+            )
+            invalida_sessao(credencial)
+        else:
+            # Guarda tokens renovados durante a etapa, mantendo a expiração original
+            salva_sessao(data, credencial, chaves, sessao.expira_em)
+            return
+
+    antes = dict(data)
+    login(data)
+
+    # Apenas as chaves criadas ou substituídas pelo login fazem parte da sessão
+    chaves = [
+        chave
+        for chave, valor in data.items()
+        if chave not in antes or antes[chave] is not valor
+    ]
+
+    etapa(data)
+    salva_sessao(data, credencial, chaves)
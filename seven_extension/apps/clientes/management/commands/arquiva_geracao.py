@@ -0,0 +1,88 @@
+"""
+- Grava a geração (Geracao e GeracaoDiaria) em arquivos Parquet por mês e inversor
+- O runscheduler executa o mesmo arquivamento todos os dias, apenas para os meses pendentes
+- Use --refaz para regravar todo o histórico
+"""
+
+from apps.clientes.jobs.arquivo_parquet import (
+    TABELAS,
+    arquiva_mes,
+    meses_pendentes,
+)
+from apps.clientes.models import Inversor
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Comando de gerenciamento do Django para arquivar a geração em Parquet.
+
+    Cada mês fechado de cada inversor vira um arquivo em
+    `ARQUIVO_PARQUET_DIR/<tabela>/inversor=<nome>/ano=<AAAA>/mes=<MM>/dados.parquet`,
+    lido pelo `le_geracao` sem acesso ao banco.
+
+    Uso:
+        python manage.py arquiva_geracao [--tabela NOME ...] [--inversor NOME ...] [--refaz]
+
+    Args:
+        BaseCommand: Classe BaseCommand do Django.
+
+    Exemplo:
+        >>> python manage.py arquiva_geracao --tabela geracao_diaria --inversor growatt
+    """
+
+    help = 'Arquiva a geração em arquivos Parquet por mês e inversor.'
+
+    def add_arguments(self, parser):
+        """
+        Adiciona os argumentos de linha de comando.
+
+        Args:
+            parser (ArgumentParser): O parser de argumentos do comando.
+        """
+        parser.add_argument(
+            '--tabela',
+            nargs='+',
+            choices=list(TABELAS),
+            default=list(TABELAS),
+            help='Tabelas a arquivar. Por padrão, todas.',
+        )
+        parser.add_argument(
+            '--inversor',
+            nargs='+',
+            help='Inversores a arquivar. Por padrão, todos.',
+        )
+        parser.add_argument(
+            '--refaz',
+            action='store_true',
+            help='Regrava também os meses que já têm arquivo.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Arquiva os meses pendentes de cada tabela e inversor.
+
+        Args:
+            *args: Argumentos adicionais passados pela linha de comando.
+            **options: Opções adicionais passadas pela linha de comando.
+
+        Returns:
+            None
+        """
+        inversores = options['inversor'] or list(
+            Inversor.objects.values_list('name', flat=True)
+        )
+
+        arquivos = 0
+        for tabela in options['tabela']:
+            for inversor in inversores:
+                for mes in meses_pendentes(tabela, inversor, options['refaz']):
+                    linhas = arquiva_mes(tabela, inversor, mes)
+                    arquivos += 1
+                    self.stdout.write(
+                        f'{tabela} {inversor} {mes:%m/%Y}: {linhas} linhas'
+                    )
+
+        self.stdout.write(
+            self.style.SUCCESS(f'{arquivos} arquivos Parquet gravados.')
+        )
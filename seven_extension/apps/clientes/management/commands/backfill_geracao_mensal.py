@@ -0,0 +1,69 @@
+"""
+- Reconstrói o consolidado mensal (GeracaoMensal) a partir da tabela Geracao
+- Deve ser executado uma vez após criar a tabela, ou sempre que a Geracao for alterada fora dos jobs
+"""
+
+from apps.clientes.jobs.geracao_mensal import recalcula_geracao_mensal
+from apps.clientes.models import Cliente, Geracao
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    """
+    Comando de gerenciamento do Django para preencher a tabela GeracaoMensal.
+
+    Os meses são recalculados cliente a cliente, cada um em sua própria transação,
+    para que a execução possa ser interrompida e retomada sem perda de consistência.
+
+    Uso:
+        python manage.py backfill_geracao_mensal [--cliente ID ...]
+
+    Args:
+        BaseCommand: Classe BaseCommand do Django.
+
+    Exemplo:
+        >>> python manage.py backfill_geracao_mensal --cliente 12 15
+    """
+
+    help = 'Preenche o consolidado mensal de geração a partir da tabela Geracao.'
+
+    def add_arguments(self, parser):
+        """
+        Adiciona os argumentos de linha de comando.
+
+        Args:
+            parser (ArgumentParser): O parser de argumentos do comando.
+        """
+        parser.add_argument(
+            '--cliente',
+            nargs='+',
+            type=int,
+            help='Ids dos clientes a recalcular. Por padrão, todos.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Recalcula o consolidado mensal de cada cliente.
+
+        Args:
+            *args: Argumentos adicionais passados pela linha de comando.
+            **options: Opções adicionais passadas pela linha de comando.
+
+        Returns:
+            None
+        """
+        clientes = Cliente.objects.order_by('id')
+        if options['cliente']:
+            clientes = clientes.filter(id__in=options['cliente'])
+
+        total = 0
+        for cliente_id in clientes.values_list('id', flat=True):
+            with transaction.atomic():
+                total += recalcula_geracao_mensal(
+                    Geracao.objects.filter(cliente_id=cliente_id)
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(f'{total} meses de geração consolidados.')
+        )
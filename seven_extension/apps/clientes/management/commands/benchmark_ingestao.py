@@ -0,0 +1,240 @@
+"""
+- Mede o caminho de ingestão da geração diária (atualiza_geracao_diaria_*) de ponta a ponta
+- As respostas dos portais são reproduzidas por um servidor local a partir de apps/clientes/benchmark/respostas
+- Roda em um banco de testes criado e destruído pelo próprio comando
+"""
+
+import threading
+import time as t
+import tracemalloc
+from datetime import timedelta
+
+from apps.clientes.benchmark.servidor import ServidorStub, SungrowScraperStub
+from apps.clientes.jobs.get_inversor_energy import (
+    atualiza_geracao_diaria_abb_fimer,
+    atualiza_geracao_diaria_growatt,
+    atualiza_geracao_diaria_refusol,
+    atualiza_geracao_diaria_sungrow,
+)
+from apps.clientes.jobs.http_session import nova_sessao
+from apps.clientes.models import (
+    Cliente,
+    ClienteInfo,
+    Empresa,
+    GeracaoDiaria,
+    Inversor,
+)
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.utils import timezone
+
+
+def _data_growatt() -> dict:
+    return {'sess': nova_sessao(), 'api_url': 'https://server.growatt.com/'}
+
+
+def _data_sungrow() -> dict:
+    scraper = SungrowScraperStub('benchmark', 'benchmark')
+    scraper.userToken = '0_benchmark'
+    return {'s': scraper, 'json': {'share_type_list': ['0', '1', '2']}}
+
+
+def _data_abb_fimer() -> dict:
+    return {'sess': nova_sessao(), 'api_url': 'https://www.auroravision.net'}
+
+
+def _data_refusol() -> dict:
+    return {
+        'sess': nova_sessao(),
+        'api_url': 'https://refu-log.com',
+        'url': 'https://refu-log.com/Ajax/StatisticsWebService.aspx/GetDataForChannels',
+    }
+
+
+# Inversores com resposta gravada: nome -> (job de geração diária, dados do job já autenticado)
+INVERSORES = {
+    'growatt': (atualiza_geracao_diaria_growatt, _data_growatt),
+    'sungrow': (atualiza_geracao_diaria_sungrow, _data_sungrow),
+    'abb_fimer': (atualiza_geracao_diaria_abb_fimer, _data_abb_fimer),
+    'refusol': (atualiza_geracao_diaria_refusol, _data_refusol),
+}
+
+
+class ContadorConsultas:
+    """
+    Conta as consultas SQL feitas por todas as threads.
+
+    As buscas das plantas rodam em um pool de threads, cada uma com a sua conexão,
+    então o contador é instalado em toda conexão aberta enquanto estiver ativo.
+
+    Attributes:
+        total (int): A quantidade de consultas executadas.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self._trava = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        with self._trava:
+            self.total += 1
+        return execute(sql, params, many, context)
+
+    def _instala(self, sender, connection, **kwargs):
+        connection.execute_wrappers.append(self)
+
+    def __enter__(self):
+        connection.execute_wrappers.append(self)
+        connection_created.connect(self._instala)
+        return self
+
+    def __exit__(self, *exc):
+        connection_created.disconnect(self._instala)
+        connection.execute_wrappers.remove(self)
+
+
+class Command(BaseCommand):
+    """
+    Comando de gerenciamento do Django para medir a ingestão da geração diária.
+
+    Para cada inversor, cria `--plantas` clientes com a última geração diária há
+    `--dias` dias e executa o job `atualiza_geracao_diaria_*` contra o servidor
+    local. São informados plantas/s, linhas/s, consultas e requisições por planta
+    e o pico de memória do Python durante o job.
+
+    Uso:
+        python manage.py benchmark_ingestao [--inversor NOME ...] [--plantas N] [--dias N]
+
+    Args:
+        BaseCommand: Classe BaseCommand do Django.
+
+    Exemplo:
+        >>> python manage.py benchmark_ingestao --inversor growatt refusol --plantas 50
+    """
+
+    help = 'Mede a ingestão da geração diária com respostas gravadas dos portais.'
+
+    def add_arguments(self, parser):
+        """
+        Adiciona os argumentos de linha de comando.
+
+        Args:
+            parser (ArgumentParser): O parser de argumentos do comando.
+        """
+        parser.add_argument(
+            '--inversor',
+            nargs='+',
+            choices=list(INVERSORES),
+            default=list(INVERSORES),
+            help='Inversores a medir. Por padrão, todos com resposta gravada.',
+        )
+        parser.add_argument(
+            '--plantas',
+            type=int,
+            default=20,
+            help='Quantidade de plantas por inversor.',
+        )
+        parser.add_argument(
+            '--dias',
+            type=int,
+            default=2,
+            help='Dias desde a última geração diária de cada planta.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Cria o banco de testes, executa as medições e destrói o banco.
+
+        Args:
+            *args: Argumentos adicionais passados pela linha de comando.
+            **options: Opções adicionais passadas pela linha de comando.
+
+        Returns:
+            None
+        """
+        nome_original = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+        try:
+            empresa = Empresa.objects.create(
+                nome='Benchmark', cnpj='00000000000000'
+            )
+            self.stdout.write(
+                f'{"inversor":<10} {"plantas/s":>10} {"linhas/s":>10} '
+                f'{"consultas/planta":>17} {"requisições/planta":>19} {"pico (MB)":>10}'
+            )
+            for inversor in options['inversor']:
+                resultado = self.mede(
+                    inversor, empresa, options['plantas'], options['dias']
+                )
+                self.stdout.write(
+                    f'{inversor:<10} {resultado["plantas_s"]:>10.1f} '
+                    f'{resultado["linhas_s"]:>10.1f} '
+                    f'{resultado["consultas_planta"]:>17.1f} '
+                    f'{resultado["requisicoes_planta"]:>19.1f} '
+                    f'{resultado["pico_mb"]:>10.1f}'
+                )
+        finally:
+            connection.creation.destroy_test_db(nome_original, verbosity=0)
+
+    def mede(self, inversor: str, empresa, plantas: int, dias: int) -> dict:
+        """
+        Executa o job de geração diária de um inversor e mede o seu desempenho.
+
+        Args:
+            inversor (str): O nome do inversor.
+            empresa (Empresa): A empresa dona das plantas criadas.
+            plantas (int): A quantidade de plantas a criar.
+            dias (int): Dias desde a última geração diária de cada planta.
+
+        Returns:
+            dict: As métricas da execução.
+        """
+        atualiza_geracao_diaria, monta_data = INVERSORES[inversor]
+
+        modelo_inversor, _ = Inversor.objects.get_or_create(name=inversor)
+        clientes = Cliente.objects.bulk_create(
+            [
+                Cliente(
+                    inverter=modelo_inversor,
+                    plant_id=f'{inversor}-{indice}',
+                    plant_name=f'Benchmark {inversor} {indice}',
+                )
+                for indice in range(plantas)
+            ]
+        )
+        ClienteInfo.objects.bulk_create(
+            [
+                ClienteInfo(
+                    cliente=cliente,
+                    ultima_geracao_diaria=timezone.now() - timedelta(days=dias),
+                )
+                for cliente in clientes
+            ]
+        )
+
+        with ServidorStub([inversor]) as stub, ContadorConsultas() as contador:
+            data = {'empresa_id': empresa.id, **monta_data()}
+            data['clientes'] = Cliente.objects.filter(
+                inverter=modelo_inversor
+            )
+
+            tracemalloc.start()
+            inicio = t.perf_counter()
+            atualiza_geracao_diaria(data)
+            duracao = t.perf_counter() - inicio
+            _, pico = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        linhas = GeracaoDiaria.objects.filter(
+            cliente__inverter=modelo_inversor
+        ).count()
+
+        return {
+            'plantas_s': plantas / duracao,
+            'linhas_s': linhas / duracao,
+            'consultas_planta': contador.total / plantas,
+            'requisicoes_planta': stub.requisicoes / plantas,
+            'pico_mb': pico / 1024**2,
+        }
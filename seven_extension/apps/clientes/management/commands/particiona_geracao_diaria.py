@@ -0,0 +1,112 @@
+"""
+- Mantém o particionamento mensal da tabela GeracaoDiaria (PostgreSQL)
+- Use --converte uma única vez para transformar a tabela atual em tabela particionada
+- Depois disso, o runscheduler cria as partições futuras todo mês
+"""
+
+from datetime import date
+
+from apps.clientes.jobs.particoes import (
+    MESES_FUTUROS,
+    converte_tabela_particionada,
+    cria_particoes,
+    desanexa_particoes,
+    tabela_particionada,
+)
+from dateutil.relativedelta import relativedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+
+class Command(BaseCommand):
+    """
+    Comando de gerenciamento do Django para particionar a GeracaoDiaria por mês.
+
+    Cria as partições dos próximos meses e, se pedido, desanexa as partições mais
+    antigas que a retenção informada. Uma partição desanexada vira uma tabela
+    comum, que pode ser arquivada (pg_dump) e removida sem afetar a tabela ativa.
+
+    Uso:
+        python manage.py particiona_geracao_diaria [--converte] [--meses-futuros N]
+            [--retencao-meses N [--remove]]
+
+    Args:
+        BaseCommand: Classe BaseCommand do Django.
+
+    Exemplo:
+        >>> python manage.py particiona_geracao_diaria --retencao-meses 24
+    """
+
+    help = 'Cria e desanexa as partições mensais da tabela GeracaoDiaria.'
+
+    def add_arguments(self, parser):
+        """
+        Adiciona os argumentos de linha de comando.
+
+        Args:
+            parser (ArgumentParser): O parser de argumentos do comando.
+        """
+        parser.add_argument(
+            '--converte',
+            action='store_true',
+            help='Converte a tabela atual em tabela particionada (uma única vez).',
+        )
+        parser.add_argument(
+            '--meses-futuros',
+            type=int,
+            default=MESES_FUTUROS,
+            help='Meses à frente do atual que devem ter partição.',
+        )
+        parser.add_argument(
+            '--retencao-meses',
+            type=int,
+            help='Desanexa as partições mais antigas que esta quantidade de meses.',
+        )
+        parser.add_argument(
+            '--remove',
+            action='store_true',
+            help='Remove as partições desanexadas em vez de mantê-las como tabelas.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Converte a tabela, se pedido, e mantém as partições.
+
+        Args:
+            *args: Argumentos adicionais passados pela linha de comando.
+            **options: Opções adicionais passadas pela linha de comando.
+
+        Returns:
+            None
+        """
+        if connection.vendor != 'postgresql':
+            raise CommandError('O particionamento exige PostgreSQL.')
+
+        if options['converte']:
+            if tabela_particionada():
+                raise CommandError('A tabela GeracaoDiaria já é particionada.')
+            criadas = converte_tabela_particionada()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Tabela convertida com {criadas} partições mensais.'
+                )
+            )
+        elif not tabela_particionada():
+            raise CommandError(
+                'A tabela GeracaoDiaria não é particionada. Use --converte.'
+            )
+
+        criadas = cria_particoes(meses_futuros=options['meses_futuros'])
+        self.stdout.write(f'{criadas} partições futuras criadas.')
+
+        if options['retencao_meses']:
+            limite = date.today().replace(day=1) - relativedelta(
+                months=options['retencao_meses']
+            )
+            antigas = desanexa_particoes(limite, remove=options['remove'])
+            acao = 'removidas' if options['remove'] else 'desanexadas'
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'{len(antigas)} partições anteriores a {limite:%m/%Y} {acao}.'
+                )
+            )
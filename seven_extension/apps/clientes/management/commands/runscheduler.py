@@ -11,1031 +11,90 @@ from datetime import datetime as dt
 from datetime import timedelta
 
 import pytz
+from apps.clientes.jobs.arquivo_parquet import arquiva_pendentes
 from apps.clientes.jobs.get_concessionaria_data import *
 from apps.clientes.jobs.get_inversor_energy import *
-from apps.clientes.models import (
-    Cliente,
-    CredencialConcessionaria,
-    CredencialInversor,
+from apps.clientes.jobs.inversores import (
+    INVERSORES,
+    executa_geracao_completa,
+    executa_geracao_horaria,
 )
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
-from django.conf import settings
-from django.core.management.base import BaseCommand
-from django_apscheduler import util
-from django_apscheduler.jobstores import DjangoJobStore
-from django_apscheduler.models import DjangoJobExecution
-from tenacity import retry, stop_after_attempt, wait_fixed
-
-logger = logging.getLogger(__name__)
-
-
-@util.close_old_connections
-def growatt_hourly_generation():
-    """
-    Realiza atualizações horárias na geração de energia para os inversores Growatt.
-
-    Esta função é agendada para ser executada periodicamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Realiza login na plataforma Growatt.
-    
-    2. Atualiza informações dos clientes Growatt.
-    
-    3. Obtém a lista de clientes Growatt.
-    
-    4. Atualiza a geração diária para os clientes Growatt.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Growatt
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='growatt'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://server.growatt.com/'
-
-    # Realiza o login na plataforma Growatt
-    login_growatt(data)
-
-    # Atualiza informações dos clientes Growatt
-    atualiza_clientes_growatt(data)
-
-    # Obtém a lista de clientes Growatt
-    data['clientes'] = Cliente.objects.filter(inverter__name='growatt')
-
-    # Atualiza a geração diária para os clientes Growatt
-    atualiza_geracao_diaria_growatt(data)
-
-
-@util.close_old_connections
-def sungrow_hourly_generation():
-    """
-    Realiza atualizações horárias na geração de energia para os inversores Sungrow.
-
-    Esta função é agendada para ser executada periodicamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Realiza login na plataforma Sungrow.
-    
-    2. Atualiza informações dos clientes Sungrow.
-    
-    3. Obtém a lista de clientes Sungrow.
-    
-    4. Atualiza a geração diária para os clientes Sungrow.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Sungrow
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='sungrow'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://gateway.isolarcloud.com.hk'
-
-    # Realiza o login na plataforma Sungrow
-    login_sungrow(data)
-
-    # Atualiza informações dos clientes Sungrow
-    atualiza_clientes_sungrow(data)
-
-    # Obtém a lista de clientes Sungrow
-    data['clientes'] = Cliente.objects.filter(inverter__name='sungrow')
-
-    # Atualiza a geração diária para os clientes Sungrow
-    atualiza_geracao_diaria_sungrow(data)
-
-
-@util.close_old_connections
-def abb_fimer_hourly_generation():
-    """
-    Realiza atualizações horárias na geração de energia para os inversores ABB FIMER.
-
-    Esta função é agendada para ser executada periodicamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Realiza login na plataforma ABB FIMER.
-    
-    2. Atualiza informações dos clientes ABB FIMER.
-    
-    3. Obtém a lista de clientes ABB FIMER.
-    
-    4. Atualiza a geração diária para os clientes ABB FIMER.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor ABB FIMER
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='abb_fimer'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://www.auroravision.net'
-
-    # Realiza o login na plataforma ABB FIMER
-    login_abb_fimer(data)
-
-    # Atualiza informações dos clientes ABB FIMER
-    atualiza_clientes_abb_fimer(data)
-
-    # Obtém a lista de clientes ABB FIMER
-    data['clientes'] = Cliente.objects.filter(inverter__name='abb_fimer')
-
-    # Atualiza a geração diária para os clientes ABB FIMER
-    atualiza_geracao_diaria_abb_fimer(data)
-
-
-@util.close_old_connections
-def fronius_hourly_generation():
-    """
-    Realiza atualizações horárias na geração de energia para os inversores Fronius.
-
-    Esta função é agendada para ser executada periodicamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Realiza login na plataforma Fronius.
-    
-    2. Atualiza informações dos clientes Fronius.
-    
-    3. Obtém a lista de clientes Fronius.
-    
-    4. Atualiza a geração diária para os clientes Fronius.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Fronius
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='fronius'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://www.solarweb.com'
-
-    # Realiza o login na plataforma Fronius
-    login_fronius(data)
-
-    # Atualiza informações dos clientes Fronius
-    atualiza_clientes_fronius(data)
-
-    # Obtém a lista de clientes Fronius
-    data['clientes'] = Cliente.objects.filter(inverter__name='fronius')
-
-    # Atualiza a geração diária para os clientes Fronius
-    atualiza_geracao_diaria_fronius(data)
-
-
-@util.close_old_connections
-def refusol_hourly_generation():
-    """
-    Realiza atualizações horárias na geração de energia para os inversores Refusol.
-
-    Esta função é agendada para ser executada periodicamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Realiza login na plataforma Refusol.
-    
-    2. Atualiza informações dos clientes Refusol.
-    
-    3. Obtém a lista de clientes Refusol.
-    
-    4. Atualiza a geração diária para os clientes Refusol.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Refusol
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='refusol'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://refu-log.com'
-
-    # Realiza o login na plataforma Refusol
-    login_refusol(data)
-
-    # Atualiza informações dos clientes Refusol
-    atualiza_clientes_refusol(data)
-
-    # Obtém a lista de clientes Refusol
-    data['clientes'] = Cliente.objects.filter(inverter__name='refusol')
-
-    # Atualiza a geração diária para os clientes Refusol
-    atualiza_geracao_diaria_refusol(data)
-
-
-@util.close_old_connections
-def canadian_hourly_generation():
-    """
-    Realiza atualizações horárias na geração de energia para os inversores Canadian Solar.
-
-    Esta função é agendada para ser executada periodicamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Canadian Solar.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma Canadian Solar.
-    
-    4. Atualiza informações dos clientes Canadian Solar.
-    
-    5. Obtém a lista de clientes Canadian Solar.
-    
-    6. Atualiza a geração diária para os clientes Canadian Solar.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Canadian Solar
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='canadian'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'] = credencial.usuario
-    data['password'] = credencial.senha
-    data['hashed_password'] = hash_password(credencial.senha)
-    data['api_url'] = 'https://monitoring.csisolar.com'
-    data['inversor'] = 'canadian'
-
-    # Realiza o login na plataforma Canadian Solar
-    login_canadian(data)
-
-    # Atualiza informações dos clientes Canadian Solar
-    atualiza_clientes_canadian(data)
-
-    # Obtém a lista de clientes Canadian Solar
-    data['clientes'] = Cliente.objects.filter(inverter__name='canadian')
-
-    # Atualiza a geração diária para os clientes Canadian Solar
-    atualiza_geracao_diaria_canadian(data)
-
-
-@util.close_old_connections
-def deye_hourly_generation():
-    """
-    Realiza atualizações horárias na geração de energia para os inversores Deye.
-
-    Esta função é agendada para ser executada periodicamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Deye.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma Deye.
-    
-    4. Atualiza informações dos clientes Deye.
-    
-    5. Obtém a lista de clientes Deye.
-    
-    6. Atualiza a geração diária para os clientes Deye.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Deye
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='deye'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'] = credencial.usuario
-    data['password'] = credencial.senha
-    data['hashed_password'] = hash_password(credencial.senha)
-    data['api_url'] = 'https://pro.solarmanpv.com'
-    data['inversor'] = 'deye'
-
-    # Realiza o login na plataforma Deye
-    login_deye(data)
-
-    # Atualiza informações dos clientes Deye
-    atualiza_clientes_deye(data)
-
-    # Obtém a lista de clientes Deye
-    data['clientes'] = Cliente.objects.filter(inverter__name='deye')
-
-    # Atualiza a geração diária para os clientes Deye
-    atualiza_geracao_diaria_deye(data)
-
-
-@util.close_old_connections
-def ecosolys_hourly_generation():
-    """
-    Realiza atualizações horárias na geração de energia para os inversores Ecosolys.
-
-    Esta função é agendada para ser executada periodicamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Ecosolys.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma Ecosolys.
-    
-    4. Atualiza informações dos clientes Ecosolys.
-    
-    5. Obtém a lista de clientes Ecosolys.
-    
-    6. Atualiza a geração diária para os clientes Ecosolys.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Ecosolys
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='ecosolys'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://portal.ecosolys.com.br:8843'
-    data['provider'] = 'https://portal.ecosolys.com.br:9443/auth/realms/ecoSolys/protocol/openid-connect'
-
-    # Realiza o login na plataforma Ecosolys
-    login_ecosolys(data)
-
-    # Atualiza informações dos clientes Ecosolys
-    atualiza_clientes_ecosolys(data)
-
-    # Obtém a lista de clientes Ecosolys
-    data['clientes'] = Cliente.objects.filter(inverter__name='ecosolys')
-
-    # Atualiza a geração diária para os clientes Ecosolys
-    atualiza_geracao_diaria_ecosolys(data)
-
-
-@util.close_old_connections
-def solis_hourly_generation():
-    """
-    Realiza atualizações horárias na geração de energia para os inversores Solis.
-
-    Esta função é agendada para ser executada periodicamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Solis.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma Solis.
-    
-    4. Atualiza informações dos clientes Solis.
-    
-    5. Obtém a lista de clientes Solis.
-    
-    6. Atualiza a geração diária para os clientes Solis.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Solis
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='solis'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://www.soliscloud.com:15555'
-    data['tz'] = pytz.timezone('America/Sao_Paulo')
-
-    # Realiza o login na plataforma Solis
-    login_solis(data)
-
-    # Atualiza informações dos clientes Solis
-    atualiza_clientes_solis(data)
-
-    # Obtém a lista de clientes Solis
-    data['clientes'] = Cliente.objects.filter(inverter__name='solis')
-
-    # Atualiza a geração diária para os clientes Solis
-    atualiza_geracao_diaria_solis(data)
-
-
-@util.close_old_connections
-def goodwe_hourly_generation():
-    ...
-
-
-@util.close_old_connections
-def growatt_day_generation():
-    """
-    Realiza atualizações diárias na geração de energia para os inversores Growatt.
-
-    Esta função é agendada para ser executada diariamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Growatt.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma Growatt.
-    
-    4. Atualiza informações dos clientes Growatt.
-    
-    5. Obtém a lista de clientes Growatt.
-    
-    6. Atualiza a geração diária para os clientes Growatt.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Growatt
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='growatt'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://server.growatt.com/'
-
-    # Realiza o login na plataforma Growatt
-    login_growatt(data)
-
-    # Atualiza informações dos clientes Growatt
-    atualiza_clientes_growatt(data)
-
-    # Obtém a lista de clientes Growatt
-    data['clientes'] = Cliente.objects.filter(inverter__name='growatt')
-
-    # Atualiza a geração diária para os clientes Growatt
-    atualiza_geracao_growatt(data)
-
-
-@util.close_old_connections
-def sungrow_day_generation():
-    """
-    Realiza atualizações diárias na geração de energia para os inversores Sungrow.
-
-    Esta função é agendada para ser executada diariamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Sungrow.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma Sungrow.
-    
-    4. Atualiza informações dos clientes Sungrow.
-    
-    5. Obtém a lista de clientes Sungrow.
-    
-    6. Atualiza a geração diária para os clientes Sungrow.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Sungrow
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='sungrow'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://gateway.isolarcloud.com.hk'
-
-    # Realiza o login na plataforma Sungrow
-    login_sungrow(data)
-
-    # Atualiza informações dos clientes Sungrow
-    atualiza_clientes_sungrow(data)
-
-    # Obtém a lista de clientes Sungrow
-    data['clientes'] = Cliente.objects.filter(inverter__name='sungrow')
-
-    # Atualiza a geração diária para os clientes Sungrow
-    atualiza_geracao_sungrow(data)
-
-
-@util.close_old_connections
-def abb_fimer_day_generation():
-    """
-    Realiza atualizações diárias na geração de energia para os inversores ABB FIMER.
-
-    Esta função é agendada para ser executada diariamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor ABB FIMER.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma ABB FIMER.
-    
-    4. Atualiza informações dos clientes ABB FIMER.
-    
-    5. Obtém a lista de clientes ABB FIMER.
-    
-    6. Atualiza a geração diária para os clientes ABB FIMER.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor ABB FIMER
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='abb_fimer'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://www.auroravision.net'
-
-    # Realiza o login na plataforma ABB FIMER
-    login_abb_fimer(data)
-
-    # Atualiza informações dos clientes ABB FIMER
-    atualiza_clientes_abb_fimer(data)
-
-    # Obtém a lista de clientes ABB FIMER
-    data['clientes'] = Cliente.objects.filter(inverter__name='abb_fimer')
-
-    # Atualiza a geração diária para os clientes ABB FIMER
-    atualiza_geracao_abb_fimer(data)
-
-
-@util.close_old_connections
-def fronius_day_generation():
-    """
-    Realiza atualizações diárias na geração de energia para os inversores Fronius.
-
-    Esta função é agendada para ser executada diariamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Fronius.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma Fronius.
-    
-    4. Atualiza informações dos clientes Fronius.
-    
-    5. Obtém a lista de clientes Fronius.
-    
-    6. Atualiza a geração diária para os clientes Fronius.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Fronius
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='fronius'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://www.solarweb.com'
-
-    # Realiza o login na plataforma Fronius
-    login_fronius(data)
-
-    # Atualiza informações dos clientes Fronius
-    atualiza_clientes_fronius(data)
-
-    # Obtém a lista de clientes Fronius
-    data['clientes'] = Cliente.objects.filter(inverter__name='fronius')
-
-    # Atualiza a geração diária para os clientes Fronius
-    atualiza_geracao_fronius(data)
-
-
-@util.close_old_connections
-def refusol_day_generation():
-    """
-    Realiza atualizações diárias na geração de energia para os inversores Refusol.
-
-    Esta função é agendada para ser executada diariamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Refusol.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    3. Realiza o login na plataforma Refusol.
-    
-    4. Atualiza informações dos clientes Refusol.
-    
-    5. Obtém a lista de clientes Refusol.
-    
-    6. Atualiza a geração diária para os clientes Refusol.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
-    """
-    data = {}
-
-    # Obtém as credenciais do inversor Refusol
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='refusol'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://refu-log.com'
-
-    # Realiza o login na plataforma Refusol
-    login_refusol(data)
-
-    # Atualiza informações dos clientes Refusol
-    atualiza_clientes_refusol(data)
-
-    # Obtém a lista de clientes Refusol
-    data['clientes'] = Cliente.objects.filter(inverter__name='refusol')
+from apps.clientes.jobs.particoes import (
+    cria_particoes,
+    desanexa_particoes,
+    tabela_particionada,
+)
+from apps.clientes.jobs.retencao import executa_retencao
+from apps.clientes.models import CredencialConcessionaria
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django_apscheduler import util
+from django_apscheduler.jobstores import DjangoJobStore
+from django_apscheduler.models import DjangoJobExecution
+from tenacity import retry, stop_after_attempt, wait_fixed
 
-    # Atualiza a geração diária para os clientes Refusol
-    atualiza_geracao_refusol(data)
+logger = logging.getLogger(__name__)
 
 
 @util.close_old_connections
-def canadian_day_generation():
-    """
-    Realiza atualizações diárias na geração de energia para os inversores Canadian Solar.
-
-    Esta função é agendada para ser executada diariamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Canadian Solar.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma Canadian Solar.
-    
-    4. Atualiza informações dos clientes Canadian Solar.
-    
-    5. Obtém a lista de clientes Canadian Solar.
-    
-    6. Atualiza a geração diária para os clientes Canadian Solar.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
+def geracao_horaria(inversor: str):
     """
-    data = {}
-
-    # Obtém as credenciais do inversor Canadian Solar
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='canadian'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'] = credencial.usuario
-    data['password'] = credencial.senha
-    data['hashed_password'] = hash_password(credencial.senha)
-    data['api_url'] = 'https://monitoring.csisolar.com'
-    data['inversor'] = 'canadian'
+    Realiza atualizações horárias na geração de energia de um inversor.
 
-    # Realiza o login na plataforma Canadian Solar
-    login_canadian(data)
+    Esta função é agendada para ser executada periodicamente pelo APScheduler, uma vez para cada
+    inversor registrado em `apps.clientes.jobs.inversores`. Ela realiza as seguintes operações:
 
-    # Atualiza informações dos clientes Canadian Solar
-    atualiza_clientes_canadian(data)
+    1. Realiza login na plataforma do inversor, reaproveitando a sessão em cache.
 
-    # Obtém a lista de clientes Canadian Solar
-    data['clientes'] = Cliente.objects.filter(inverter__name='canadian')
+    2. Atualiza informações dos clientes do inversor.
 
-    # Atualiza a geração diária para os clientes Canadian Solar
-    atualiza_geracao_canadian(data)
-
-
-@util.close_old_connections
-def deye_day_generation():
-    """
-    Realiza atualizações diárias na geração de energia para os inversores Deye.
-
-    Esta função é agendada para ser executada diariamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Deye.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma Deye.
-    
-    4. Atualiza informações dos clientes Deye.
-    
-    5. Obtém a lista de clientes Deye.
-    
-    6. Atualiza a geração diária para os clientes Deye.
+    3. Atualiza a geração diária para os clientes do inversor.
 
-    Nota: 
+    Nota:
         A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
         sejam fechadas antes de executar o código.
 
     Args:
-        Nenhum.
+        inversor (str): O nome do inversor, como 'growatt'.
 
     Raises:
         Nenhum.
 
     """
-    data = {}
-
-    # Obtém as credenciais do inversor Deye
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='deye'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'] = credencial.usuario
-    data['password'] = credencial.senha
-    data['hashed_password'] = hash_password(credencial.senha)
-    data['api_url'] = 'https://pro.solarmanpv.com'
-    data['inversor'] = 'deye'
-
-    # Realiza o login na plataforma Deye
-    login_deye(data)
-
-    # Atualiza informações dos clientes Deye
-    atualiza_clientes_deye(data)
-
-    # Obtém a lista de clientes Deye
-    data['clientes'] = Cliente.objects.filter(inverter__name='deye')
-
-    # Atualiza a geração diária para os clientes Deye
-    atualiza_geracao_deye(data)
+    executa_geracao_horaria(inversor)
 
 
 @util.close_old_connections
-def ecosolys_day_generation():
-    """
-    Realiza atualizações diárias na geração de energia para os inversores Ecosolys.
-
-    Esta função é agendada para ser executada diariamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Ecosolys.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma Ecosolys.
-    
-    4. Atualiza informações dos clientes Ecosolys.
-    
-    5. Obtém a lista de clientes Ecosolys.
-    
-    6. Atualiza a geração diária para os clientes Ecosolys.
-
-    Nota: 
-        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
-        sejam fechadas antes de executar o código.
-
-    Args:
-        Nenhum.
-
-    Raises:
-        Nenhum.
-
+def geracao_diaria(inversor: str):
     """
-    data = {}
-
-    # Obtém as credenciais do inversor Ecosolys
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='ecosolys'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://portal.ecosolys.com.br:8843'
-    data['provider'] = 'https://portal.ecosolys.com.br:9443/auth/realms/ecoSolys/protocol/openid-connect'
-
-    # Realiza o login na plataforma Ecosolys
-    login_ecosolys(data)
-
-    # Atualiza informações dos clientes Ecosolys
-    atualiza_clientes_ecosolys(data)
+    Realiza atualizações diárias na geração de energia de um inversor.
 
-    # Obtém a lista de clientes Ecosolys
-    data['clientes'] = Cliente.objects.filter(inverter__name='ecosolys')
+    Esta função é agendada para ser executada diariamente pelo APScheduler, uma vez para cada
+    inversor registrado em `apps.clientes.jobs.inversores`. Ela realiza as seguintes operações:
 
-    # Atualiza a geração diária para os clientes Ecosolys
-    atualiza_geracao_ecosolys(data)
+    1. Realiza login na plataforma do inversor, reaproveitando a sessão em cache.
 
+    2. Atualiza informações dos clientes do inversor.
 
-@util.close_old_connections
-def solis_day_generation():
-    """
-    Realiza atualizações diárias na geração de energia para os inversores Solis.
-
-    Esta função é agendada para ser executada diariamente pelo APScheduler. Ela interage com diferentes
-    métodos para realizar as seguintes operações:
-    
-    1. Obtém as credenciais do inversor Solis.
-    
-    2. Preenche um dicionário de dados com informações necessárias.
-    
-    3. Realiza o login na plataforma Solis.
-    
-    4. Atualiza informações dos clientes Solis.
-    
-    5. Obtém a lista de clientes Solis.
-    
-    6. Atualiza a geração diária para os clientes Solis.
+    3. Atualiza a geração completa (valores diários) para os clientes do inversor.
 
-    Nota: 
+    Nota:
         A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
         sejam fechadas antes de executar o código.
 
     Args:
-        Nenhum.
+        inversor (str): O nome do inversor, como 'growatt'.
 
     Raises:
         Nenhum.
 
     """
-    data = {}
-
-    # Obtém as credenciais do inversor Solis
-    credencial = CredencialInversor.objects.filter(
-        inversor__name='solis'
-    ).first()
-
-    # Preenche o dicionário de dados com informações necessárias
-    data['empresa_id'] = credencial.empresa_id
-    data['username'], data['password'] = credencial.usuario, credencial.senha
-    data['api_url'] = 'https://www.soliscloud.com:15555'
-    data['tz'] = pytz.timezone('America/Sao_Paulo')
-
-    # Realiza o login na plataforma Solis
-    login_solis(data)
-
-    # Atualiza informações dos clientes Solis
-    atualiza_clientes_solis(data)
-
-    # Obtém a lista de clientes Solis
-    data['clientes'] = Cliente.objects.filter(inverter__name='solis')
-
-    # Atualiza a geração diária para os clientes Solis
-    atualiza_geracao_solis(data)
+    executa_geracao_completa(inversor)
 
 
 @util.close_old_connections
@@ -1096,6 +155,61 @@ def delete_old_job_executions(max_age=604_800):
     DjangoJobExecution.objects.delete_old_job_executions(max_age)
 
 
+@util.close_old_connections
+def retencao_geracao():
+    """
+    Agrega a geração diária antiga por hora e expurga as leituras além da retenção.
+
+    As leituras de 5/15 minutos são agregadas em GeracaoHoraria (média, pico e quantidade
+    de leituras por hora). Se `settings.GERACAO_DIARIA_RETENCAO_DIAS` estiver definido, as
+    leituras mais antigas que esse horizonte são removidas da GeracaoDiaria.
+
+    Nota:
+        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
+        sejam fechadas antes de executar o código.
+    """
+    executa_retencao()
+
+
+@util.close_old_connections
+def arquivo_parquet():
+    """
+    Grava em Parquet os meses fechados da geração que ainda não foram arquivados.
+
+    Os meses já arquivados não são lidos de novo, exceto o último mês fechado, que pode
+    ter recebido leituras atrasadas.
+
+    Nota:
+        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
+        sejam fechadas antes de executar o código.
+    """
+    arquiva_pendentes()
+
+
+@util.close_old_connections
+def manutencao_particoes():
+    """
+    Cria as partições futuras da GeracaoDiaria e desanexa as mais antigas que a retenção.
+
+    Não faz nada enquanto a tabela não for particionada (ver o comando `particiona_geracao_diaria`).
+    A retenção é definida em `settings.PARTICOES_RETENCAO_MESES`; com 0, nenhuma partição
+    é desanexada.
+
+    Nota:
+        A função utiliza o decorator `@util.close_old_connections` para garantir que conexões antigas com o banco de dados
+        sejam fechadas antes de executar o código.
+    """
+    if connection.vendor != 'postgresql' or not tabela_particionada():
+        return
+
+    cria_particoes()
+    if settings.PARTICOES_RETENCAO_MESES:
+        desanexa_particoes(
+            dt.now().date().replace(day=1)
+            - relativedelta(months=settings.PARTICOES_RETENCAO_MESES)
+        )
+
+
 class Command(BaseCommand):
     """
     Comando de gerenciamento do Django para executar o APScheduler.
@@ -1103,6 +217,10 @@ class Command(BaseCommand):
     Este comando inicializa e inicia o APScheduler, adicionando trabalhos para diferentes funções.
     O scheduler é executado em segundo plano e aciona as funções especificadas em intervalos agendados.
 
+    Cada inversor registrado (`INVERSORES`) roda em um executor próprio, de modo que todos os
+    inversores começam juntos e a janela de coleta fica próxima à do inversor mais lento. Os jobs
+    de um mesmo inversor, que dividem login e limites do portal, nunca se sobrepõem.
+
     Uso:
         python manage.py runscheduler
 
@@ -1135,306 +253,112 @@ class Command(BaseCommand):
         Returns:
             None
         """
-        # Inicializa o scheduler
+        # Inicializa o scheduler com os executores de settings.SCHEDULER_CONFIG
         scheduler = BackgroundScheduler(
-            timezone=settings.TIME_ZONE, misfire_grace_time=None
+            gconfig=settings.SCHEDULER_CONFIG,
+            timezone=settings.TIME_ZONE,
+            misfire_grace_time=None,
         )
         scheduler.add_jobstore(DjangoJobStore(), 'default')
 
         # Obtenha a hora atual
         now = dt.now()
-        diferenca = 6
-
-        # Adiciona trabalhos para diferentes funções
-        scheduler.add_job(
-            growatt_hourly_generation,
-            # trigger=CronTrigger(hour=hourly_time),  # Every 1 hour
-            'interval',
-            hours=1,
-            next_run_time=now,
-            id='growatt_hourly_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'growatt_hourly_generation'.")
-
-        next_5_min = now# + timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            sungrow_hourly_generation,
-            # trigger=CronTrigger(hour=hourly_time),  # Every 1 hour
-            'interval',
-            hours=1,
-            next_run_time=next_5_min,
-            id='sungrow_hourly_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'sungrow_hourly_generation'.")
-
-        next_5_min += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            abb_fimer_hourly_generation,
-            # trigger=CronTrigger(hour=hourly_time),  # Every 1 hour
-            'interval',
-            hours=1,
-            next_run_time=next_5_min,
-            id='abb_fimer_hourly_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'abb_fimer_hourly_generation'.")
-
-        next_5_min += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            fronius_hourly_generation,
-            # trigger=CronTrigger(hour=hourly_time),  # Every 1 hour
-            'interval',
-            hours=1,
-            next_run_time=next_5_min,
-            id='fronius_hourly_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'fronius_hourly_generation'.")
-
-        next_5_min += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            refusol_hourly_generation,
-            # trigger=CronTrigger(hour=hourly_time),  # Every 1 hour
-            'interval',
-            hours=1,
-            next_run_time=next_5_min,
-            id='refusol_hourly_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'refusol_hourly_generation'.")
-
-        next_5_min += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            canadian_hourly_generation,
-            # trigger=CronTrigger(hour=hourly_time),  # Every 1 hour
-            'interval',
-            hours=1,
-            next_run_time=next_5_min,
-            id='canadian_hourly_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'canadian_hourly_generation'.")
-
-        next_5_min += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            deye_hourly_generation,
-            # trigger=CronTrigger(hour=hourly_time),  # Every 1 hour
-            'interval',
-            hours=1,
-            next_run_time=next_5_min,
-            id='deye_hourly_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'deye_hourly_generation'.")
-
-        next_5_min += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            ecosolys_hourly_generation,
-            # trigger=CronTrigger(hour=hourly_time),  # Every 1 hour
-            'interval',
-            hours=1,
-            next_run_time=next_5_min,
-            id='ecosolys_hourly_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'ecosolys_hourly_generation'.")
-
-        next_5_min += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            solis_hourly_generation,
-            # trigger=CronTrigger(hour=hourly_time),  # Every 1 hour
-            'interval',
-            hours=1,
-            next_run_time=next_5_min,
-            id='solis_hourly_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'solis_hourly_generation'.")
 
         # Calcule a próxima vez que será 2 da manhã
         next_2_am = now.replace(hour=2, minute=0, second=0)
-
         if now.hour >= 2:
             # Se já passou das 2 da manhã hoje, programe para as 2 da manhã de amanhã
             next_2_am += timedelta(days=1)
 
-        scheduler.add_job(
-            growatt_day_generation,
-            # trigger=CronTrigger(hour=daily_hour, minute=daily_minute),
-            'interval',
-            hours=24,
-            next_run_time=next_2_am,
-            id='growatt_day_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'growatt_day_generation'.")
-
-        # Adicione 5 minutos para a próxima tarefa
-        next_2_am += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            sungrow_day_generation,
-            # trigger=CronTrigger(hour=daily_hour, minute=daily_minute),
-            'interval',
-            hours=24,
-            next_run_time=next_2_am,
-            id='sungrow_day_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'sungrow_day_generation'.")
-
-        # Adicione 5 minutos para a próxima tarefa
-        next_2_am += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            abb_fimer_day_generation,
-            # trigger=CronTrigger(hour=daily_hour, minute=daily_minute),
-            'interval',
-            hours=24,
-            next_run_time=next_2_am,
-            id='abb_fimer_day_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'abb_fimer_day_generation'.")
-
-        # Adicione 5 minutos para a próxima tarefa
-        next_2_am += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            fronius_day_generation,
-            # trigger=CronTrigger(hour=daily_hour, minute=daily_minute),
-            'interval',
-            hours=24,
-            next_run_time=next_2_am,
-            id='fronius_day_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'fronius_day_generation'.")
-
-        # Adicione 5 minutos para a próxima tarefa
-        next_2_am += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            refusol_day_generation,
-            # trigger=CronTrigger(hour=daily_hour, minute=daily_minute),
-            'interval',
-            hours=24,
-            next_run_time=next_2_am,
-            id='refusol_day_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'refusol_day_generation'.")
-
-        # Adicione 5 minutos para a próxima tarefa
-        next_2_am += timedelta(minutes=diferenca)
-
-        scheduler.add_job(
-            canadian_day_generation,
-            # trigger=CronTrigger(hour=daily_hour, minute=daily_minute),
-            'interval',
-            hours=24,
-            next_run_time=next_2_am,
-            id='canadian_day_generation',  # The `id` assigned to each job MUST be unique
-            max_instances=1,
-            replace_existing=True,
-        )
-        logger.info("Added job 'canadian_day_generation'.")
+        # Adiciona uma fila e os trabalhos de cada inversor. Dentro de cada job a lista
+        # de clientes é atualizada antes da busca de geração.
+        for inversor in INVERSORES:
+            scheduler.add_executor(
+                ThreadPoolExecutor(
+                    max_workers=settings.SCHEDULER_WORKERS_INVERSOR
+                ),
+                alias=inversor,
+            )
+
+            scheduler.add_job(
+                geracao_horaria,
+                'interval',
+                args=[inversor],
+                hours=1,
+                next_run_time=now,
+                id=f'{inversor}_hourly_generation',  # The `id` assigned to each job MUST be unique
+                executor=inversor,
+                max_instances=1,
+                replace_existing=True,
+            )
+            logger.info(f"Added job '{inversor}_hourly_generation'.")
+
+            scheduler.add_job(
+                geracao_diaria,
+                'interval',
+                args=[inversor],
+                hours=24,
+                next_run_time=next_2_am,
+                id=f'{inversor}_day_generation',  # The `id` assigned to each job MUST be unique
+                executor=inversor,
+                max_instances=1,
+                replace_existing=True,
+            )
+            logger.info(f"Added job '{inversor}_day_generation'.")
+
+        # Calcule a próxima vez que serão 23 horas
+        next_23 = now.replace(hour=23, minute=0, second=0)
 
-        # Adicione 5 minutos para a próxima tarefa
-        next_2_am += timedelta(minutes=diferenca)
+        if now.hour >= 23:
+            # Se já passou das 20 hoje, programe para as 20 da amanhã
+            next_23 += timedelta(days=1)
 
         scheduler.add_job(
-            deye_day_generation,
-            # trigger=CronTrigger(hour=hour, minute=minute),  # Every 1 hour
+            busca_dados_rge,
             'interval',
             hours=24,
-            next_run_time=next_2_am,
-            id='deye_day_generation',  # The `id` assigned to each job MUST be unique
+            next_run_time=next_23,
+            id='busca_dados_rge',
             max_instances=1,
             replace_existing=True,
         )
-        logger.info("Added job 'deye_day_generation'.")
-
-        # Adicione 5 minutos para a próxima tarefa
-        next_2_am += timedelta(minutes=diferenca)
+        logger.info("Added job 'busca_dados_rge'.")
 
         scheduler.add_job(
-            ecosolys_day_generation,
-            # trigger=CronTrigger(hour=daily_hour, minute=daily_minute),
-            'interval',
-            hours=24,
-            next_run_time=next_2_am,
-            id='ecosolys_day_generation',  # The `id` assigned to each job MUST be unique
+            delete_old_job_executions,
+            trigger=CronTrigger(day_of_week='sat', hour='00', minute='30'),
+            id='delete_old_job_executions',
             max_instances=1,
             replace_existing=True,
         )
-        logger.info("Added job 'ecosolys_day_generation'.")
-
-        # Adicione 5 minutos para a próxima tarefa
-        next_2_am += timedelta(minutes=diferenca)
+        logger.info("Added weekly job: 'delete_old_job_executions'.")
 
         scheduler.add_job(
-            solis_day_generation,
-            # trigger=CronTrigger(hour=hour, minute=minute),  # Every 1 hour
-            'interval',
-            hours=24,
-            next_run_time=next_2_am,
-            id='solis_day_generation',  # The `id` assigned to each job MUST be unique
+            retencao_geracao,
+            trigger=CronTrigger(hour='03', minute='30'),
+            id='retencao_geracao',
             max_instances=1,
             replace_existing=True,
         )
-        logger.info("Added job 'solis_day_generation'.")
-
-        # Calcule a próxima vez que será 2 da manhã
-        next_23 = now.replace(hour=23, minute=0, second=0)
-
-        if now.hour >= 23:
-            # Se já passou das 20 hoje, programe para as 20 da amanhã
-            next_23 += timedelta(days=1)
+        logger.info("Added daily job: 'retencao_geracao'.")
 
         scheduler.add_job(
-            busca_dados_rge,
-            'interval',
-            hours=24,
-            next_run_time=next_23,
-            id='busca_dados_rge',
+            arquivo_parquet,
+            trigger=CronTrigger(hour='04', minute='30'),
+            id='arquivo_parquet',
             max_instances=1,
             replace_existing=True,
         )
-        logger.info("Added job 'busca_dados_rge'.")
+        logger.info("Added daily job: 'arquivo_parquet'.")
 
         scheduler.add_job(
-            delete_old_job_executions,
-            trigger=CronTrigger(day_of_week='sat', hour='00', minute='30'),
-            id='delete_old_job_executions',
+            manutencao_particoes,
+            trigger=CronTrigger(day='1', hour='01', minute='00'),
+            id='manutencao_particoes',
             max_instances=1,
             replace_existing=True,
         )
-        logger.info("Added weekly job: 'delete_old_job_executions'.")
+        logger.info("Added monthly job: 'manutencao_particoes'.")
 
         try:
             # Inicia o scheduler
@@ -69,8 +69,6 @@
 
 import os
 
-import folium
-import folium.plugins as plugins
 from apps.clientes.models import (
     Cliente,
     CredencialConcessionaria,
@@ -265,85 +263,6 @@ def retorna_clientes(user_empresa):
     return clientes, all_energy_today, all_energy_total
 
 
-def retorna_mapa(plants):
-    """
-    Cria e retorna um mapa interativo usando a biblioteca Folium.
-
-    Args:
-        plants (QuerySet): Um QuerySet contendo informações das plantas.
-
-    Returns:
-        seven (str): Uma representação HTML do mapa interativo.
-
-    Comentários:
-        - Esta função recebe informações sobre as plantas e gera um mapa interativo
-          usando a biblioteca Folium.
-        - O mapa é centrado nas coordenadas fornecidas (latitude e longitude).
-        - Marcadores coloridos são adicionados para cada planta com base na energia
-          do dia e energia total.
-        - Um botão de tela cheia é adicionado ao canto superior direito do mapa.
-        - Uma legenda é adicionada no canto inferior esquerdo do mapa, explicando as cores
-          dos marcadores.
-
-    """
-    # Coordenadas para centralizar o mapa
-    latitude = insert_latitude
-    longitude = insert_longitude
-
-    # Cria um mapa Folium
-    seven = folium.Map(location=[latitude, longitude], zoom_start=6)
-
-    # Adiciona o botão de tela cheia ao mapa
-    plugins.Fullscreen(
-        position='topright',
-        title='Expandir',
-        title_cancel='Sair',
-        force_separate_button=True,
-    ).add_to(seven)
-
-    # Itera sobre cada planta e adiciona marcadores ao mapa
-    for plant in plants:
-        # Define a cor do marcador com base na energia do dia e energia total
-        if plant.energy_today == 0 and plant.energy_total == 0:
-            color = 'red'
-        elif plant.energy_today == 0:
-            color = 'orange'
-        else:
-            color = 'green'
-
-        # Cria um ícone Folium com a cor definida
-        icon = folium.Icon(color=color)
-        # Obtém a localização da planta (latitude, longitude)
-        location = (plant.latitude, plant.longitude)
-
-        # Adiciona um marcador ao mapa com o ícone e popup contendo o nome da planta
-        folium.Marker(
-            location=location, icon=icon, popup=plant.plant_name
-        ).add_to(seven)
-
-    # Adiciona uma legenda personalizada ao mapa
-    legenda_html = """
-    <div style="position: fixed; 
-        bottom: 10px; 
-        left: 10px; 
-        width: 100px; 
-        height: 60px; 
-        border:2px solid grey; 
-        z-index:9999; 
-        font-size:10px;
-        background: rgba(169, 169, 169, 0.5);"> <!-- Adicionando fundo cinza esmaecido -->
-    &nbsp;<b>Legenda</b><br>
-    &nbsp;<i class="fa fa-map-marker fa-1x" style="color:green"></i>&nbsp;Online<br>
-    &nbsp;<i class="fa fa-map-marker fa-1x" style="color:orange"></i>&nbsp;Sem comunicação<br>
-    &nbsp;<i class="fa fa-map-marker fa-1x" style="color:red"></i>&nbsp;Nunca comunicou
-    </div>
-    """
-    seven.get_root().html.add_child(folium.Element(legenda_html))
-
-    # Retorna a representação HTML do mapa
-    return seven._repr_html_()
-
-
 def printl(*args):
     """
     Função de impressão condicional usada para depurar em ambientes de teste.
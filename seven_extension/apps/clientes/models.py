@@ -10,7 +10,7 @@ from django.contrib.auth.models import (
 from django.core.exceptions import ValidationError
 from django.db import models
 from dotenv import load_dotenv
-from fernet_fields import EncryptedCharField
+from fernet_fields import EncryptedCharField, EncryptedTextField
 
 # Carregar variáveis de ambiente do arquivo .env
 load_dotenv()
@@ -138,6 +138,10 @@ class GeracaoDiaria(models.Model):
     """
     Representa a geração diária de energia de um cliente.
 
+    No PostgreSQL, a tabela pode ser particionada por mês de `timestamp` (ver o comando
+    `particiona_geracao_diaria`). Consultas filtradas por `timestamp` leem apenas as
+    partições dos meses envolvidos.
+
     Attributes:
         cliente (Cliente): O cliente associado à geração de energia.
         timestamp (datetime): O timestamp da geração de energia.
@@ -165,6 +169,77 @@ class GeracaoDiaria(models.Model):
         return f'{self.cliente} - {self.timestamp} - {self.energystamp}'
 
 
+class GeracaoMensal(models.Model):
+    """
+    Representa o total mensal de geração de energia de um cliente.
+
+    É um consolidado da tabela Geracao, mantido a cada gravação de `commit_complete_generation`
+    e reconstruído pelo comando `backfill_geracao_mensal`.
+
+    Attributes:
+        cliente (Cliente): O cliente associado à geração de energia.
+        ano (int): O ano de referência.
+        mes (int): O mês de referência.
+        energia (float): A soma da energia gerada no mês.
+        dias_com_dado (int): A quantidade de dias do mês com geração maior que zero.
+    """
+
+    cliente = models.ForeignKey(Cliente, on_delete=models.CASCADE)
+    ano = models.PositiveSmallIntegerField()
+    mes = models.PositiveSmallIntegerField()
+    energia = models.FloatField(default=0)
+    dias_com_dado = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('cliente', 'ano', 'mes')
+        app_label = 'clientes'
+
+    def __str__(self):
+        """
+        Retorna uma representação em string da geração mensal.
+
+        Returns:
+            str: A representação em string de todos os campos do modelo.
+        """
+        return f'{self.cliente} - {self.mes:02d}/{self.ano} - {self.energia} - {self.dias_com_dado}'
+
+
+class GeracaoHoraria(models.Model):
+    """
+    Representa a geração de um cliente agregada por hora.
+
+    É a versão de baixa resolução da GeracaoDiaria, mantida pelo job `retencao_geracao`
+    do runscheduler. Permite remover as leituras de 5/15 minutos antigas sem perder
+    o histórico do gráfico diário.
+
+    Attributes:
+        cliente (Cliente): O cliente associado à geração de energia.
+        timestamp (datetime): O início da hora.
+        energia (float): A média das leituras da hora, na mesma unidade da GeracaoDiaria.
+        potencia_pico (float): A maior leitura da hora.
+        amostras (int): A quantidade de leituras agregadas.
+    """
+
+    cliente = models.ForeignKey(Cliente, on_delete=models.CASCADE)
+    timestamp = models.DateTimeField()
+    energia = models.FloatField(default=0)
+    potencia_pico = models.FloatField(default=0)
+    amostras = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('cliente', 'timestamp')
+        app_label = 'clientes'
+
+    def __str__(self):
+        """
+        Retorna uma representação em string da geração horária.
+
+        Returns:
+            str: A representação em string de todos os campos do modelo.
+        """
+        return f'{self.cliente} - {self.timestamp} - {self.energia} - {self.potencia_pico} - {self.amostras}'
+
+
 class Estado(models.Model):
     """
     Representa um estado.
@@ -255,6 +330,37 @@ class CredencialInversor(models.Model):
         )
 
 
+class SessaoCredencial(models.Model):
+    """
+    Representa a sessão autenticada em cache de uma credencial de inversor.
+
+    Permite que os jobs reaproveitem o login feito em execuções anteriores.
+
+    Attributes:
+        credencial (CredencialInversor): A credencial dona da sessão.
+        dados (EncryptedTextField): Cookies, cabeçalhos e tokens da sessão serializados em JSON, criptografados.
+        expira_em (datetime): O momento a partir do qual a sessão deixa de ser reaproveitada.
+    """
+
+    credencial = models.OneToOneField(
+        CredencialInversor, on_delete=models.CASCADE
+    )
+    dados = EncryptedTextField()
+    expira_em = models.DateTimeField()
+
+    class Meta:
+        app_label = 'clientes'
+
+    def __str__(self):
+        """
+        Retorna uma representação em string da sessão.
+
+        Returns:
+            str: A representação em string contendo a credencial e a expiração.
+        """
+        return f'{self.credencial_id} - {self.expira_em}'
+
+
 class Concessionaria(models.Model):
     """
     Representa uma concessionária.
@@ -696,6 +802,10 @@ class ClienteInfo(models.Model):
         ultima_geracao (datetime, optional): O timestamp da última geração de energia (opcional).
         ultima_geracao_diaria (datetime, optional): O timestamp da última geração diária de energia (opcional).
         proxima_leitura_concessionaria (datetime, optional): O timestamp da próxima leitura da concessionária (opcional).
+        buscas_vazias_diarias (int): Execuções seguidas do job horário sem geração nova para o cliente.
+        proxima_busca_diaria (datetime, optional): Antes deste momento o job horário não busca o cliente (opcional).
+        proxima_verificacao_lacunas (datetime, optional): Antes deste momento o job horário não busca as lacunas do cliente (opcional).
+        versao_geracao (int): Incrementada a cada gravação de geração do cliente; invalida os gráficos em cache.
 
     """
 
@@ -705,6 +815,10 @@ class ClienteInfo(models.Model):
     proxima_leitura_concessionaria = models.DateTimeField(
         null=True, blank=True
     )
+    buscas_vazias_diarias = models.PositiveIntegerField(default=0)
+    proxima_busca_diaria = models.DateTimeField(null=True, blank=True)
+    proxima_verificacao_lacunas = models.DateTimeField(null=True, blank=True)
+    versao_geracao = models.PositiveIntegerField(default=0)
 
     def __str__(self):
         """
@@ -718,3 +832,32 @@ class ClienteInfo(models.Model):
 
     class Meta:
         app_label = 'clientes'
+
+
+class VersaoCache(models.Model):
+    """
+    Versão de um dado mantido em cache por processo.
+
+    O processo que altera o dado incrementa a versão, e os demais a incluem na chave do
+    cache. Assim a invalidação vale para todos os processos (servidor web e runscheduler).
+
+    Attributes:
+        nome (str): O nome do dado em cache.
+        versao (int): Incrementada a cada alteração do dado.
+
+    """
+
+    nome = models.CharField(max_length=50, unique=True)
+    versao = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        """
+        Retorna uma representação em string da versão.
+
+        Returns:
+            str: O nome e a versão.
+        """
+        return f'{self.nome} - {self.versao}'
+
+    class Meta:
+        app_label = 'clientes'
@@ -11,8 +11,14 @@ from apps.clientes.forms import (
     CriarUsuarioCustomizadoForm,
     UsuarioCustomizadoForm,
 )
+from apps.clientes.jobs.geracao_mensal import soma_geracao_periodo
 from apps.clientes.jobs.get_concessionaria_data import busca_rge
 from apps.clientes.jobs.get_inversor_energy import is_number
+from apps.clientes.jobs.referencias import (
+    CACHE_INVERSORES,
+    EMPRESAS,
+    TIPOS_USUARIO,
+)
 from apps.clientes.methods import get_context_data, printl
 from apps.clientes.models import (
     Cliente,
@@ -20,13 +26,10 @@ from apps.clientes.models import (
     Consumo,
     CredencialConcessionaria,
     CredencialInversor,
-    Empresa,
     Injecao,
     Instalacao,
-    Inversor,
     Notificacao,
     RelacaoClienteEmpresa,
-    TipoUsuario,
 )
 from core.custom_exceptions import CPFouCNPJNaoEncontradoError, TelNaoEncontradoError
 from dateutil.relativedelta import relativedelta
@@ -93,9 +96,9 @@ def notificacao(request):
     context['segment'] = 'notificacao'
 
     # Obtém listas de empresas, clientes e inversores para preencher opções nos formulários
-    empresas = Empresa.objects.all().order_by('nome')
+    empresas = EMPRESAS.todos()
     clientes = Cliente.objects.all().order_by('plant_name')
-    inversores = Inversor.objects.all().order_by('name')
+    inversores = CACHE_INVERSORES.todos()
 
     context['empresas'] = empresas
     context['clientes'] = clientes
@@ -133,20 +136,14 @@ def notificacao(request):
             notificacao.abrangencia_notificacao = 'todos'
         elif seletor == 'integradores':
             notificacao.abrangencia_notificacao = 'empresa'
-            notificacao.tipo_usuario = TipoUsuario.objects.get(
-                nome_tipo='integrador'
-            )
+            notificacao.tipo_usuario = TIPOS_USUARIO.obtem('integrador')
         elif seletor == 'integradorX':
             notificacao.abrangencia_notificacao = 'empresa'
-            notificacao.tipo_usuario = TipoUsuario.objects.get(
-                nome_tipo='integrador'
-            )
+            notificacao.tipo_usuario = TIPOS_USUARIO.obtem('integrador')
             notificacao.empresa_id = request.POST.get('empresa')
         elif seletor == 'clienteX':
             notificacao.abrangencia_notificacao = 'clientes'
-            notificacao.tipo_usuario = TipoUsuario.objects.get(
-                nome_tipo='cliente'
-            )
+            notificacao.tipo_usuario = TIPOS_USUARIO.obtem('cliente')
             notificacao.cliente_id = request.POST.get('cliente')
         elif seletor == 'clientesIntegradorX':
             notificacao.abrangencia_notificacao = 'clientes'
@@ -254,8 +251,8 @@ def profile_user(request):
                 usuario_customizado.cliente = Cliente.objects.get(
                     id=cliente_id
                 )
-                usuario_customizado.tipo_usuario = TipoUsuario.objects.get(
-                    nome_tipo='cliente'
+                usuario_customizado.tipo_usuario = TIPOS_USUARIO.obtem(
+                    'cliente'
                 )
                 # Salve o objeto no banco de dados
                 usuario_customizado.save()
@@ -627,21 +624,13 @@ def atualizar_tab(request):
                                 # print('data leitura anterior', data_leitura_anterior, 'mes referencia', mes_referencia, 'diferenca dias', diferenca_dias, 'minimo dias necessario', minimo_dias_necessarios)
                                 # Filtra os objetos 'geracao' que correspondem ao intervalo de tempo e soma os valores
 
-                                queryset = Geracao.objects.filter(
-                                    cliente__id=cliente[-1],
-                                    timestamp__gte=data_leitura_anterior,
-                                    timestamp__lt=mes_referencia,
-                                ).exclude(
-                                    Q(energystamp=None) | Q(energystamp=0)
+                                # Meses completos vêm do consolidado GeracaoMensal
+                                soma_geracao, count = soma_geracao_periodo(
+                                    cliente[-1],
+                                    data_leitura_anterior,
+                                    mes_referencia,
                                 )
 
-                                soma_geracao = queryset.aggregate(
-                                    soma=Sum('energystamp') / 1000
-                                )['soma']
-                                count = queryset.aggregate(count=Count('id'))[
-                                    'count'
-                                ]
-
                                 # Converta mes_referencia para o formato (ano, mês)
                                 mes_referencia_formatado = (
                                     mes_referencia.year,
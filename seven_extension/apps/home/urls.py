@@ -4,6 +4,8 @@ from django.urls import path, re_path
 urlpatterns = [
     # The home page
     path('', views.index, name='home'),
+    # GeoJSON das plantas do mapa da página inicial
+    path('mapa_plantas', views.mapa_plantas, name='mapa_plantas'),
     # Matches any html file
     re_path(r'^.*\.*', views.pages, name='pages'),
 ]
@@ -1,17 +1,19 @@
 import json
 
-from apps.clientes.methods import (
-    get_context_data,
-    printl,
-    retorna_clientes,
-    retorna_mapa,
-)
+from apps.clientes.jobs.mapa_plantas import geojson_plantas, versao_mapa
+from apps.clientes.methods import get_context_data, printl, retorna_clientes
 from django import template
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.core import serializers
 from django.core.serializers import serialize
 from django.db.models.fields.related import ForeignKey
-from django.http import HttpResponse, HttpResponseRedirect
+from django.http import (
+    HttpResponse,
+    HttpResponseForbidden,
+    HttpResponseNotModified,
+    HttpResponseRedirect,
+)
 from django.shortcuts import render
 from django.template import loader
 from django.urls import reverse
@@ -90,8 +92,8 @@ def index(request):
                 context['all_energy_total'],
             ) = retorna_clientes('admin')
 
-        # Obtém dados do mapa para os clientes
-        context['mapa'] = retorna_mapa(clientes)
+        # O mapa é carregado pela página a partir da view mapa_plantas
+        context['mapa_centro'] = json.dumps(list(settings.MAPA_CENTRO))
 
         # Serializa os clientes, incluindo chaves estrangeiras
         clientes_serializados = [
@@ -117,6 +119,42 @@ def index(request):
     return HttpResponse(html_template.render(context, request))
 
 
+@login_required(login_url='/login/')
+def mapa_plantas(request):
+    """
+    View que retorna o GeoJSON das plantas exibidas no mapa da página inicial.
+
+    Args:
+        request: Objeto HttpRequest contendo os detalhes da solicitação.
+
+    Returns:
+        HttpResponse: O GeoJSON das plantas, ou 304 se o navegador já tem a versão atual.
+
+    Notas:
+        - Usuários do tipo cliente não têm acesso ao mapa.
+        - O GeoJSON é mantido em cache e invalidado quando 'commit_clientes' altera a
+          energia ou as coordenadas de alguma planta. A versão do mapa é usada como ETag.
+
+    """
+    if request.user_type == 'cliente':
+        return HttpResponseForbidden()
+
+    user_empresa = request.user_empresa or 'admin'
+    versao = versao_mapa()
+    etag = f'"{user_empresa}-{versao}"'
+
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(
+            geojson_plantas(user_empresa, versao),
+            content_type='application/geo+json',
+        )
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
 @login_required(login_url='/login/')
 def pages(request):
     """
@@ -92,10 +92,33 @@ CORS_ALLOW_METHODS = [
 SCHEDULER_CONFIG = {
     'apscheduler.executors.default': {
         'class': 'apscheduler.executors.pool:ThreadPoolExecutor',
-        'max_workers': 2,  # Ajuste este número para o número desejado de threads
-    }
+        'max_workers': int(os.getenv('SCHEDULER_MAX_WORKERS', '2')),
+    },
+    # Uma execução atrasada de um job é feita uma única vez, nunca em paralelo
+    'apscheduler.job_defaults.coalesce': True,
+    'apscheduler.job_defaults.max_instances': 1,
 }
 
+# Threads da fila de cada inversor no runscheduler. Com 1, os jobs horário e
+# diário de um mesmo inversor nunca rodam ao mesmo tempo.
+SCHEDULER_WORKERS_INVERSOR = int(os.getenv('SCHEDULER_WORKERS_INVERSOR', '1'))
+
+# Meses de GeracaoDiaria mantidos na tabela particionada. Partições mais antigas
+# são desanexadas pelo job mensal do runscheduler. Com 0, nada é desanexado.
+PARTICOES_RETENCAO_MESES = int(os.getenv('PARTICOES_RETENCAO_MESES', '0'))
+
+# Dias em que o gráfico diário lê as leituras de 5/15 minutos (GeracaoDiaria).
+# Períodos mais antigos são lidos da geração agregada por hora (GeracaoHoraria).
+GERACAO_ALTA_RESOLUCAO_DIAS = int(os.getenv('GERACAO_ALTA_RESOLUCAO_DIAS', '30'))
+
+# Dias de GeracaoDiaria mantidos após a agregação horária. Com 0, nada é removido.
+GERACAO_DIARIA_RETENCAO_DIAS = int(os.getenv('GERACAO_DIARIA_RETENCAO_DIAS', '0'))
+
+# Diretório do arquivo Parquet da geração (ver apps.clientes.jobs.arquivo_parquet)
+ARQUIVO_PARQUET_DIR = os.getenv(
+    'ARQUIVO_PARQUET_DIR', os.path.join(CORE_DIR, 'arquivo')
+)
+
 ROOT_URLCONF = 'core.urls'
 LOGIN_REDIRECT_URL = 'home'  # Route defined in home/urls.py
 LOGOUT_REDIRECT_URL = 'home'  # Route defined in home/urls.py
@@ -149,6 +172,37 @@ if os.environ.get('DB_ENGINE') and os.environ.get('DB_ENGINE') == 'postgresql':
 #         }
 #     }
 
+# Cache dos dados dos gráficos do Dash e do mapa das plantas, por processo (LRU
+# com expiração). A invalidação usa versões que ficam no banco
+# (ClienteInfo.versao_geracao e VersaoCache).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'graficos': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'graficos',
+        'TIMEOUT': int(os.getenv('CACHE_GRAFICOS_TIMEOUT', '900')),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('CACHE_GRAFICOS_MAX_ENTRIES', '200')),
+        },
+    },
+    'mapa': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'mapa',
+        'TIMEOUT': int(os.getenv('CACHE_MAPA_TIMEOUT', '3600')),
+    },
+}
+CACHE_GRAFICOS = 'graficos'
+# Cache do GeoJSON do mapa das plantas, invalidado por VersaoCache
+CACHE_MAPA = 'mapa'
+
+# Centro inicial do mapa das plantas, antes de os marcadores serem carregados
+MAPA_CENTRO = (
+    float(os.getenv('MAPA_LATITUDE', '-14.235')),
+    float(os.getenv('MAPA_LONGITUDE', '-51.925')),
+)
+
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
 
@@ -1,3 +1,4 @@
+from apps.clientes.jobs.referencias import TIPOS_USUARIO
 from django.http import HttpResponseForbidden
 from django.shortcuts import render
 
@@ -44,16 +45,13 @@ class TipoUsuarioMiddleware:
             HttpResponse: Resposta da solicitação.
         """
         if request.user.is_authenticated:
-            request.user_type = request.user.tipo_usuario.nome_tipo
-            # print(request.user.empresa.id)
-            if request.user.empresa:
-                request.user_empresa = request.user.empresa.id
-            else:
-                request.user_empresa = None
-            if request.user.cliente:
-                request.user_cliente = request.user.cliente.id
-            else:
-                request.user_cliente = None
+            # Tipo do usuário lido do cache, e empresa e cliente pelos ids,
+            # sem consultar o banco a cada requisição
+            request.user_type = TIPOS_USUARIO.por_id(
+                request.user.tipo_usuario_id
+            ).nome_tipo
+            request.user_empresa = request.user.empresa_id
+            request.user_cliente = request.user.cliente_id
             request.user_id = request.user.id
             request.username = request.user.username
         else:
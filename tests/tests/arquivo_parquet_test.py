@@ -0,0 +1,85 @@
+"""
+Arquivo de testes para a leitura do arquivo Parquet no módulo 'arquivo_parquet'.
+
+Os arquivos são gravados em um diretório temporário e qualquer consulta ao banco
+durante a leitura faz o teste falhar.
+
+Este arquivo utiliza a biblioteca Ward para a execução dos testes.
+"""
+
+import os
+import tempfile
+from datetime import date, datetime
+
+import django
+
+# Configurações iniciais do Django
+os.environ['DJANGO_SETTINGS_MODULE'] = 'core.settings'
+django.setup()
+
+from ward import each, test
+from apps.clientes.jobs.arquivo_parquet import (
+    _tabela_arrow,
+    caminho_arquivo,
+    le_geracao,
+    meses_periodo,
+)
+from django.db import connection
+from django.test.utils import override_settings
+from django.utils import timezone
+import pyarrow.parquet as pq
+
+
+def local(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+def bloqueia_banco(execute, sql, params, many, context):
+    raise AssertionError(f'Consulta ao banco durante o teste: {sql}')
+
+
+@test('Teste para verificar os meses de um período que termina no dia 1º ({fim})')
+def _(
+    fim=each(local(2024, 2, 1), local(2024, 2, 1, 3), local(2024, 3, 1)),
+    esperado=each(
+        [date(2024, 1, 1)],
+        [date(2024, 1, 1), date(2024, 2, 1)],
+        [date(2024, 1, 1), date(2024, 2, 1)],
+    ),
+):
+    assert meses_periodo(local(2024, 1, 31), fim) == esperado
+
+
+@test('Teste para verificar os meses de um período que atravessa o ano')
+def _():
+    assert meses_periodo(local(2023, 11, 15), local(2024, 1, 2)) == [
+        date(2023, 11, 1),
+        date(2023, 12, 1),
+        date(2024, 1, 1),
+    ]
+
+
+@test('Teste para verificar se um período vazio não tem meses')
+def _():
+    assert meses_periodo(local(2024, 2, 1), local(2024, 2, 1)) == []
+
+
+@test('Teste para verificar se a leitura inclui o mês do fim quando ele começa no período')
+def _():
+    with tempfile.TemporaryDirectory() as diretorio, connection.execute_wrapper(
+        bloqueia_banco
+    ):
+        with override_settings(ARQUIVO_PARQUET_DIR=diretorio):
+            for mes, leituras in (
+                (date(2024, 1, 1), [(1, local(2024, 1, 31, 12), 10.0)]),
+                (date(2024, 2, 1), [(1, local(2024, 2, 1, 1), 20.0)]),
+            ):
+                caminho = caminho_arquivo('geracao_diaria', 'growatt', mes)
+                os.makedirs(os.path.dirname(caminho))
+                pq.write_table(_tabela_arrow(leituras), caminho)
+
+            geracao = le_geracao(
+                'geracao_diaria', local(2024, 1, 31), local(2024, 2, 1, 3)
+            )
+
+    assert sorted(geracao['energia']) == [10.0, 20.0]
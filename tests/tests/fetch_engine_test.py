@@ -0,0 +1,88 @@
+"""
+Arquivo de testes para o motor de buscas concorrentes do módulo 'fetch_engine'.
+
+Este arquivo utiliza a biblioteca Ward para a execução dos testes.
+"""
+
+import os
+import threading
+
+import django
+
+# Configurações iniciais do Django
+os.environ['DJANGO_SETTINGS_MODULE'] = 'core.settings'
+django.setup()
+
+from ward import test
+from apps.clientes.jobs.fetch_engine import (
+    _intercala_tarefas,
+    executa_contextos_concorrente,
+)
+
+
+class ClienteFalso:
+    def __init__(self, pk):
+        self.pk = pk
+        self.plant_name = f'planta {pk}'
+
+
+def busca_longa(data, cliente):
+    for indice in range(2000):
+        yield (cliente.pk, indice, 1)
+
+
+@test('Teste para verificar se as buscas das credenciais são intercaladas')
+def _():
+    a = {'clientes': ['a1', 'a2', 'a3']}
+    b = {'clientes': ['b1']}
+    c = {'clientes': ['c1', 'c2']}
+    tarefas = _intercala_tarefas([a, b, c])
+    assert [cliente for _, cliente in tarefas] == ['a1', 'b1', 'c1', 'a2', 'c2', 'a3']
+    assert [data for data, _ in tarefas][:3] == [a, b, c]
+
+
+@test('Teste para verificar se a intercalação sem credenciais retorna uma lista vazia')
+def _():
+    assert _intercala_tarefas([]) == []
+
+
+@test('Teste para verificar se todos os registros buscados são gravados')
+def _():
+    gravados = []
+    executa_contextos_concorrente(
+        [{'clientes': [ClienteFalso(pk) for pk in range(5)]}],
+        'growatt',
+        busca_longa,
+        gravados.extend,
+        tamanho_lote=100,
+        intervalo=1,
+    )
+    assert len(gravados) == 5 * 2000
+
+
+@test('Teste para verificar se uma falha na gravação é propagada sem travar as buscas')
+def _():
+    def persiste(registros):
+        raise RuntimeError('falha na gravação')
+
+    resultado = {}
+
+    def executa():
+        try:
+            executa_contextos_concorrente(
+                [{'clientes': [ClienteFalso(pk) for pk in range(20)]}],
+                'growatt',
+                busca_longa,
+                persiste,
+                tamanho_lote=10,
+                intervalo=1,
+            )
+        except RuntimeError as e:
+            resultado['erro'] = e
+
+    execucao = threading.Thread(target=executa, daemon=True)
+    execucao.start()
+    execucao.join(timeout=30)
+
+    assert not execucao.is_alive()
+    assert str(resultado['erro']) == 'falha na gravação'
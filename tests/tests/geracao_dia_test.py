@@ -0,0 +1,150 @@
+"""
+Arquivo de testes para o preparo do gráfico diário no módulo 'app_geracao_clientes'.
+
+As funções vetorizadas são comparadas com a implementação anterior (laço por cliente
+com pandas), reproduzida aqui como referência.
+
+Este arquivo utiliza a biblioteca Ward para a execução dos testes.
+"""
+
+import os
+
+import django
+
+# Configurações iniciais do Django
+os.environ['DJANGO_SETTINGS_MODULE'] = 'core.settings'
+django.setup()
+
+import numpy as np
+import pandas as pd
+from ward import test
+from apps.clientes.app_geracao_clientes import monta_serie_dia, prepara_geracao_dia
+
+DIA = pd.Timestamp('2024-01-15 06:00', tz='America/Sao_Paulo')
+
+
+def leituras(cliente, valores, inicio=0):
+    horarios = pd.date_range(
+        DIA + pd.Timedelta(minutes=5 * inicio), periods=len(valores), freq='5min'
+    )
+    return pd.DataFrame(
+        {'Timestamp': horarios, 'Energystamp': valores, 'Cliente': cliente}
+    )
+
+
+# Cliente A: zeros nas pontas, um zero isolado e uma queda brusca (reinício da curva).
+# Cliente B: começa com um zero logo após a última leitura de A (fronteira entre
+# clientes) e tem horários que A não tem, e vice-versa.
+FIXTURE = pd.concat(
+    [
+        leituras('A', [0, 0, 100, 0, 300, 350, 40, 0, 80, 120]),
+        leituras('B', [0, 50, 60, 0, 70, 90], inicio=7)[
+            lambda df: df.index != 2
+        ],
+    ],
+    ignore_index=True,
+)
+
+
+def referencia_sem_intervalo(all_data):
+    """Implementação anterior do gráfico de um dia, com o laço por cliente."""
+    df = all_data.copy()
+    df['Timestamp'] = df['Timestamp'].dt.strftime('%H:%M')
+    df = df.reset_index(drop=True)
+
+    for i in range(1, len(df) - 1):
+        if (
+            df['Energystamp'].iloc[i] == 0.0
+            and df['Energystamp'].iloc[i - 1] != 0.0
+            and df['Energystamp'].iloc[i + 1] != 0.0
+        ):
+            df.loc[i, 'Energystamp'] = np.nan
+
+    unicos = pd.DataFrame(df['Timestamp'].unique(), columns=['Timestamp'])
+    reindexado = pd.DataFrame()
+    for cliente in df['Cliente'].unique():
+        dados = unicos.copy()
+        dados['Cliente'] = cliente
+        dados = pd.merge(
+            dados,
+            df[df['Cliente'] == cliente],
+            on=['Timestamp', 'Cliente'],
+            how='outer',
+        )
+        reindexado = pd.concat([reindexado, dados])
+
+    reindexado.sort_values(by=['Cliente', 'Timestamp'], inplace=True)
+    reindexado.reset_index(drop=True, inplace=True)
+    reindexado['Energystamp'] = reindexado.groupby('Cliente')[
+        'Energystamp'
+    ].transform(
+        lambda x: x.interpolate(
+            method='pchip', limit_direction='both', limit_area='inside'
+        )
+    )
+    return reindexado
+
+
+def referencia_intervalo(all_data):
+    """Implementação anterior do preenchimento das pontas de cada dia (intervalo)."""
+    df = all_data.copy().reset_index(drop=True)
+    df.loc[df['Energystamp'] == 0, 'Energystamp'] = np.nan
+    dentro = df['Energystamp'].notnull()
+    primeiro = dentro.idxmax()
+    ultimo = len(dentro) - dentro[::-1].to_numpy().argmax() - 1
+    fora = df.index.to_series().lt(primeiro) | df.index.to_series().gt(ultimo)
+    df.loc[fora & df['Energystamp'].isnull(), 'Energystamp'] = 0
+    return df
+
+
+@test('Teste para verificar se o gráfico diário vetorizado é igual à implementação anterior')
+def _():
+    esperado = referencia_sem_intervalo(FIXTURE)
+    resultado = prepara_geracao_dia(FIXTURE, intervalo=False)
+
+    assert list(resultado['Cliente']) == list(esperado['Cliente'])
+    assert list(resultado['Timestamp']) == list(esperado['Timestamp'])
+    np.testing.assert_allclose(
+        resultado['Energystamp'].to_numpy(dtype=float),
+        esperado['Energystamp'].to_numpy(dtype=float),
+        equal_nan=True,
+    )
+
+
+@test('Teste para verificar se o zero isolado é interpolado e a queda brusca é mantida')
+def _():
+    resultado = prepara_geracao_dia(FIXTURE, intervalo=False)
+    cliente_a = resultado[resultado['Cliente'] == 'A'].set_index('Timestamp')['Energystamp']
+
+    assert 100 < cliente_a['06:15'] < 300
+    assert cliente_a['06:30'] == 40
+    assert cliente_a['06:00'] == 0
+
+
+@test('Teste para verificar se as pontas de um dia em intervalo ficam com 0 como antes')
+def _():
+    cliente_a = FIXTURE[FIXTURE['Cliente'] == 'A']
+    esperado = referencia_intervalo(cliente_a)
+    resultado = prepara_geracao_dia(cliente_a, intervalo=True)
+
+    # Depois de preencher as pontas, a versão anterior seguia o mesmo caminho do dia único
+    esperado = referencia_sem_intervalo(esperado)
+    np.testing.assert_allclose(
+        resultado['Energystamp'].to_numpy(dtype=float),
+        esperado['Energystamp'].to_numpy(dtype=float),
+        equal_nan=True,
+    )
+    assert resultado['Timestamp'].iloc[0] == '15/01/24 06:00'
+
+
+@test('Teste para verificar se as leituras são distribuídas na grade do dia')
+def _():
+    grade = pd.date_range(DIA, periods=4, freq='5min')
+    registros = [
+        (grade[1].tz_convert('UTC').to_pydatetime(), 10.0),
+        (grade[3].tz_convert('UTC').to_pydatetime(), 20.0),
+        (grade[3].tz_convert('UTC').to_pydatetime(), 30.0),
+    ]
+
+    assert list(monta_serie_dia(registros, grade)) == [0, 10, 0, 30]
+    assert list(monta_serie_dia([], grade)) == [0, 0, 0, 0]
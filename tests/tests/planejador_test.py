@@ -0,0 +1,132 @@
+"""
+Arquivo de testes para o planejamento das buscas de geração no módulo 'planejador'.
+
+Os testes usam apenas as funções de cálculo do plano, sem acesso ao banco.
+
+Este arquivo utiliza a biblioteca Ward para a execução dos testes.
+"""
+
+import os
+from datetime import date, datetime
+
+import django
+
+# Configurações iniciais do Django
+os.environ['DJANGO_SETTINGS_MODULE'] = 'core.settings'
+django.setup()
+
+from ward import test
+from apps.clientes.jobs.planejador import (
+    ESPERA_BASE,
+    ESPERA_MAXIMA,
+    dias_a_buscar,
+    dias_do_plano,
+    espera_busca_diaria,
+    intervalos_faltantes,
+    meses_a_buscar,
+    meses_do_plano,
+)
+
+HOJE = date(2024, 3, 10)
+LIMITE = date(2024, 1, 1)
+
+
+def dias(inicio, fim):
+    return {date(2024, 3, dia) for dia in range(inicio, fim + 1)}
+
+
+@test('Teste para verificar se os intervalos faltantes saem do mais recente para o mais antigo')
+def _():
+    cobertos = dias(1, 2) | dias(5, 5) | dias(8, 8)
+
+    assert intervalos_faltantes(date(2024, 3, 1), date(2024, 3, 9), cobertos) == [
+        (date(2024, 3, 9), date(2024, 3, 9)),
+        (date(2024, 3, 6), date(2024, 3, 7)),
+        (date(2024, 3, 3), date(2024, 3, 4)),
+    ]
+    assert intervalos_faltantes(date(2024, 3, 1), date(2024, 3, 2), cobertos) == []
+
+
+@test('Teste para verificar se o plano diário busca do último dia com geração até hoje')
+def _():
+    cobertos = dias(1, 2) | dias(5, 7)
+
+    assert dias_a_buscar(HOJE, LIMITE, cobertos, False) == [
+        (date(2024, 3, 7), HOJE)
+    ]
+
+
+@test('Teste para verificar se o plano diário inclui as lacunas quando elas são verificadas')
+def _():
+    cobertos = dias(1, 2) | dias(5, 7)
+
+    assert dias_a_buscar(HOJE, LIMITE, cobertos, True) == [
+        (date(2024, 3, 7), HOJE),
+        (date(2024, 3, 3), date(2024, 3, 4)),
+    ]
+
+
+@test('Teste para verificar se um cliente sem geração no horizonte é buscado desde o limite')
+def _():
+    assert dias_a_buscar(HOJE, LIMITE, set(), True) == [(LIMITE, HOJE)]
+
+
+@test('Teste para verificar se os dias do plano são gerados do mais recente para o mais antigo')
+def _():
+    plano = {
+        'intervalos': [
+            (date(2024, 3, 9), date(2024, 3, 10)),
+            (date(2024, 3, 3), date(2024, 3, 3)),
+        ]
+    }
+
+    assert list(dias_do_plano(plano)) == [
+        datetime(2024, 3, 10),
+        datetime(2024, 3, 9),
+        datetime(2024, 3, 3),
+    ]
+
+
+@test('Teste para verificar se o plano completo busca os meses recentes e os incompletos')
+def _():
+    dias_por_mes = {
+        date(2023, 11, 1): 16,
+        date(2023, 12, 1): 31,
+        date(2024, 1, 1): 20,
+        date(2024, 2, 1): 29,
+        date(2024, 3, 1): 1,
+    }
+    meses = meses_a_buscar(
+        HOJE,
+        date(2022, 4, 1),
+        dias_por_mes,
+        primeiro_dia=date(2023, 11, 15),
+        ultimo_dia=date(2024, 3, 1),
+    )
+
+    # Fevereiro entra pela margem do último dia; janeiro tem dias faltando;
+    # novembro começa no dia 15 e está completo a partir dele
+    assert meses == [date(2024, 3, 1), date(2024, 2, 1), date(2024, 1, 1)]
+
+
+@test('Teste para verificar se um cliente sem geração completa é buscado em todo o horizonte')
+def _():
+    meses = meses_a_buscar(HOJE, date(2023, 12, 1), {})
+
+    assert meses == [
+        date(2024, 3, 1),
+        date(2024, 2, 1),
+        date(2024, 1, 1),
+        date(2023, 12, 1),
+    ]
+    assert list(meses_do_plano({'meses': meses[:2]})) == [
+        datetime(2024, 3, 1),
+        datetime(2024, 2, 1),
+    ]
+
+
+@test('Teste para verificar se a espera dobra a cada busca vazia até o máximo')
+def _():
+    assert espera_busca_diaria(1) == ESPERA_BASE * 2
+    assert espera_busca_diaria(2) == ESPERA_BASE * 4
+    assert espera_busca_diaria(100) == ESPERA_MAXIMA
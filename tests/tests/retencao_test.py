@@ -0,0 +1,84 @@
+"""
+Arquivo de testes para a agregação horária da geração no módulo 'retencao'.
+
+Os testes usam apenas as funções que montam os filtros e os registros da agregação,
+sem acesso ao banco.
+
+Este arquivo utiliza a biblioteca Ward para a execução dos testes.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import django
+
+# Configurações iniciais do Django
+os.environ['DJANGO_SETTINGS_MODULE'] = 'core.settings'
+django.setup()
+
+from ward import test
+from apps.clientes.jobs.retencao import (
+    ATRASO_AGREGACAO,
+    filtro_agregacao,
+    limite_expurgo,
+    monta_geracao_horaria,
+    usa_geracao_horaria,
+)
+from django.test import override_settings
+
+AGORA = datetime(2024, 3, 10, 12, tzinfo=timezone.utc)
+HORA = datetime(2024, 3, 1, 10, tzinfo=timezone.utc)
+
+
+@test('Teste para verificar se a última hora agregada é recalculada na próxima agregação')
+def _():
+    corte = AGORA - ATRASO_AGREGACAO
+
+    assert filtro_agregacao(HORA, corte) == {
+        'timestamp__lt': corte,
+        'timestamp__gte': HORA,
+    }
+
+
+@test('Teste para verificar se um cliente sem horas agregadas tem todo o histórico agregado')
+def _():
+    corte = AGORA - ATRASO_AGREGACAO
+
+    assert filtro_agregacao(None, corte) == {'timestamp__lt': corte}
+
+
+@test('Teste para verificar se as horas agregadas viram registros de GeracaoHoraria')
+def _():
+    horas = [
+        {'cliente_id': 1, 'hora': HORA, 'energia': 200, 'potencia_pico': 300, 'amostras': 2},
+        {
+            'cliente_id': 1,
+            'hora': HORA + timedelta(hours=1),
+            'energia': None,
+            'potencia_pico': None,
+            'amostras': 1,
+        },
+    ]
+
+    assert [
+        (g.cliente_id, g.timestamp, g.energia, g.potencia_pico, g.amostras)
+        for g in monta_geracao_horaria(horas)
+    ] == [
+        (1, HORA, 200, 300, 2),
+        (1, HORA + timedelta(hours=1), 0, 0, 1),
+    ]
+
+
+@test('Teste para verificar se o expurgo nunca remove leituras ainda não agregadas')
+def _():
+    assert limite_expurgo(30, AGORA) == AGORA - timedelta(days=30)
+    assert limite_expurgo(0, AGORA) == AGORA - ATRASO_AGREGACAO
+
+
+@test('Teste para verificar se o gráfico lê a geração horária fora do período de alta resolução')
+def _():
+    with override_settings(GERACAO_ALTA_RESOLUCAO_DIAS=7):
+        agora = datetime.now(timezone.utc)
+
+        assert usa_geracao_horaria(agora - timedelta(days=8))
+        assert not usa_geracao_horaria(agora - timedelta(days=1))
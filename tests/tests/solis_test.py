@@ -0,0 +1,88 @@
+"""
+Arquivo de testes para a assinatura das requisições da Solis no módulo 'get_inversor_energy'.
+
+Este arquivo utiliza a biblioteca Ward para a execução dos testes.
+"""
+
+import json
+import os
+
+import django
+
+# Configurações iniciais do Django
+os.environ['DJANGO_SETTINGS_MODULE'] = 'core.settings'
+django.setup()
+
+from ward import each, test
+from apps.clientes.jobs.get_inversor_energy import (
+    ASSINADOR_SOLIS,
+    n,
+    retrieve_auth,
+)
+
+NOW = 'Fri, 17 Nov 2023 12:00:00 GMT'
+
+# Corpo das requisições feitas à Solis, no mesmo formato usado pelas rotinas do módulo
+CORPUS = [
+    (
+        '/user/login2',
+        {
+            'userInfo': 'usuario@empresa.com.br',
+            'passWord': 'e10adc3949ba59abbe56e057f20f883e',
+            'yingZhenType': 1,
+            'localTimeZone': -3,
+            'language': '9',
+        },
+    ),
+    (
+        '/station/list',
+        {
+            'pageNo': 1,
+            'pageSize': 10,
+            'states': '0',
+            'stationType': '1',
+            'localTimeZone': -3,
+            'language': '9',
+        },
+    ),
+    (
+        '/chart/station/day/v2',
+        {
+            'id': '1298491919449735680',
+            'language': '9',
+            'localTimeZone': -3,
+            'money': 'BRL',
+            'time': '2023-11-16',
+            'timeZone': -3,
+            'version': 1,
+        },
+    ),
+    (
+        '/chart/station/month',
+        {
+            'id': '1298491919449735680',
+            'language': '9',
+            'localTimeZone': -3,
+            'money': 'BRL',
+            'month': '2023-10',
+            'timeZone': -3,
+            'version': 1,
+        },
+    ),
+    ('/station/list', {'plantName': 'Usina São João', 'obs': 'ação\r\nfim'}),
+]
+
+
+@test('Teste para verificar se o assinador da Solis gera o mesmo token que retrieve_auth para {endpoint}')
+def _(endpoint=each(*[e for e, _ in CORPUS]), corpo=each(*[c for _, c in CORPUS])):
+    e = json.dumps(corpo).replace(' ', '')
+    assert ASSINADOR_SOLIS.assina(endpoint, e, NOW) == retrieve_auth(endpoint, e, NOW)
+
+
+@test('Teste para verificar se o MD5 do assinador da Solis é igual ao da função n')
+def _(corpo=each(*[c for _, c in CORPUS])):
+    for conteudo in (
+        json.dumps(corpo).replace(' ', ''),
+        json.dumps(corpo, ensure_ascii=False),
+    ):
+        assert ASSINADOR_SOLIS.conteudo_md5(conteudo) == n(conteudo)